@@ -1,6 +1,13 @@
-from fastapi import FastAPI, HTTPException
+import time
+
+from fastapi import FastAPI, HTTPException, Response
 from api.schemas import PricingRequest, PricingResponse
-from api.service import get_pricing
+from api.service import get_measured_pricing
+from run_engine import BASIC_FILE, RAW_FILE
+from utils.dataset import QUANTITY_CONTEXT, get_dataset, get_quantity_index, is_dataset_ready
+from utils.metrics import CONTENT_TYPE, MetricsRegistry
+from utils.prediction_executor import EXECUTOR_MODE, PredictionExecutor, ExecutorBusyError
+from utils.shard_pool import ShardPool
 
 app = FastAPI(
     title="Competitor Pricing Model API",
@@ -8,26 +15,89 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# PRICING_EXECUTOR=sharded: rows partitioned across PRICING_SHARDS
+# processes, predictions coordinated from threads (as in api_main.py)
+shard_pool = ShardPool(raw_file=RAW_FILE, basic_file=BASIC_FILE) if EXECUTOR_MODE == "sharded" else None
+
+executor = PredictionExecutor(
+    mode="thread" if shard_pool is not None else EXECUTOR_MODE,
+    raw_file=RAW_FILE,
+    basic_file=BASIC_FILE
+)
+
+metrics = MetricsRegistry()
+metrics.collect("executor_pending", "Predictions running or queued", "gauge", lambda: executor.stats()["pending"])
+metrics.collect(
+    "executor_tasks_total", "Prediction executor tasks by result", "counter",
+    lambda: {key: executor.stats()[key] for key in ("completed", "rejected")}, "result"
+)
+
+
+@app.on_event("startup")
+def load_resident_dataset():
+    try:
+        get_dataset(RAW_FILE)
+    except FileNotFoundError as e:
+        print(f"❌ Dataset not loaded: {e}")
+
+    if QUANTITY_CONTEXT:
+        get_quantity_index(BASIC_FILE)
+
+    executor.start()
+    if shard_pool is not None:
+        shard_pool.start()
+
+
+@app.on_event("shutdown")
+def stop_executor():
+    executor.shutdown()
+    if shard_pool is not None:
+        shard_pool.shutdown()
+
 
 @app.get("/health")
-def health_check():
-    return {"status": "ok"}
+def health_check(response: Response):
+    if not is_dataset_ready():
+        response.status_code = 503
+        return {"status": "unavailable", "dataset_ready": False}
+
+    return {"status": "ok", "dataset_ready": True}
 
 
 @app.post(
     "/pricing/suggest",
     response_model=PricingResponse
 )
-def suggest_price(payload: PricingRequest):
-    result = get_pricing(
-        payload.product,
-        payload.quantity
-    )
+async def suggest_price(payload: PricingRequest):
+    start = time.perf_counter()
+    try:
+        result, stages = await executor.run(
+            get_measured_pricing,
+            payload.product,
+            payload.quantity,
+            shard_pool
+        )
+    except ExecutorBusyError as e:
+        metrics.predictions.inc("busy")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception:
+        metrics.predictions.inc("error")
+        raise
+
+    metrics.record(stages)
 
     if not result:
+        metrics.predictions.inc("no_match")
         raise HTTPException(
             status_code=404,
             detail="No competitors found for given product"
         )
 
+    metrics.predictions.inc("ok")
+    metrics.prediction_seconds.observe(time.perf_counter() - start, "computed")
     return result
+
+
+@app.get("/metrics")
+def prometheus_metrics():
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 
 class PricingRequest(BaseModel):
@@ -20,3 +20,4 @@ class PricingResponse(BaseModel):
     low_price: float
     high_price: float
     top_5_sellers: List[str]
+    similar_quantity_count: Optional[int] = None
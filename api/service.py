@@ -1,4 +1,5 @@
 from run_engine import run_pricing_engine
+from utils.metrics import StageTimer
 
 
 def get_pricing(product: str, quantity: int):
@@ -7,3 +8,9 @@ def get_pricing(product: str, quantity: int):
     Keeps API clean and engine reusable.
     """
     return run_pricing_engine(product, quantity)
+
+
+def get_measured_pricing(product: str, quantity: int, shard_pool=None):
+    """get_pricing + the engine's StageTimer (timed in the worker)"""
+    stages = StageTimer()
+    return run_pricing_engine(product, quantity, stages, shard_pool), stages
@@ -4,30 +4,106 @@ FastAPI service for Government Tender L1 Pricing Model
 Provides REST API endpoints for pricing predictions
 """
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, Header, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, validator
-from typing import Optional, Dict, Any
-import pandas as pd
+from typing import Optional, Dict, Any, List
+import asyncio
 import json
 import os
+import time
 from datetime import datetime
 
-from filters.competitor_filter import filter_competitors
-from processors.seller_average import generate_seller_average
-from processors.seller_inflation import enrich_company_check_with_inflation
-from processors.seller_l1_price import enrich_with_last_ranked_price
-from processors.seller_least_price import enrich_with_least_price
-from processors.seller_quantity_analysis import get_quantity_scaling_factor
-from processors.seller_final_price import enrich_with_final_price
-from processors.l1_price_band import calculate_l1_price_band
+from filters.suggest_index import MAX_SUGGEST_LIMIT, SUGGEST_LIMIT, SuggestIndex
+from processors.band_table import (
+    BAND_TABLE_FILE,
+    PREDICTION_BASIS,
+    PRODUCT_ITEMS_FILE,
+    BandTable,
+    band_summary,
+    read_product_items
+)
+from processors.l1_pipeline import run_l1_pipeline
+from processors.seller_aggregate import QUANTILE_MODE
+from processors.product_fingerprint import fingerprint_cache_info
+from utils.dataset import (
+    QUANTITY_CONTEXT,
+    dataset_changed,
+    dataset_version,
+    get_dataset,
+    get_quantity_index,
+    is_dataset_ready,
+    source_version
+)
+from utils.ingest import MAX_INGEST_ROWS, ingest
+from utils.metrics import CONTENT_TYPE, MetricsRegistry, StageTimer, timed
+from utils.prediction_executor import EXECUTOR_MODE, PredictionExecutor, ExecutorBusyError
+from utils.quantile_sketch import SKETCH_ACCURACY
+from utils.result_cache import ResultCache, prediction_cache_key
+from utils.shard_pool import ShardPool
 
 # Configuration
 RAW_FILE = "data/raw/scraper_single_bid_results_financial.csv"
 BASIC_FILE = "data/raw/scraper_single_bid_results_basic.csv"
-FILTERED_FILE = "data/processed/filtered_company.csv"
-COMPANY_CHECK_FILE = "data/processed/company_check.csv"
 
+# PRICING_EXECUTOR=sharded: rows partitioned across PRICING_SHARDS long-lived
+# processes; every prediction scans all shards in parallel
+shard_pool = ShardPool(raw_file=RAW_FILE, basic_file=BASIC_FILE) if EXECUTOR_MODE == "sharded" else None
+
+# Blocking predictions run in a worker pool, never on the event loop
+# (configure with PRICING_EXECUTOR / PRICING_POOL_SIZE / PRICING_MAX_QUEUE /
+#  PRICING_MAX_TASKS_PER_CHILD); sharded mode coordinates from threads
+executor = PredictionExecutor(
+    mode="thread" if shard_pool is not None else EXECUTOR_MODE,
+    raw_file=RAW_FILE,
+    basic_file=BASIC_FILE
+)
+
+# Max product lines per /api/v1/predict/batch request
+MAX_BATCH_ITEMS = 1000
+
+# When set, /api/v1/ingest requires this value in the X-Ingest-Token header
+INGEST_TOKEN = os.environ.get("PRICING_INGEST_TOKEN")
+
+# Repeated queries are answered from memory
+# (configure with PRICING_CACHE_SIZE / PRICING_CACHE_TTL)
+result_cache = ResultCache()
+
+# Materialized bands of canonical products (band_table_run.py), loaded at startup
+band_table = None
+
+# Prometheus metrics at /metrics: stage latencies per computed prediction
+# (timed in the worker, recorded here); counters below are read on scrape
+metrics = MetricsRegistry()
+metrics.collect(
+    "result_cache_lookups_total", "Result cache lookups by result", "counter",
+    lambda: {"hit": result_cache.stats()["hits"], "miss": result_cache.stats()["misses"]}, "result"
+)
+metrics.collect("result_cache_entries", "Cached prediction results", "gauge", lambda: result_cache.stats()["size"])
+metrics.collect(
+    "band_table_lookups_total", "Band table lookups by result", "counter",
+    lambda: {"hit": band_table.stats()["hits"], "miss": band_table.stats()["misses"]} if band_table else None,
+    "result"
+)
+metrics.collect(
+    "fingerprint_cache_lookups_total", "Fingerprint memo lookups in the API process by result", "counter",
+    lambda: {"hit": fingerprint_cache_info()["hits"], "miss": fingerprint_cache_info()["misses"]}, "result"
+)
+metrics.collect("executor_pending", "Predictions running or queued", "gauge", lambda: executor.stats()["pending"])
+metrics.collect(
+    "executor_tasks_total", "Prediction executor tasks by result", "counter",
+    lambda: {key: executor.stats()[key] for key in ("completed", "rejected")}, "result"
+)
+metrics.collect(
+    "dataset_rows", "Rows in the resident financial dataset", "gauge",
+    lambda: len(get_dataset(RAW_FILE)) if is_dataset_ready() else None
+)
+
+# Typeahead over canonical products (catalog_run.py), rebuilt
+# when the dataset or product_items.csv changes
+suggest_index = None
+suggest_index_lock = asyncio.Lock()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -64,6 +140,10 @@ class PricingRequest(BaseModel):
         description="Quantity required (used for context only, not price scaling)",
         example=5
     )
+    fuzzy: bool = Field(
+        False,
+        description="Fall back to similar item names (typos, spelling variants) for products with no exact match"
+    )
     
     @validator('product')
     def product_not_empty(cls, v):
@@ -72,6 +152,30 @@ class PricingRequest(BaseModel):
         return v.strip()
 
 
+class BatchPricingRequest(BaseModel):
+    """Request model for batch L1 pricing predictions"""
+    items: List[PricingRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="Product/quantity pairs (e.g. a whole tender catalog)"
+    )
+
+
+class IngestRequest(BaseModel):
+    """New scraper rows to append (column name → value, as in the CSVs)"""
+    financial_rows: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        max_length=MAX_INGEST_ROWS,
+        description="Rows for scraper_single_bid_results_financial.csv"
+    )
+    basic_rows: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        max_length=MAX_INGEST_ROWS,
+        description="Rows for scraper_single_bid_results_basic.csv (bid_no, quantity, ...)"
+    )
+
+
 class PricingResponse(BaseModel):
     """Response model for L1 pricing prediction"""
     product: str
@@ -83,6 +187,14 @@ class PricingResponse(BaseModel):
     basis: str = Field(default="filtered_company.csv (L1 percentile pricing)")
     competitors_analyzed: int
     top_competitors: Optional[list] = Field(None, description="Top 5 competitors with pricing details")
+    similar_quantity_count: Optional[int] = Field(
+        None,
+        description="Matched price rows from tenders within ±50% of the requested quantity (context only)"
+    )
+    fuzzy_matches: Optional[list] = Field(
+        None,
+        description="Fuzzy mode: similar item names used for products with no exact match"
+    )
     timestamp: str
     warnings: Optional[list] = None
 
@@ -92,6 +204,7 @@ class HealthResponse(BaseModel):
     status: str
     timestamp: str
     data_files_status: Dict[str, bool]
+    dataset_ready: bool
 
 
 class ErrorResponse(BaseModel):
@@ -113,85 +226,104 @@ def check_data_files():
     }
 
 
-def generate_pricing_prediction(product: str, quantity: int) -> Dict[str, Any]:
+def run_resident_pipeline(
+    product: str,
+    quantity: int,
+    token_sets=None,
+    stages: StageTimer = None
+) -> Dict[str, Any]:
     """
-    Core pricing prediction logic
-    Returns pricing recommendation as dictionary
+    Filter + L1 pipeline on this process's resident dataset
+    (token_sets, e.g. a fuzzy query, replaces the product's own)
     """
-    warnings = []
-    
-    # Validate data files exist
-    if not os.path.exists(RAW_FILE):
-        raise FileNotFoundError(f"Financial data file not found: {RAW_FILE}")
+    # Resident dataset (loaded once at startup, raises FileNotFoundError if missing);
+    # "load" is the CSV tail parsed when rows were appended since the last call
+    with timed(stages, "load"):
+        dataset = get_dataset(RAW_FILE)
+        quantity_index = get_quantity_index(BASIC_FILE) if QUANTITY_CONTEXT else None
     
     # Phase 1: Filter competitors
     try:
-        df = pd.read_csv(RAW_FILE, low_memory=False)
-        filtered_df = filter_competitors(df, product)
+        with timed(stages, "filter"):
+            if token_sets is None:
+                filtered_df = dataset.filter(product)
+            else:
+                filtered_df = dataset.filter_token_sets(token_sets)
     except Exception as e:
         raise Exception(f"Error filtering competitors: {str(e)}")
     
     if filtered_df.empty:
         raise ValueError(f"No competitors found for product: {product}")
     
-    # Save filtered data
-    try:
-        filtered_df.to_csv(FILTERED_FILE, index=False)
-    except PermissionError:
-        raise PermissionError(f"Cannot write to {FILTERED_FILE}. File is locked by another process.")
-    
-    # Phase 2: Generate L1-specific pricing
-    try:
-        generate_seller_average(FILTERED_FILE, COMPANY_CHECK_FILE)
-        enrich_company_check_with_inflation(COMPANY_CHECK_FILE)
-        enrich_with_last_ranked_price(FILTERED_FILE, COMPANY_CHECK_FILE)
-        enrich_with_least_price(FILTERED_FILE, COMPANY_CHECK_FILE)
-    except Exception as e:
-        raise Exception(f"Error in L1 pricing calculation: {str(e)}")
+    if stages is not None:
+        stages.count("rows_matched", len(filtered_df))
     
-    # Phase 3: Quantity context (NO rescaling)
+    # Phases 2-5: L1 pricing pipeline (in memory, no intermediate CSVs)
     try:
-        quantity_factor = get_quantity_scaling_factor(
+        pipeline = run_l1_pipeline(
+            filtered_df,
+            quantity,
             BASIC_FILE,
-            FILTERED_FILE,
-            quantity
+            quantity_index=quantity_index,
+            with_quantity_context=QUANTITY_CONTEXT,
+            stages=stages
         )
-        if quantity_factor != 1.0:
-            warnings.append(f"Unexpected quantity factor: {quantity_factor} (expected 1.0)")
     except Exception as e:
-        warnings.append(f"Quantity analysis failed: {str(e)}. Using neutral factor.")
-        quantity_factor = 1.0
+        raise Exception(f"Error in L1 pricing calculation: {str(e)}")
     
-    # Phase 4: Final price calculation
-    try:
-        enrich_with_final_price(COMPANY_CHECK_FILE, quantity_factor)
-    except Exception as e:
-        raise Exception(f"Error calculating final prices: {str(e)}")
+    return pipeline
+
+
+def generate_pricing_prediction(
+    product: str,
+    quantity: int,
+    fuzzy: bool = False,
+    stages: StageTimer = None
+) -> Dict[str, Any]:
+    """
+    Core pricing prediction logic
+    Returns pricing recommendation as dictionary
+
+    Request-scoped: all intermediate state (filtered rows, seller table)
+    lives in this call's DataFrames, never in shared files, so
+    predictions can run concurrently across threads and workers.
+
+    fuzzy=True: products without an exact match use similar item
+    names instead (reported in fuzzy_matches).
+
+    stages (optional) collects the wall time of every phase.
+    """
+    warnings = []
+    token_sets = fuzzy_matches = None
     
-    # Phase 5: L1 Band calculation
-    try:
-        low_price, high_price = calculate_l1_price_band(COMPANY_CHECK_FILE)
-    except Exception as e:
-        raise Exception(f"Error calculating L1 price band: {str(e)}")
+    if fuzzy:
+        with timed(stages, "fuzzy"):
+            token_sets, fuzzy_matches = get_dataset(RAW_FILE).fuzzy_token_sets(product)
+        if fuzzy_matches:
+            warnings.append(f"Fuzzy match used for {len({m['query'] for m in fuzzy_matches})} product(s)")
     
-    # No minimum price enforcement - use actual calculated values
+    if shard_pool is not None:
+        # Phases 1-5 scattered to the shards, partial aggregates merged
+        # (raises ValueError when no shard matches)
+        pipeline = shard_pool.run_pipeline(
+            product,
+            quantity,
+            with_quantity_context=QUANTITY_CONTEXT,
+            token_sets=token_sets,
+            stages=stages
+        )
+    else:
+        pipeline = run_resident_pipeline(product, quantity, token_sets, stages)
     
-    # Calculate confidence
-    df_check = pd.read_csv(COMPANY_CHECK_FILE)
-    data_points = len(df_check)
-    confidence = min(95, 50 + (data_points * 5))
+    warnings.extend(pipeline["warnings"])
+    low_price = pipeline["low_price"]
+    high_price = pipeline["high_price"]
     
-    # Get top 5 competitors
-    top_competitors = []
-    df_sorted = df_check.sort_values('recommended_price').head(5)
-    for _, row in df_sorted.iterrows():
-        top_competitors.append({
-            "seller_name": row['Seller Name'],
-            "average_bidding_price": round(float(row['average']), 2),
-            "inflation_rate_percent": round(float(row['inflation_rate_percent']), 2),
-            "last_l1_price": round(float(row['last_ranked_price']), 2),
-            "least_quoted_price": round(float(row['least_price']), 2)
-        })
+    # No minimum price enforcement - use actual calculated values
+    
+    # Confidence + top 5 competitors
+    with timed(stages, "summary"):
+        summary = band_summary(pipeline["company_df"])
     
     # Build response
     result = {
@@ -200,10 +332,12 @@ def generate_pricing_prediction(product: str, quantity: int) -> Dict[str, Any]:
         "low_price": round(low_price, 2),
         "high_price": round(high_price, 2),
         "price_type": "TOTAL_CONTRACT",
-        "confidence": f"{confidence}%",
-        "basis": "filtered_company.csv (L1 percentile pricing)",
-        "competitors_analyzed": data_points,
-        "top_competitors": top_competitors,
+        "confidence": summary["confidence"],
+        "basis": PREDICTION_BASIS,
+        "competitors_analyzed": summary["competitors_analyzed"],
+        "top_competitors": summary["top_competitors"],
+        "similar_quantity_count": pipeline["similar_quantity_count"],
+        "fuzzy_matches": fuzzy_matches,
         "timestamp": datetime.now().isoformat(),
         "warnings": warnings if warnings else None
     }
@@ -211,6 +345,178 @@ def generate_pricing_prediction(product: str, quantity: int) -> Dict[str, Any]:
     return result
 
 
+def measured_pricing_prediction(product: str, quantity: int, fuzzy: bool = False) -> tuple:
+    """Worker entry point: (generate_pricing_prediction result, its StageTimer)"""
+    stages = StageTimer()
+    return generate_pricing_prediction(product, quantity, fuzzy, stages), stages
+
+
+async def cached_pricing_prediction(product: str, quantity: int, fuzzy: bool = False) -> Dict[str, Any]:
+    """lookup_pricing_prediction + its metrics (latency by source, outcome)"""
+    start = time.perf_counter()
+    try:
+        result, source = await lookup_pricing_prediction(product, quantity, fuzzy)
+    except ExecutorBusyError:
+        metrics.predictions.inc("busy")
+        raise
+    except ValueError:
+        metrics.predictions.inc("no_match")
+        raise
+    except Exception:
+        metrics.predictions.inc("error")
+        raise
+
+    metrics.predictions.inc("ok")
+    metrics.prediction_seconds.observe(time.perf_counter() - start, source)
+    return result
+
+
+async def current_dataset_version():
+    """
+    dataset_version() without blocking the event loop: appended rows
+    (or a full reload) are read in a worker thread; the unchanged
+    case is a single stat call
+    """
+    if dataset_changed():
+        return await asyncio.to_thread(dataset_version)
+    return dataset_version(refresh=False)
+
+
+async def lookup_pricing_prediction(product: str, quantity: int, fuzzy: bool = False) -> tuple:
+    """
+    generate_pricing_prediction behind the band table and the result cache.
+
+    - Exact canonical product names are served from the band table
+      while it matches the current data files (exact mode only)
+    - Otherwise keyed on the normalized query + (dataset version, basic
+      CSV version when quantity context is on); hits
+      are re-stamped with the caller's product text and the current time
+
+    RETURNS: (result, source) with source band_table | cache | computed
+    """
+    version = await current_dataset_version()
+    basic_version = source_version(BASIC_FILE)
+
+    if band_table is not None and version is not None and not fuzzy:
+        result = band_table.lookup(
+            product,
+            quantity,
+            version,
+            basic_version,
+            with_quantity_context=QUANTITY_CONTEXT
+        )
+        if result is not None:
+            return result, "band_table"
+
+    cache_key = prediction_cache_key(product, quantity, fuzzy)
+
+    # Quantity context counts come from the basic CSV → its version too
+    cache_version = (version, basic_version if QUANTITY_CONTEXT else None)
+
+    if version is not None:
+        cached = result_cache.get(cache_key, cache_version)
+        if cached is not None:
+            cached["product"] = product
+            cached["timestamp"] = datetime.now().isoformat()
+            return cached, "cache"
+
+    result, stages = await executor.run(measured_pricing_prediction, product, quantity, fuzzy)
+    metrics.record(stages)
+
+    if version is not None:
+        result_cache.put(cache_key, cache_version, result)
+
+    return result, "computed"
+
+
+def prediction_error(e: Exception) -> Dict[str, Any]:
+    """Inline error entry for a failed batch item (same labels as /api/v1/predict)"""
+    if isinstance(e, ExecutorBusyError):
+        code, error = status.HTTP_503_SERVICE_UNAVAILABLE, "Server Busy"
+    elif isinstance(e, ValueError):
+        code, error = status.HTTP_404_NOT_FOUND, "No Data Found"
+    elif isinstance(e, FileNotFoundError):
+        code, error = status.HTTP_503_SERVICE_UNAVAILABLE, "Data File Missing"
+    else:
+        code, error = status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal Server Error"
+
+    return {"status_code": code, "error": error, "message": str(e)}
+
+
+async def stream_batch_predictions(items: List[PricingRequest]):
+    """
+    Yields one NDJSON line per item, in completion order.
+
+    - At most executor.workers predictions in flight (a catalog never
+      floods the prediction queue)
+    - Items with the same normalized query are computed once
+    - Failures are reported inline, the batch continues
+    """
+    limit = asyncio.Semaphore(executor.workers)
+    shared = {}     # cache key -> task computing that prediction
+
+    async def predict_once(product, quantity, fuzzy):
+        async with limit:
+            return await cached_pricing_prediction(product, quantity, fuzzy)
+
+    async def predict_item(index, item):
+        key = prediction_cache_key(item.product, item.quantity, item.fuzzy)
+        if key not in shared:
+            shared[key] = asyncio.ensure_future(predict_once(item.product, item.quantity, item.fuzzy))
+
+        try:
+            result = await shared[key]
+        except Exception as e:
+            return {"index": index, "product": item.product, "status": "error", **prediction_error(e)}
+
+        result = {**result, "product": item.product}
+        return {"index": index, "product": item.product, "status": "ok", "result": result}
+
+    tasks = [asyncio.ensure_future(predict_item(i, item)) for i, item in enumerate(items)]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield json.dumps(await next_done) + "\n"
+    finally:
+        # Client went away → stop scheduling the rest
+        for task in [*tasks, *shared.values()]:
+            task.cancel()
+
+
+def build_suggest_index(version, previous: SuggestIndex = None) -> SuggestIndex:
+    """
+    Canonical products ranked by the distinct bids they match in the dataset.
+    With the same product list, rows appended since `previous` are
+    counted into it (no full rebuild).
+    """
+    start = time.perf_counter()
+    dataset = get_dataset(RAW_FILE)
+
+    if previous is not None and previous.version[1] == version[1]:
+        index = previous.updated(dataset, version)
+        if index is not None:
+            print(f"🔤 Suggest index updated | {len(index):,} products in {time.perf_counter() - start:.2f}s")
+            return index
+
+    index = SuggestIndex.from_dataset(dataset, read_product_items(PRODUCT_ITEMS_FILE), version)
+    print(f"🔤 Suggest index built | {len(index):,} products in {time.perf_counter() - start:.2f}s")
+    return index
+
+
+async def current_suggest_index() -> SuggestIndex:
+    """Suggest index of the current data (rebuilt off the event loop when stale)"""
+    global suggest_index
+
+    version = (await current_dataset_version(), source_version(PRODUCT_ITEMS_FILE))
+    if suggest_index is not None and suggest_index.version == version:
+        return suggest_index
+
+    async with suggest_index_lock:
+        if suggest_index is None or suggest_index.version != version:
+            suggest_index = await asyncio.to_thread(build_suggest_index, version, suggest_index)
+        return suggest_index
+
+
 # ===========================
 # API Endpoints
 # ===========================
@@ -225,6 +531,10 @@ async def root():
         "endpoints": {
             "health": "/health",
             "predict": "/api/v1/predict (POST)",
+            "predict_batch": "/api/v1/predict/batch (POST, NDJSON stream)",
+            "ingest": "/api/v1/ingest (POST)",
+            "suggest": "/api/v1/products/suggest?q= (GET)",
+            "metrics": "/metrics (Prometheus)",
             "docs": "/docs",
             "redoc": "/redoc"
         }
@@ -232,17 +542,28 @@ async def root():
 
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
+async def health_check(response: Response):
     """
     Health check endpoint
-    Verifies API status and data file availability
+    Verifies API status, data file availability and dataset readiness.
+    Returns 503 until the resident dataset is loaded.
     """
     data_status = check_data_files()
+    dataset_ready = is_dataset_ready()
+    
+    if not dataset_ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        health = "unavailable"
+    elif all(data_status.values()):
+        health = "healthy"
+    else:
+        health = "degraded"
     
     return {
-        "status": "healthy" if all(data_status.values()) else "degraded",
+        "status": health,
         "timestamp": datetime.now().isoformat(),
-        "data_files_status": data_status
+        "data_files_status": data_status,
+        "dataset_ready": dataset_ready
     }
 
 
@@ -276,8 +597,18 @@ async def predict_pricing(request: PricingRequest):
     **Returns:** L1 price band with confidence score and metadata
     """
     try:
-        result = generate_pricing_prediction(request.product, request.quantity)
-        return result
+        return await cached_pricing_prediction(request.product, request.quantity, request.fuzzy)
+    
+    except ExecutorBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "Server Busy",
+                "message": str(e),
+                "timestamp": datetime.now().isoformat()
+            },
+            headers={"Retry-After": "1"}
+        )
     
     except ValueError as e:
         raise HTTPException(
@@ -321,12 +652,109 @@ async def predict_pricing(request: PricingRequest):
         )
 
 
+@app.post(
+    "/api/v1/predict/batch",
+    tags=["Pricing"],
+    summary="Batch L1 Pricing Predictions (NDJSON stream)",
+    description="""
+    Price a whole catalog in one request.
+
+    Streams one JSON object per line as each item completes
+    (completion order, use `index` to match the request):
+
+    ```
+    {"index": 0, "product": "...", "status": "ok", "result": {...}}
+    {"index": 1, "product": "...", "status": "error", "status_code": 404, "error": "No Data Found", "message": "..."}
+    ```
+    """
+)
+async def predict_pricing_batch(request: BatchPricingRequest):
+    """Stream L1 pricing predictions for many product lines"""
+    return StreamingResponse(
+        stream_batch_predictions(request.items),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.post("/api/v1/ingest", tags=["Data"], summary="Append New Scraper Rows")
+async def ingest_rows(request: IngestRequest, x_ingest_token: Optional[str] = Header(None)):
+    """
+    Append new financial/basic rows without a restart.
+
+    - Rows already present are skipped (content dedup)
+    - Token index, seller/token aggregates and quantity index are
+      updated with the new rows only; the dataset version changes (result cache resets)
+    - Prediction workers pick the rows up from the CSV tail on their next request
+    """
+    if INGEST_TOKEN and x_ingest_token != INGEST_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid ingest token")
+
+    if not request.financial_rows and not request.basic_rows:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No rows to ingest")
+
+    if not is_dataset_ready():
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Dataset not loaded")
+
+    try:
+        result = await asyncio.to_thread(
+            ingest,
+            request.financial_rows,
+            request.basic_rows,
+            RAW_FILE,
+            BASIC_FILE
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    return {**result, "timestamp": datetime.now().isoformat()}
+
+
+@app.get("/api/v1/products/suggest", tags=["Products"], summary="Product Typeahead")
+async def suggest_products(
+    q: str = Query(..., min_length=1, max_length=200, description="Typed text (prefix of any word)"),
+    limit: int = Query(SUGGEST_LIMIT, ge=1, le=MAX_SUGGEST_LIMIT)
+):
+    """
+    Canonical product names for a partially typed query.
+
+    - Every typed word must prefix some word of the product
+      ("lig cl" → "LIGATION CLIP"), in any order
+    - Ranked by bid volume (distinct bids among the rows the product matches)
+    - Ingested rows are counted in incrementally; a new product_items.csv
+      rebuilds the index
+    """
+    if not is_dataset_ready():
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Dataset not loaded")
+
+    if not os.path.exists(PRODUCT_ITEMS_FILE):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Product list not found: {PRODUCT_ITEMS_FILE} (run catalog_run.py)"
+        )
+
+    index = await current_suggest_index()
+
+    start = time.perf_counter()
+    suggestions = index.suggest(q, limit)
+    took_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "query": q,
+        "suggestions": suggestions,
+        "took_ms": round(took_ms, 3),
+        "products_indexed": len(index)
+    }
+
+
 @app.get("/api/v1/status", tags=["Status"])
 async def get_system_status():
     """
     Get detailed system status including configuration
     """
     data_files = check_data_files()
+    dataset = get_dataset(RAW_FILE).summary() if is_dataset_ready() else None
     
     return {
         "service": "L1 Pricing Model",
@@ -334,7 +762,20 @@ async def get_system_status():
         "status": "operational",
         "configuration": {
             "learning_method": "L1-specific (bottom 5-10 percentile)",
-            "quantity_scaling": "disabled (neutral factor = 1.0)"
+            "quantity_scaling": "disabled (neutral factor = 1.0)",
+            "quantity_context": "enabled (±50% band)" if QUANTITY_CONTEXT else "skipped",
+            "seller_quantiles": (
+                f"sketch (±{SKETCH_ACCURACY:.0%})" if QUANTILE_MODE == "sketch" else "exact"
+            )
+        },
+        "executor": executor.stats(),
+        "shards": shard_pool.stats() if shard_pool is not None else None,
+        "fingerprint_cache": fingerprint_cache_info(),
+        "result_cache": result_cache.stats(),
+        "band_table": band_table.stats() if band_table is not None else {"loaded": False},
+        "suggest_index": {
+            "products": len(suggest_index) if suggest_index is not None else 0,
+            "built": suggest_index is not None
         },
         "data_files": {
             "raw_financial": {
@@ -346,10 +787,24 @@ async def get_system_status():
                 "exists": data_files["raw_basic"]
             }
         },
+        "dataset": {
+            "ready": dataset is not None,
+            **(dataset or {})
+        },
         "timestamp": datetime.now().isoformat()
     }
 
 
+@app.get("/metrics", tags=["Status"], summary="Prometheus Metrics")
+async def prometheus_metrics():
+    """
+    Prometheus text format: per-stage latency histograms, prediction
+    latency by source, predictions by outcome, rows matched / sellers
+    aggregated of the last computed prediction, cache and executor counters
+    """
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+
 # ===========================
 # Application Startup/Shutdown
 # ===========================
@@ -371,6 +826,34 @@ async def startup_event():
         status_icon = "✅" if exists else "❌"
         print(f"   {status_icon} {filename}: {'Found' if exists else 'Missing'}")
     
+    # Load resident dataset (shared read-only by all requests)
+    print(f"\n📂 Loading dataset...")
+    try:
+        get_dataset(RAW_FILE)
+    except Exception as e:
+        print(f"   ❌ Dataset not loaded: {e}")
+    
+    if QUANTITY_CONTEXT and get_quantity_index(BASIC_FILE) is None:
+        print(f"   ⚠️ Quantity index not loaded (basic file missing)")
+    
+    # Materialized band table (optional)
+    global band_table
+    band_table = BandTable.load(BAND_TABLE_FILE)
+    if band_table is not None:
+        print(f"   ✅ Band table: {len(band_table):,} products (built {band_table.built_at})")
+
+    # Typeahead index (optional, needs product_items.csv)
+    if is_dataset_ready() and os.path.exists(PRODUCT_ITEMS_FILE):
+        await current_suggest_index()
+
+    # Start prediction workers (forked workers inherit the loaded dataset)
+    executor.start()
+    print(f"⚙️  Prediction executor: {executor.mode} x {executor.workers}")
+    
+    if shard_pool is not None:
+        rows = await asyncio.to_thread(shard_pool.start)
+        print(f"🧩 Shards: {shard_pool.shards} x ~{max(rows):,} rows")
+    
     print("\n📚 API Documentation:")
     print("   • Swagger UI: http://localhost:8000/docs")
     print("   • ReDoc: http://localhost:8000/redoc")
@@ -382,6 +865,9 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Execute on application shutdown"""
+    executor.shutdown()
+    if shard_pool is not None:
+        shard_pool.shutdown()
     print("\n" + "=" * 70)
     print("🛑 L1 PRICING MODEL API - SHUTTING DOWN")
     print("=" * 70 + "\n")
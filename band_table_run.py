@@ -0,0 +1,34 @@
+# band_table_run.py
+
+import sys
+
+from processors.band_table import BAND_TABLE_FILE, PRODUCT_ITEMS_FILE, build_band_table
+from utils.prediction_executor import POOL_SIZE
+
+
+def _option(args, name, default):
+    if name in args:
+        return args[args.index(name) + 1]
+    return default
+
+
+def main():
+    """
+    Prices every canonical product (product_items.csv) and stores the
+    L1 bands the API serves for exact canonical matches.
+    Usage: python band_table_run.py [--workers N] [--items product_items.csv] [--output table.json]
+    """
+    args = sys.argv[1:]
+
+    print("\n📋 L1 BAND TABLE\n")
+
+    build_band_table(
+        product_items_csv=_option(args, "--items", PRODUCT_ITEMS_FILE),
+        output_file=_option(args, "--output", BAND_TABLE_FILE),
+        workers=int(_option(args, "--workers", POOL_SIZE))
+    )
+    print("   Restart the API (or start it) to serve the new table")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# bench_run.py
+
+import sys
+
+from benchmarks.runner import (
+    BASELINE_FILE,
+    BENCH_SIZES,
+    REGRESSION_THRESHOLD,
+    RESULTS_FILE,
+    compare_results,
+    load_results,
+    parse_sizes,
+    run_suite,
+    save_results
+)
+
+USAGE = """Usage:
+  python bench_run.py [--sizes 10k,100k,1m] [--cases a,b] [--save-baseline]
+  python bench_run.py compare [results.json] [--baseline baseline.json] [--threshold 0.25]"""
+
+
+def _option(args, name, default):
+    if name in args:
+        return args[args.index(name) + 1]
+    return default
+
+
+def run(args):
+    """Runs the suite → benchmarks/latest.json (and the baseline with --save-baseline)"""
+    sizes = parse_sizes(_option(args, "--sizes", BENCH_SIZES))
+    cases = _option(args, "--cases", None)
+
+    print(f"\n⏱️  PRICING BENCHMARKS | sizes {', '.join(f'{s:,}' for s in sizes)}")
+
+    try:
+        results = run_suite(sizes, cases.split(",") if cases else None)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    save_results(results, RESULTS_FILE)
+    print(f"\n💾 Results → {RESULTS_FILE}")
+
+    if "--save-baseline" in args:
+        save_results(results, BASELINE_FILE)
+        print(f"📌 Baseline saved → {BASELINE_FILE}")
+
+
+def compare(args):
+    """Compares results with the baseline; exit code 1 on regressions"""
+    positional = [a for i, a in enumerate(args) if not a.startswith("--") and (i == 0 or not args[i - 1].startswith("--"))]
+    results_file = positional[0] if positional else RESULTS_FILE
+    baseline_file = _option(args, "--baseline", BASELINE_FILE)
+    threshold = float(_option(args, "--threshold", REGRESSION_THRESHOLD))
+
+    try:
+        current = load_results(results_file)
+        baseline = load_results(baseline_file)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if current["environment"] != baseline["environment"]:
+        print("⚠️ Baseline was recorded on a different environment — timings may not compare")
+
+    rows = compare_results(current, baseline, threshold)
+    print(f"\n📊 {results_file} vs {baseline_file} (threshold +{threshold:.0%})\n")
+    for row in rows:
+        flag = "❌" if row["regression"] else "  "
+        unit = "ms" if row["metric"] == "min_ms" else "MB"
+        print(
+            f"{flag} {row['case']:<20} {row['rows']:>9,} rows  {row['metric']:<8}"
+            f" {row['baseline']:>11,.2f} → {row['current']:>11,.2f} {unit}  ({row['change']:+.1%})"
+        )
+
+    regressions = [row for row in rows if row["regression"]]
+    if not rows:
+        print("⚠️ No common cases/sizes to compare")
+    elif regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond +{threshold:.0%}")
+        sys.exit(1)
+    else:
+        print(f"\n✅ No regressions beyond +{threshold:.0%}")
+
+
+def main():
+    args = sys.argv[1:]
+
+    if "-h" in args or "--help" in args:
+        print(USAGE)
+    elif args and args[0] == "compare":
+        compare(args[1:])
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# benchmarks/cases.py
+
+import contextlib
+import io
+import os
+import tempfile
+
+from benchmarks.synthetic import BENCHMARK_PRODUCT, synthetic_financial
+from filters.competitor_filter import filter_competitors
+from filters.token_index import TokenIndex
+from processors.l1_price_band import calculate_l1_price_band
+from processors.product_fingerprint import clear_fingerprint_cache, fingerprint
+from processors.seller_aggregate import aggregate_sellers
+from processors.seller_average import compute_seller_average
+from processors.seller_final_price import add_final_price
+from processors.seller_inflation import add_inflation_rate
+from processors.seller_l1_price import add_last_ranked_price
+from processors.seller_least_price import add_least_price
+from run_engine import run_pricing_engine
+from utils.dataset import FinancialDataset, set_dataset
+from utils.financial_cache import prepare_financial_frame
+from utils.price_cleaner import clean_price_series
+
+
+class BenchmarkData:
+    """
+    Inputs of one dataset size, built once and shared by every case:
+    raw rows, prepared rows + token index, matched rows, company table
+    """
+
+    def __init__(self, rows: int, seed: int = 0):
+        self.rows = rows
+        self.raw = synthetic_financial(rows, seed)
+        self.prepared = prepare_financial_frame(self.raw.copy())
+        self.index = TokenIndex.from_dataframe(self.prepared)
+        self.filtered = filter_competitors(self.prepared, BENCHMARK_PRODUCT, self.index)
+        self.company_df = aggregate_sellers(self.filtered)
+
+        self.item_names = [
+            item.strip()
+            for value in self.raw["Offered Item"].tolist()
+            for item in value.replace("Item Categories :", "").split(",")
+        ]
+
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.company_check_csv = os.path.join(self._temp_dir.name, "company_check.csv")
+        self.company_df.to_csv(self.company_check_csv, index=False)
+
+        self.dataset = None
+
+    def close(self):
+        self._temp_dir.cleanup()
+        if self.dataset is not None:
+            set_dataset(None)
+
+
+# ===========================
+# Cases: data → zero-argument callable
+# ===========================
+
+def fingerprint_case(data: BenchmarkData):
+    """fingerprint() of every item occurrence, starting from a cold cache"""
+    def run():
+        clear_fingerprint_cache()
+        for name in data.item_names:
+            fingerprint(name)
+    return run
+
+
+def clean_price_case(data: BenchmarkData):
+    """Whole "Total Price" column (clean_price semantics, column-level)"""
+    return lambda: clean_price_series(data.raw["Total Price"])
+
+
+def token_index_case(data: BenchmarkData):
+    """Inverted index build (fingerprints precomputed, as at load)"""
+    return lambda: TokenIndex.from_dataframe(data.prepared)
+
+
+def filter_competitors_case(data: BenchmarkData):
+    """Matched rows for the benchmark product (resident index)"""
+    return lambda: filter_competitors(data.prepared, BENCHMARK_PRODUCT, data.index)
+
+
+def seller_aggregate_case(data: BenchmarkData):
+    """Fused seller statistics (what the API runs)"""
+    return lambda: aggregate_sellers(data.filtered)
+
+
+def seller_processors_case(data: BenchmarkData):
+    """The individual seller processors, chained (company_check.csv steps)"""
+    def run():
+        company_df = compute_seller_average(data.filtered)
+        company_df = add_inflation_rate(company_df)
+        company_df = add_last_ranked_price(data.filtered, company_df)
+        company_df = add_least_price(data.filtered, company_df)
+        return add_final_price(company_df, 1.0)
+    return run
+
+
+def l1_price_band_case(data: BenchmarkData):
+    """calculate_l1_price_band on company_check.csv"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return calculate_l1_price_band(data.company_check_csv)
+    return run
+
+
+def run_pricing_engine_case(data: BenchmarkData):
+    """End to end on the resident dataset: filter → seller stats → band"""
+    if data.dataset is None:
+        data.dataset = FinancialDataset(data.prepared.copy())
+    set_dataset(data.dataset)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return run_pricing_engine(BENCHMARK_PRODUCT, 10)
+    return run
+
+
+CASES = {
+    "fingerprint": fingerprint_case,
+    "clean_price": clean_price_case,
+    "token_index": token_index_case,
+    "filter_competitors": filter_competitors_case,
+    "seller_aggregate": seller_aggregate_case,
+    "seller_processors": seller_processors_case,
+    "l1_price_band": l1_price_band_case,
+    "run_pricing_engine": run_pricing_engine_case
+}
@@ -0,0 +1,477 @@
+# benchmarks/load_test.py
+
+import asyncio
+import contextlib
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlencode
+
+import numpy as np
+import pandas as pd
+import requests
+
+from benchmarks.runner import environment
+
+# App under test → "module:attribute"
+APPS = {
+    "api_main": "api_main:app",
+    "api": "api.main:app"
+}
+
+# Endpoints per app: name → (method, path, how a request is built from a product)
+ENDPOINTS = {
+    "api_main": {
+        "predict": ("POST", "/api/v1/predict", "body"),
+        "predict_fuzzy": ("POST", "/api/v1/predict", "fuzzy_body"),
+        "suggest": ("GET", "/api/v1/products/suggest", "prefix"),
+        "health": ("GET", "/health", None),
+        "status": ("GET", "/api/v1/status", None)
+    },
+    "api": {
+        "predict": ("POST", "/pricing/suggest", "body"),
+        "health": ("GET", "/health", None)
+    }
+}
+
+DEFAULT_MIX = {
+    "api_main": "predict=8,suggest=2,health=1",
+    "api": "predict=9,health=1"
+}
+
+# Used when no product list is given and product_items.csv is missing
+DEFAULT_PRODUCTS = [
+    "HIV ELISA Test Kits",
+    "Ligation Clips",
+    "3 Part Automated Hematology Analyzer",
+    "Fully Automatic Biochemistry Analyzer",
+    "Dengue ELISA Test Kit"
+]
+
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+# ===========================
+# Request mix
+# ===========================
+
+def parse_mix(text: str, app_name: str) -> dict:
+    """ "predict=8,health=1" → {"predict": 8.0, "health": 1.0} """
+    mix = {}
+    for part in str(text).split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS[app_name]:
+            raise ValueError(f"Unknown endpoint '{name}' for {app_name} (available: {list(ENDPOINTS[app_name])})")
+        mix[name] = float(weight or 1)
+
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError(f"Empty request mix: {text}")
+    return mix
+
+
+def read_products(path: str = None) -> tuple:
+    """
+    Product list (+ weights) from a CSV: product_item or product column,
+    optional weight column. RETURNS: (products, weights or None)
+    """
+    if path is None:
+        from processors.band_table import PRODUCT_ITEMS_FILE
+        if not os.path.exists(PRODUCT_ITEMS_FILE):
+            return DEFAULT_PRODUCTS, None
+        path = PRODUCT_ITEMS_FILE
+
+    df = pd.read_csv(path)
+    column = "product_item" if "product_item" in df.columns else "product"
+    df = df[df[column].notna()]
+    weights = df["weight"].astype(float).tolist() if "weight" in df.columns else None
+    return df[column].astype(str).tolist(), weights
+
+
+class RequestMix:
+    """Seeded stream of (endpoint, method, path, query, body)"""
+
+    def __init__(self, app_name: str, mix: dict, products: list, product_weights: list = None,
+                 max_quantity: int = 100, seed: int = 0):
+        self.app_name = app_name
+        self.names = list(mix)
+        self.weights = np.array([mix[n] for n in self.names]) / sum(mix.values())
+        self.products = products
+        self.product_weights = (
+            np.array(product_weights) / sum(product_weights) if product_weights else None
+        )
+        self.max_quantity = max_quantity
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+
+    def next(self) -> tuple:
+        with self._lock:
+            name = self.names[self._rng.choice(len(self.names), p=self.weights)]
+            product = self.products[self._rng.choice(len(self.products), p=self.product_weights)]
+            quantity = int(self._rng.integers(1, self.max_quantity + 1))
+            prefix_words = int(self._rng.integers(1, 3))
+
+        method, path, shape = ENDPOINTS[self.app_name][name]
+        query, body = "", None
+
+        if shape == "body":
+            body = {"product": product, "quantity": quantity}
+        elif shape == "fuzzy_body":
+            body = {"product": product, "quantity": quantity, "fuzzy": True}
+        elif shape == "prefix":
+            words = product.split()[:prefix_words]
+            query = urlencode({"q": " ".join(w[:max(3, len(w) // 2)] for w in words)})
+
+        return name, method, path, query, body
+
+
+# ===========================
+# Drivers
+# ===========================
+
+class AsgiDriver:
+    """
+    Calls an ASGI app in-process (no sockets, no HTTP client library):
+    lifespan startup/shutdown + one http scope per request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan_in = None
+        self._lifespan_out = None
+        self._lifespan_task = None
+        self._state = {}
+
+    async def start(self):
+        self._lifespan_in, self._lifespan_out = asyncio.Queue(), asyncio.Queue()
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": self._state}
+        self._lifespan_task = asyncio.create_task(
+            self.app(scope, self._lifespan_in.get, self._lifespan_out.put)
+        )
+        await self._lifespan_in.put({"type": "lifespan.startup"})
+        message = await self._lifespan_out.get()
+        if message["type"] != "lifespan.startup.complete":
+            raise RuntimeError(f"App startup failed: {message.get('message')}")
+
+    async def stop(self):
+        if self._lifespan_task is None:
+            return
+        await self._lifespan_in.put({"type": "lifespan.shutdown"})
+        await self._lifespan_out.get()
+        await self._lifespan_task
+
+    async def request(self, method: str, path: str, query: str = "", body: dict = None) -> int:
+        payload = json.dumps(body).encode() if body is not None else b""
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [
+                (b"host", b"loadtest"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(payload)).encode())
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80),
+            "state": dict(self._state)
+        }
+
+        done = asyncio.Event()
+        response = {"status": None}
+        sent_body = False
+
+        async def receive():
+            nonlocal sent_body
+            if not sent_body:
+                sent_body = True
+                return {"type": "http.request", "body": payload, "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                done.set()
+
+        await self.app(scope, receive, send)
+        done.set()
+        return response["status"]
+
+
+class HttpDriver:
+    """Real HTTP against base_url (requests, one session per thread)"""
+
+    def __init__(self, base_url: str, max_connections: int = 64, timeout: float = 60.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_connections)
+        self._local = threading.local()
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        self._pool.shutdown(wait=True)
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def _send(self, method, path, query, body) -> int:
+        url = f"{self.base_url}{path}" + (f"?{query}" if query else "")
+        return self._session().request(method, url, json=body, timeout=self.timeout).status_code
+
+    async def request(self, method: str, path: str, query: str = "", body: dict = None) -> int:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._send, method, path, query, body)
+
+
+def load_app(app_name: str):
+    module_name, attribute = APPS[app_name].split(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class LocalServer:
+    """uvicorn in a child process on 127.0.0.1 (started/stopped with the test)"""
+
+    def __init__(self, app_name: str, port: int = 8765, workers: int = 1,
+                 ready_timeout: float = 300.0, quiet: bool = True):
+        self.app_name = app_name
+        self.quiet = quiet
+        self.port = port
+        self.workers = workers
+        self.ready_timeout = ready_timeout
+        self.url = f"http://127.0.0.1:{port}"
+        self._process = None
+
+    def __enter__(self):
+        self._process = subprocess.Popen([
+            sys.executable, "-m", "uvicorn", APPS[self.app_name],
+            "--host", "127.0.0.1", "--port", str(self.port),
+            "--workers", str(self.workers), "--log-level", "warning"
+        ], stdout=subprocess.DEVNULL if self.quiet else None)
+
+        deadline = time.monotonic() + self.ready_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {self._process.returncode}")
+            try:
+                if requests.get(f"{self.url}/health", timeout=2).status_code == 200:
+                    return self
+            except requests.RequestException:
+                pass
+            time.sleep(0.5)
+
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"Server not healthy after {self.ready_timeout:.0f}s")
+
+    def __exit__(self, *exc):
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+
+@contextlib.contextmanager
+def quiet_app_output():
+    """
+    Silences the app under test (its prints and forked workers' prints go
+    to file descriptor 1 → /dev/null). Yields the terminal for the report.
+    """
+    sys.stdout.flush()
+    saved = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    terminal = os.fdopen(os.dup(saved), "w", buffering=1, encoding="utf-8")
+    try:
+        yield terminal
+    finally:
+        sys.stdout.flush()
+        terminal.close()
+        os.dup2(saved, 1)
+        os.close(saved)
+        os.close(devnull)
+
+
+# ===========================
+# Load stages
+# ===========================
+
+async def _timed_request(driver, request, scheduled: float, records: list):
+    name, method, path, query, body = request
+    try:
+        status = await driver.request(method, path, query, body)
+        error = None
+    except Exception as e:
+        status, error = None, type(e).__name__
+    records.append((name, time.perf_counter() - scheduled, status, error))
+
+
+async def closed_loop(driver, mix: RequestMix, concurrency: int, duration: float = None,
+                      total_requests: int = None) -> tuple:
+    """
+    `concurrency` clients, each sending its next request as soon as the
+    previous one returns. Stops after duration seconds or total_requests.
+    RETURNS: (records, elapsed seconds)
+    """
+    records = []
+    sent = 0
+    start = time.perf_counter()
+
+    async def client():
+        nonlocal sent
+        while True:
+            if total_requests is not None and sent >= total_requests:
+                return
+            if duration is not None and time.perf_counter() - start >= duration:
+                return
+            sent += 1
+            await _timed_request(driver, mix.next(), time.perf_counter(), records)
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return records, time.perf_counter() - start
+
+
+async def open_loop(driver, mix: RequestMix, rate: float, duration: float = None,
+                    total_requests: int = None, seed: int = 0) -> tuple:
+    """
+    Requests arrive at `rate` per second (Poisson), whether or not earlier
+    ones finished. Latency counts from the scheduled arrival, so a server
+    that falls behind shows it (no coordinated omission).
+    RETURNS: (records, elapsed seconds)
+    """
+    if total_requests is None:
+        total_requests = int(rate * duration)
+
+    rng = np.random.default_rng(seed)
+    arrivals = np.cumsum(rng.exponential(1.0 / rate, total_requests))
+
+    records = []
+    tasks = []
+    start = time.perf_counter()
+
+    for offset in arrivals.tolist():
+        scheduled = start + offset
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(_timed_request(driver, mix.next(), scheduled, records)))
+
+    await asyncio.gather(*tasks)
+    return records, time.perf_counter() - start
+
+
+def summarize(records: list, elapsed: float) -> dict:
+    """Per endpoint + overall: throughput, latency percentiles, status codes, error rate"""
+    def stats(rows):
+        latencies = np.array([r[1] for r in rows]) * 1000
+        statuses = {}
+        for r in rows:
+            key = str(r[2]) if r[2] is not None else r[3]
+            statuses[key] = statuses.get(key, 0) + 1
+        errors = sum(1 for r in rows if r[2] is None or r[2] >= 500)
+        ok = sum(1 for r in rows if r[2] is not None and 200 <= r[2] < 300)
+
+        result = {
+            "requests": len(rows),
+            "throughput_rps": round(len(rows) / elapsed, 2) if elapsed else 0.0,
+            "ok": ok,
+            "errors": errors,
+            "error_rate": round(errors / len(rows), 4) if rows else 0.0,
+            "status_codes": statuses
+        }
+        if len(rows):
+            for p in LATENCY_PERCENTILES:
+                result[f"p{p}_ms"] = round(float(np.percentile(latencies, p)), 3)
+            result["mean_ms"] = round(float(latencies.mean()), 3)
+            result["max_ms"] = round(float(latencies.max()), 3)
+        return result
+
+    by_endpoint = {}
+    for r in records:
+        by_endpoint.setdefault(r[0], []).append(r)
+
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "all": stats(records),
+        "endpoints": {name: stats(rows) for name, rows in sorted(by_endpoint.items())}
+    }
+
+
+async def run_load_test(
+    driver,
+    mix: RequestMix,
+    concurrency_levels: list = None,
+    rates: list = None,
+    duration: float = 10.0,
+    total_requests: int = None,
+    warmup_requests: int = 0,
+    log=None
+) -> list:
+    """
+    One stage per concurrency level (closed loop) and per rate (open loop).
+    Progress is printed to log (default stdout).
+    RETURNS: [{"mode", "concurrency"|"rate_rps", ...summarize()}]
+    """
+    stages = []
+    await driver.start()
+    try:
+        if warmup_requests:
+            await closed_loop(driver, mix, 1, total_requests=warmup_requests)
+
+        for concurrency in concurrency_levels or []:
+            records, elapsed = await closed_loop(driver, mix, concurrency, duration, total_requests)
+            stages.append({"mode": "closed", "concurrency": concurrency, **summarize(records, elapsed)})
+            _print_stage(stages[-1], log)
+
+        for rate in rates or []:
+            records, elapsed = await open_loop(driver, mix, rate, duration, total_requests)
+            stages.append({"mode": "open", "rate_rps": rate, **summarize(records, elapsed)})
+            _print_stage(stages[-1], log)
+    finally:
+        await driver.stop()
+
+    return stages
+
+
+def _print_stage(stage: dict, log=None):
+    label = (
+        f"concurrency {stage['concurrency']}" if stage["mode"] == "closed"
+        else f"rate {stage['rate_rps']}/s"
+    )
+    overall = stage["all"]
+    log = log or sys.stdout
+    print(f"\n🔁 {label} | {overall['requests']:,} requests in {stage['elapsed_s']:.1f}s "
+          f"→ {overall['throughput_rps']:,.1f} req/s, errors {overall['error_rate']:.1%}", file=log)
+    for name, s in stage["endpoints"].items():
+        print(f"   {name:<14} {s['requests']:>6,}  p50 {s.get('p50_ms', 0):>9.2f}ms  "
+              f"p95 {s.get('p95_ms', 0):>9.2f}ms  p99 {s.get('p99_ms', 0):>9.2f}ms  "
+              f"errors {s['error_rate']:.1%}  {s['status_codes']}", file=log)
+
+
+def load_test_report(config: dict, stages: list) -> dict:
+    """Machine-readable run: config + environment + stages"""
+    return {
+        "created_at": datetime.now().isoformat(),
+        "environment": environment(),
+        "config": config,
+        "stages": stages
+    }
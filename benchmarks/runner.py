@@ -0,0 +1,168 @@
+# benchmarks/runner.py
+
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.cases import CASES, BenchmarkData
+
+BASELINE_FILE = os.environ.get("PRICING_BENCH_BASELINE", "benchmarks/baseline.json")
+RESULTS_FILE = "benchmarks/latest.json"
+
+# Dataset sizes (rows) benchmarked by default
+BENCH_SIZES = os.environ.get("PRICING_BENCH_SIZES", "10k,100k,1m")
+
+# Timing: at least MIN_RUNS runs, more (up to MAX_RUNS) until MIN_TIME_S has
+# passed; slow cases stop after MAX_TIME_S (at least one timed run)
+MIN_RUNS = 3
+MAX_RUNS = 20
+MIN_TIME_S = 1.0
+MAX_TIME_S = 10.0
+
+# Regression = slower/larger than baseline by more than the threshold
+# (and by more than the noise floor, for sub-millisecond cases)
+REGRESSION_THRESHOLD = float(os.environ.get("PRICING_BENCH_THRESHOLD", 0.25))
+NOISE_FLOOR_MS = 0.5
+NOISE_FLOOR_MB = 0.5
+
+
+def parse_sizes(text: str) -> list:
+    """ "10k,100k,1m" → [10000, 100000, 1000000] """
+    sizes = []
+    for part in str(text).lower().split(","):
+        part = part.strip()
+        if not part:
+            continue
+        scale = {"k": 1_000, "m": 1_000_000}.get(part[-1], 1)
+        sizes.append(int(float(part.rstrip("km")) * scale))
+    return sizes
+
+
+def measure(
+    fn,
+    min_runs: int = MIN_RUNS,
+    max_runs: int = MAX_RUNS,
+    min_time: float = MIN_TIME_S,
+    max_time: float = MAX_TIME_S
+) -> dict:
+    """
+    Wall time (one warm-up run, then min_runs..max_runs timed runs,
+    fewer once max_time is spent) and peak traced memory of one extra run (tracemalloc slows the code,
+    so it is never on while timing).
+    """
+    fn()
+
+    times = []
+    start = time.perf_counter()
+    while len(times) < max_runs:
+        elapsed = time.perf_counter() - start
+        if times and ((len(times) >= min_runs and elapsed >= min_time) or elapsed >= max_time):
+            break
+
+        run_start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - run_start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "runs": len(times),
+        "min_ms": round(min(times) * 1000, 3),
+        "median_ms": round(statistics.median(times) * 1000, 3),
+        "peak_mb": round(peak / 2**20, 3)
+    }
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count()
+    }
+
+
+def run_suite(sizes: list, cases: list = None, seed: int = 0, **measure_options) -> dict:
+    """
+    Runs every case at every size.
+    RETURNS: {"environment", "created_at", "sizes", "results": {case: {rows: stats}}}
+    """
+    cases = cases or list(CASES)
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases: {unknown} (available: {list(CASES)})")
+
+    results = {name: {} for name in cases}
+
+    for rows in sizes:
+        print(f"\n📦 {rows:,} rows")
+        data = BenchmarkData(rows, seed)
+        try:
+            for name in cases:
+                stats = measure(CASES[name](data), **measure_options)
+                results[name][str(rows)] = stats
+                print(f"   {name:<20} {stats['min_ms']:>11,.2f} ms  {stats['peak_mb']:>9,.2f} MB  (x{stats['runs']})")
+        finally:
+            data.close()
+
+    return {
+        "environment": environment(),
+        "created_at": datetime.now().isoformat(),
+        "seed": seed,
+        "sizes": sizes,
+        "results": results
+    }
+
+
+def save_results(results: dict, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> dict:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Benchmark results not found: {path}")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(current: dict, baseline: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """
+    Case/size pairs present in both runs, min time and peak memory vs baseline.
+    RETURNS: [{"case", "rows", "metric", "baseline", "current", "change", "regression"}]
+    """
+    rows = []
+    for case, by_size in current["results"].items():
+        for size, stats in by_size.items():
+            base = baseline["results"].get(case, {}).get(size)
+            if base is None:
+                continue
+
+            for metric, floor in (("min_ms", NOISE_FLOOR_MS), ("peak_mb", NOISE_FLOOR_MB)):
+                old, new = base[metric], stats[metric]
+                change = (new - old) / old if old else 0.0
+                rows.append({
+                    "case": case,
+                    "rows": int(size),
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "change": round(change, 4),
+                    "regression": change > threshold and new - old > floor
+                })
+    return rows
@@ -0,0 +1,266 @@
+# benchmarks/synthetic.py
+
+import csv
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from config.columns import FINANCIAL_COLUMNS
+from processors.seller_l1_price import MAX_RANK
+
+# Catalog / seller population and their popularity skew (Zipf exponents)
+SYNTHETIC_PRODUCTS = int(os.environ.get("PRICING_SYNTHETIC_PRODUCTS", 5000))
+SYNTHETIC_SELLERS = int(os.environ.get("PRICING_SYNTHETIC_SELLERS", 20000))
+PRODUCT_ZIPF = 1.1
+SELLER_ZIPF = 1.0
+
+# Bids are generated in blocks, each with its own generator seeded by
+# (seed, block number): output depends on seed and row count only
+BLOCK_BIDS = 20_000
+
+MEAN_BIDDERS = 4.0              # rows per bid = 1 + Poisson, capped at MAX_RANK
+UNRANKED_SHARE = 0.02           # rows without an L-rank
+MISSING_QUANTITY_SHARE = 0.10   # basic rows with an empty quantity
+
+# "Total Price" text formats as scraped (share of rows)
+PRICE_FORMATS = [("backtick", 0.80), ("rupee", 0.12), ("inr", 0.06), ("missing", 0.02)]
+
+ITEM_MODIFIERS = [
+    "HIV", "HCV", "HBsAg", "Dengue", "Malaria", "Syphilis", "Typhoid", "COVID-19",
+    "3 Part", "5 Part", "Fully Automatic", "Semi Automatic", "Disposable", "Sterile",
+    "Titanium", "Polymer", "Nitrile", "Latex", "Digital", "Portable", "Paediatric",
+    "Adult", "Surgical", "Rapid", "Real Time", "Multi Parameter", "Single Use",
+    "Absorbable", "Non Absorbable", "Biochemistry", "Urine", "Electrolyte", "Blood",
+    "Glucose", "Cholesterol", "Thyroid", "Vitamin D", "Cardiac", "Orthopaedic", "Dental"
+]
+ITEM_NOUNS = [
+    "ELISA Test Kits", "Rapid Test Kits", "Analyzer", "Reagent Kits", "Ligation Clips",
+    "Gloves", "Syringes", "Needles", "Suture", "Catheter", "Cannula", "Test Strips",
+    "Blood Bags", "Masks", "Gowns", "Drapes", "Bandages", "Gauze Rolls", "Slides",
+    "Cuvettes", "Pipette Tips", "Tubes", "Monitor", "Oximeter", "Ventilator Circuit",
+    "Infusion Sets", "Scalpel Blades", "Staplers", "Implants", "Screws", "Plates",
+    "Controls", "Calibrators", "Cartridges", "Electrodes", "Probes", "Sensors",
+    "Filters", "Batteries", "Thermometer"
+]
+# Most popular products (then the rest of modifier x noun, shuffled)
+FEATURED_PRODUCTS = [
+    "HIV ELISA Test Kits", "HBsAg Rapid Test Kits", "Titanium Ligation Clips",
+    "Fully Automatic Biochemistry Analyzer", "5 Part Analyzer", "Dengue Rapid Test Kits",
+    "Nitrile Gloves", "Disposable Syringes", "Absorbable Suture", "Glucose Test Strips"
+]
+ITEM_VARIANTS = ["", " 10ml", " (V2)", " Pack of 100", " Type II", " Large", " Medium", " Small"]
+
+SELLER_WORDS = [
+    "SHREE", "OM", "SAI", "BALAJI", "GANESH", "LAKSHMI", "NOVA", "APEX", "PRIME", "GLOBAL",
+    "UNITED", "NATIONAL", "MODERN", "ADVANCED", "INNOVATIVE", "PRECISION", "LIFE", "CARE",
+    "MEDI", "BIO", "HEALTH", "SURYA", "KRISHNA", "ANAND", "VIJAY", "RAJ", "STAR", "GOLDEN",
+    "ROYAL", "CITY"
+]
+SELLER_SUFFIXES = [
+    "ENTERPRISES", "TRADERS", "DIAGNOSTICS", "SURGICALS", "HEALTHCARE", "MEDICAL AGENCIES",
+    "PHARMA", "SCIENTIFIC", "PRIVATE LIMITED", "SOLUTIONS"
+]
+
+
+def product_catalog(products: int = SYNTHETIC_PRODUCTS) -> list:
+    """
+    Distinct product names, most popular first. Fixed for a size
+    (independent of the data seed), so queries can name products.
+    """
+    pairs = [f"{m} {n}" for n in ITEM_NOUNS for m in ITEM_MODIFIERS]
+    pairs = [pairs[i] for i in np.random.default_rng(7).permutation(len(pairs))]
+    pairs = FEATURED_PRODUCTS + [p for p in pairs if p not in set(FEATURED_PRODUCTS)]
+    names = [name + variant for variant in ITEM_VARIANTS for name in pairs]
+
+    if products > len(names):
+        raise ValueError(f"At most {len(names):,} synthetic products (asked for {products:,})")
+    return names[:products]
+
+
+def seller_names(sellers: int = SYNTHETIC_SELLERS) -> list:
+    """Distinct seller names, most active first"""
+    names = []
+    rng = np.random.default_rng(11)
+    for i in range(sellers):
+        a, b = rng.choice(SELLER_WORDS, 2, replace=False)
+        suffix = SELLER_SUFFIXES[rng.integers(len(SELLER_SUFFIXES))]
+        under_pma = " Under PMA" if rng.random() < 0.3 else ""
+        names.append(f"{a} {b} {suffix} {i + 1}{under_pma}")
+    return names
+
+
+# Product shown in benchmarks / examples (the most popular one)
+BENCHMARK_PRODUCT = product_catalog(1)[0]
+
+
+def _zipf_sampler(size: int, exponent: float):
+    """Bounded Zipf over ranks 0..size-1: (rng, n) → ranks"""
+    cdf = np.cumsum(1.0 / np.arange(1, size + 1) ** exponent)
+    cdf /= cdf[-1]
+    return lambda rng, n: np.minimum(np.searchsorted(cdf, rng.random(n)), size - 1)
+
+
+def _indian_grouping(amount: float) -> str:
+    """1234567.5 → "12,34,567.50" """
+    whole, fraction = f"{amount:.2f}".split(".")
+    head, tail = whole[:-3], whole[-3:]
+    groups = []
+    while len(head) > 2:
+        groups.insert(0, head[-2:])
+        head = head[:-2]
+    if head:
+        groups.insert(0, head)
+    return ",".join(groups + [tail]) + "." + fraction
+
+
+def _format_prices(prices: np.ndarray, formats: np.ndarray) -> list:
+    text = []
+    for price, kind in zip(prices.tolist(), formats.tolist()):
+        if kind == 0:
+            text.append(f"` {price:.2f}")
+        elif kind == 1:
+            text.append("₹" + _indian_grouping(price))
+        elif kind == 2:
+            text.append(f"INR {price:.0f}")
+        else:
+            text.append("")
+    return text
+
+
+class GemGenerator:
+    """
+    GeM-shaped financial + basic rows, block by block.
+
+    - Each bid offers 1-3 catalog products ("Item Categories : a,b") and
+      has 1..MAX_RANK seller rows (one per bidder, L1 = cheapest)
+    - Products and sellers are drawn from bounded Zipf distributions
+    - Total price = unit price of the first item x quantity x bidder markup
+    """
+
+    def __init__(self, seed: int = 0, products: int = SYNTHETIC_PRODUCTS, sellers: int = SYNTHETIC_SELLERS):
+        self.seed = seed
+        self.products = np.array(product_catalog(products), dtype=object)
+        self.sellers = np.array(seller_names(sellers), dtype=object)
+
+        catalog_rng = np.random.default_rng(3)
+        self.unit_prices = catalog_rng.lognormal(7.5, 1.5, len(self.products))
+
+        self._product_rank = _zipf_sampler(len(self.products), PRODUCT_ZIPF)
+        self._seller_rank = _zipf_sampler(len(self.sellers), SELLER_ZIPF)
+        self._format_p = np.array([share for _, share in PRICE_FORMATS])
+
+    def block(self, number: int) -> tuple:
+        """RETURNS: (financial DataFrame, basic DataFrame) of block `number`"""
+        rng = np.random.default_rng([self.seed, number])
+        first_bid = number * BLOCK_BIDS + 1
+        bid_ids = np.arange(first_bid, first_bid + BLOCK_BIDS)
+
+        # Bids: items, quantity, bidders
+        item_counts = rng.choice([1, 2, 3], BLOCK_BIDS, p=[0.6, 0.3, 0.1])
+        items = self._product_rank(rng, BLOCK_BIDS * 3).reshape(BLOCK_BIDS, 3)
+        offered = np.array([
+            "Item Categories : " + ",".join(self.products[row[:count]])
+            for row, count in zip(items, item_counts)
+        ], dtype=object)
+
+        quantities = np.maximum(1, rng.lognormal(3.5, 1.2, BLOCK_BIDS).astype(np.int64))
+        bidders = np.minimum(1 + rng.poisson(MEAN_BIDDERS - 1, BLOCK_BIDS), MAX_RANK)
+
+        # Rows: one per bidder, prices rising with rank
+        bid_of_row = np.repeat(np.arange(BLOCK_BIDS), bidders)
+        rows = len(bid_of_row)
+        starts = np.repeat(np.cumsum(bidders) - bidders, bidders)
+        rank = np.arange(rows) - starts
+
+        steps = rng.exponential(0.04, rows)
+        steps[rank == 0] = 0.0
+        markup = np.cumsum(steps)
+        markup -= np.repeat(markup[np.cumsum(bidders) - bidders], bidders)
+
+        bid_totals = self.unit_prices[items[:, 0]] * quantities * rng.lognormal(0, 0.15, BLOCK_BIDS)
+        prices = bid_totals[bid_of_row] * (0.95 + markup)
+
+        ranks = np.char.add("L", (rank + 1).astype(str)).astype(object)
+        ranks[rng.random(rows) < UNRANKED_SHARE] = ""
+
+        serial = np.where(rng.random(rows) < 0.01, np.nan, rank + 1.0)
+        formats = rng.choice(len(PRICE_FORMATS), rows, p=self._format_p)
+
+        bid_nos = np.array([f"GEM/{2021 + min(4, b // 2_000_000)}/B/{4_000_000 + b}" for b in bid_ids], dtype=object)
+
+        financial = pd.DataFrame({
+            "serial_no": bid_ids[bid_of_row],
+            "bid_no": bid_nos[bid_of_row],
+            "S.No.": serial,
+            "Seller Name": self.sellers[self._seller_rank(rng, rows)],
+            "Offered Item": offered[bid_of_row],
+            "Total Price": _format_prices(prices, formats),
+            "Rank": ranks,
+            "Status": "",
+            "Winner": ""
+        })[FINANCIAL_COLUMNS]
+
+        quantity_text = np.char.add(quantities.astype(str), " nos").astype(object)
+        quantity_text[rng.random(BLOCK_BIDS) < MISSING_QUANTITY_SHARE] = ""
+        basic = pd.DataFrame({"bid_no": bid_nos, "quantity": quantity_text})
+
+        return financial, basic
+
+    def blocks(self, rows: int):
+        """(financial, basic) blocks totalling exactly `rows` financial rows"""
+        remaining = rows
+        number = 0
+        while remaining > 0:
+            financial, basic = self.block(number)
+            if len(financial) > remaining:
+                financial = financial.iloc[:remaining]
+                basic = basic[basic["bid_no"].isin(set(financial["bid_no"].unique()))]
+            remaining -= len(financial)
+            number += 1
+            yield financial, basic
+
+
+def synthetic_financial(rows: int, seed: int = 0, **generator_options) -> pd.DataFrame:
+    """In-memory financial rows (benchmarks, tests)"""
+    frames = [financial for financial, _ in GemGenerator(seed, **generator_options).blocks(rows)]
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_gem_csvs(
+    financial_csv: str,
+    basic_csv: str,
+    rows: int,
+    seed: int = 0,
+    force: bool = False,
+    **generator_options
+) -> dict:
+    """
+    Streams `rows` financial rows (+ one basic row per bid) to CSV,
+    one block in memory at a time. Existing files are kept unless force.
+    """
+    for path in (financial_csv, basic_csv):
+        if os.path.exists(path) and not force:
+            raise FileExistsError(f"{path} exists (use force to overwrite)")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    start = time.perf_counter()
+    bids = written = 0
+
+    with open(financial_csv, "w", encoding="utf-8", newline="") as financial_file, \
+         open(basic_csv, "w", encoding="latin-1", newline="") as basic_file:
+        for number, (financial, basic) in enumerate(GemGenerator(seed, **generator_options).blocks(rows)):
+            financial.to_csv(financial_file, header=number == 0, index=False)
+            basic.to_csv(basic_file, header=number == 0, index=False, quoting=csv.QUOTE_ALL)
+            written += len(financial)
+            bids += len(basic)
+
+    return {
+        "rows": written,
+        "bids": bids,
+        "seed": seed,
+        "elapsed_s": round(time.perf_counter() - start, 2),
+        "financial_csv": financial_csv,
+        "basic_csv": basic_csv
+    }
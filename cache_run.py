@@ -0,0 +1,24 @@
+# cache_run.py
+
+import sys
+
+from utils.financial_cache import build_financial_cache, is_cache_fresh
+
+RAW_FILE = "data/raw/scraper_single_bid_results_financial.csv"
+
+
+def main():
+    print("\n🗄️  FINANCIAL DATA COLUMNAR CACHE\n")
+
+    force = "--force" in sys.argv[1:]
+
+    if not force and is_cache_fresh(RAW_FILE):
+        print("✅ Cache is fresh (source CSV unchanged) - nothing to do")
+        print("   Use --force to rebuild anyway")
+        return
+
+    build_financial_cache(RAW_FILE)
+
+
+if __name__ == "__main__":
+    main()
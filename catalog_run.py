@@ -0,0 +1,44 @@
+# catalog_run.py
+
+import sys
+
+from processors.catalog_pipeline import CATALOG_FILE, CATALOG_STATE_FILE, build_catalog
+from utils.financial_cache import CHUNK_ROWS
+from utils.prediction_executor import POOL_SIZE
+
+RAW_FILE = "data/raw/scraper_single_bid_results_financial.csv"
+
+
+def _option(args, name, default):
+    if name in args:
+        return args[args.index(name) + 1]
+    return default
+
+
+def main():
+    """
+    Canonical product catalog (product_items.csv) in one streaming pass.
+    Replaces product_items_run.py + product_items_fast_run.py; later runs
+    only read rows appended to the financial CSV.
+    Usage: python catalog_run.py [--full] [--workers N] [--chunk-rows N] [--output product_items.csv]
+    """
+    args = sys.argv[1:]
+
+    print("\n📚 PRODUCT CATALOG\n")
+
+    try:
+        build_catalog(
+            raw_file=RAW_FILE,
+            output_csv=_option(args, "--output", CATALOG_FILE),
+            state_file=CATALOG_STATE_FILE,
+            workers=int(_option(args, "--workers", POOL_SIZE)),
+            chunk_rows=int(_option(args, "--chunk-rows", CHUNK_ROWS)),
+            full="--full" in args
+        )
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,61 +1,50 @@
 # filters/competitor_filter.py
 
 from processors.product_fingerprint import fingerprint
+from filters.token_index import TokenIndex
 
 
-def filter_competitors(df, user_input):
+def user_token_sets(user_input):
     """
-    Filters competitors using partial token matching.
-    Supports SINGLE and MULTI product input.
-    User input tokens are matched as a subset of product tokens.
+    Splits user input (single or comma-separated) into one token set
+    per product. Products with an empty fingerprint are dropped.
     """
-
-    # 1️⃣ Split user input (supports single or comma-separated)
     user_products = [
         p.strip()
         for p in user_input.split(",")
         if p.strip()
     ]
 
-    # 2️⃣ Create token sets for each user product
-    user_token_sets = []
+    token_sets = []
     for p in user_products:
         fp = fingerprint(p)
         if fp:
             # Convert fingerprint (space-separated tokens) to a set
-            tokens = set(fp.split())
-            user_token_sets.append(tokens)
+            token_sets.append(set(fp.split()))
+
+    return token_sets
+
+
+def filter_competitors(df, user_input, index=None):
+    """
+    Filters competitors using partial token matching.
+    Supports SINGLE and MULTI product input.
+    User input tokens are matched as a subset of product tokens.
+
+    Pass a prebuilt TokenIndex (built from the same df) to avoid
+    re-fingerprinting the financial data on every call.
+    """
+
+    # 1️⃣ Create token sets for each user product
+    token_sets = user_token_sets(user_input)
 
-    if not user_token_sets:
+    if not token_sets:
         return df.iloc[0:0]  # empty dataframe
 
-    matched_indices = []
-
-    # 3️⃣ Scan each tender row
-    for idx, row in df.iterrows():
-        offered = str(row.get("Offered Item", ""))
-        offered = offered.replace("Item Categories :", "")
-
-        offered_items = [
-            item.strip()
-            for item in offered.split(",")
-            if item.strip()
-        ]
-
-        # 4️⃣ Check if ANY user product tokens are a subset of ANY offered item
-        for item in offered_items:
-            item_fp = fingerprint(item)
-            if item_fp:
-                item_tokens = set(item_fp.split())
-                
-                # Check if any user product matches (partial match)
-                for user_tokens in user_token_sets:
-                    # All user tokens must be present in item tokens
-                    if user_tokens.issubset(item_tokens):
-                        matched_indices.append(idx)
-                        break
-                else:
-                    continue
-                break
-
-    return df.loc[matched_indices]
+    # 2️⃣ Look up matching rows in the inverted index
+    if index is None:
+        index = TokenIndex.from_dataframe(df)
+
+    positions = index.match_positions(token_sets)
+
+    return df.iloc[positions]
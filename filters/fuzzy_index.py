@@ -0,0 +1,133 @@
+# filters/fuzzy_index.py
+
+import os
+import zlib
+
+import numpy as np
+
+# Min character-trigram Jaccard similarity of a fuzzy match
+FUZZY_THRESHOLD = float(os.environ.get("PRICING_FUZZY_THRESHOLD", 0.5))
+
+# Max fuzzy matches used per unmatched product
+FUZZY_MAX_MATCHES = int(os.environ.get("PRICING_FUZZY_MAX_MATCHES", 5))
+
+SHINGLE_SIZE = 3
+
+# LSH: 24 bands x 3 rows → ~96% recall at similarity 0.5, ~18% candidates at 0.2
+LSH_BANDS = 24
+LSH_ROWS = 3
+
+_PRIME = (1 << 31) - 1
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Character n-grams of a fingerprint (padded, so short tokens count too)"""
+    padded = f" {text} "
+    return {padded[i:i + size] for i in range(max(1, len(padded) - size + 1))}
+
+
+def jaccard(a: set, b: set) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class FuzzyItemIndex:
+    """
+    MinHash LSH index over distinct item fingerprints.
+
+    - Each fingerprint → trigram set → MinHash signature (bands x rows)
+    - Per band: sorted band hashes, so candidates are found with binary
+      searches (sub-linear in the number of items)
+    - Candidates are verified with the exact trigram Jaccard similarity
+    """
+
+    def __init__(self, bands: int = LSH_BANDS, rows: int = LSH_ROWS, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+
+        rng = np.random.default_rng(seed)
+        perms = bands * rows
+        self._a = rng.integers(1, _PRIME, perms, dtype=np.int64)
+        self._b = rng.integers(0, _PRIME, perms, dtype=np.int64)
+        self._band_mix = rng.integers(1, _PRIME, rows, dtype=np.uint64)
+
+        self.fingerprints = []          # item number -> fingerprint
+        self.shingle_sets = []          # item number -> trigram set
+        self._known = set()
+        self._band_keys = np.empty((0, bands), dtype=np.uint64)
+        self._sorted_keys = None        # per band: sorted keys
+        self._sorted_items = None       # per band: item numbers in key order
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def _signature(self, shingle_set: set) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) % _PRIME for s in shingle_set),
+            dtype=np.int64,
+            count=len(shingle_set)
+        )
+        # (a·h + b) mod p per permutation, min over shingles (a, h < 2^31 → no overflow)
+        values = (np.outer(self._a, hashes) + self._b[:, None]) % _PRIME
+        return values.min(axis=1)
+
+    def _band_hashes(self, signature: np.ndarray) -> np.ndarray:
+        rows = signature.reshape(self.bands, self.rows).astype(np.uint64)
+        return (rows * self._band_mix).sum(axis=1)      # wraps mod 2^64
+
+    def add(self, fingerprints) -> int:
+        """Indexes fingerprints not seen before; RETURNS: number added"""
+        new = []
+        for fp in fingerprints:
+            if fp and fp not in self._known:
+                self._known.add(fp)
+                new.append(fp)
+
+        if not new:
+            return 0
+
+        keys = np.empty((len(new), self.bands), dtype=np.uint64)
+        for i, fp in enumerate(new):
+            shingle_set = shingles(fp)
+            self.fingerprints.append(fp)
+            self.shingle_sets.append(shingle_set)
+            keys[i] = self._band_hashes(self._signature(shingle_set))
+
+        self._band_keys = np.vstack([self._band_keys, keys])
+
+        order = np.argsort(self._band_keys, axis=0, kind="stable")
+        self._sorted_items = order.T
+        self._sorted_keys = np.take_along_axis(self._band_keys, order, axis=0).T
+
+        return len(new)
+
+    def candidates(self, shingle_set: set) -> set:
+        """Item numbers sharing at least one band with the query"""
+        if not self.fingerprints:
+            return set()
+
+        keys = self._band_hashes(self._signature(shingle_set))
+        found = set()
+        for band, key in enumerate(keys):
+            sorted_keys = self._sorted_keys[band]
+            start = np.searchsorted(sorted_keys, key, side="left")
+            stop = np.searchsorted(sorted_keys, key, side="right")
+            found.update(self._sorted_items[band][start:stop].tolist())
+
+        return found
+
+    def search(self, text: str, threshold: float = FUZZY_THRESHOLD) -> list:
+        """
+        Fingerprints similar to text (trigram Jaccard >= threshold),
+        most similar first. RETURNS: [(fingerprint, similarity), ...]
+        """
+        query = shingles(text)
+        matches = []
+        for item in self.candidates(query):
+            similarity = jaccard(query, self.shingle_sets[item])
+            if similarity >= threshold:
+                matches.append((self.fingerprints[item], similarity))
+
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
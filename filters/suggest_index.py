@@ -0,0 +1,170 @@
+# filters/suggest_index.py
+
+import copy
+
+import numpy as np
+import pandas as pd
+
+from processors.product_fingerprint import SPLIT_RE, STOPWORDS, fingerprint, normalize_word
+
+# Default / max suggestions per query
+SUGGEST_LIMIT = 10
+MAX_SUGGEST_LIMIT = 50
+
+
+def query_prefixes(query: str) -> list:
+    """
+    Typed words → token prefixes (upper case, plural-normalized;
+    numbers and stopwords dropped, like fingerprint())
+    """
+    words = [word for word in SPLIT_RE.split(str(query).upper()) if word]
+    prefixes = [
+        normalize_word(word) for word in words
+        if not word.isdigit() and word not in STOPWORDS
+    ]
+    # Longest (most selective) prefix first
+    return sorted(set(prefixes), key=len, reverse=True)
+
+
+class SuggestIndex:
+    """
+    Prefix index over fingerprint tokens of canonical product names.
+
+    - Products are numbered by rank (most bids first), so the top-k of
+      any candidate set is its k smallest numbers
+    - (token, rank) pairs in one sorted array: a prefix is two binary
+      searches; several typed words AND their rank masks
+
+    Built from_dataset(), it keeps each product's distinct bids, so
+    rows appended to the dataset later are counted by updated() in
+    O(new rows) instead of a full rebuild.
+    """
+
+    def __init__(self, products: list, bid_counts: list, version=None):
+        order = sorted(range(len(products)), key=lambda i: (-bid_counts[i], products[i]))
+        self.products = [products[i] for i in order]
+        self.bid_counts = [int(bid_counts[i]) for i in order]
+        self.version = version
+
+        pairs = sorted(
+            (token, rank)
+            for rank, product in enumerate(self.products)
+            for token in set(fingerprint(product).split())
+        )
+        self._tokens = np.array([token for token, _ in pairs], dtype=str)
+        self._ranks = np.array([rank for _, rank in pairs], dtype=np.int64)
+
+        self._counted = None    # incremental state, see from_dataset
+
+    @classmethod
+    def from_dataset(cls, dataset, products: list, version=None) -> "SuggestIndex":
+        """Bid volume of each product = distinct bid_no of the rows it matches"""
+        counted = _CountedBids(dataset, products)
+        return counted.index(version)
+
+    def updated(self, dataset, version=None):
+        """
+        Index with the rows appended to dataset since this one was built
+        counted in (this index is left unchanged).
+        RETURNS: None when it cannot be updated (not built from this
+        dataset, or the dataset was reloaded) → rebuild instead
+        """
+        if self._counted is None or not self._counted.can_update(dataset):
+            return None
+
+        return self._counted.update(dataset).index(version)
+
+    def __len__(self):
+        return len(self.products)
+
+    def _prefix_mask(self, prefix: str) -> np.ndarray:
+        """Products (by rank) with a token starting with prefix"""
+        start = np.searchsorted(self._tokens, prefix, side="left")
+        stop = np.searchsorted(self._tokens, prefix + "\uffff", side="left")
+
+        mask = np.zeros(len(self.products), dtype=bool)
+        mask[self._ranks[start:stop]] = True
+        return mask
+
+    def suggest(self, query: str, limit: int = SUGGEST_LIMIT) -> list:
+        """
+        Top products (by bid volume) with a token starting with EVERY
+        typed word. RETURNS: [{"product", "bid_count"}, ...]
+        """
+        prefixes = query_prefixes(query)
+        if not prefixes or limit <= 0:
+            return []
+
+        mask = self._prefix_mask(prefixes[0])
+        for prefix in prefixes[1:]:
+            mask &= self._prefix_mask(prefix)
+
+        return [
+            {"product": self.products[rank], "bid_count": self.bid_counts[rank]}
+            for rank in np.flatnonzero(mask)[:limit].tolist()
+        ]
+
+
+class _CountedBids:
+    """
+    Distinct bids of every product over the first `rows` dataset rows
+    (bid_no → small int codes, one sorted code array per product).
+    """
+
+    def __init__(self, dataset, products: list):
+        self.products = list(products)
+        self.token_sets = [set(fingerprint(product).split()) for product in self.products]
+        self.dataset_key = _dataset_key(dataset)
+        self.rows = len(dataset)
+
+        all_rows = np.arange(self.rows)
+        bid_values = dataset.column_values("bid_no", all_rows) if self.rows else np.empty(0, dtype=object)
+        self.row_bids, uniques = pd.factorize(pd.Series(bid_values, dtype=object))
+        self.bid_codes = {bid: code for code, bid in enumerate(uniques)}
+
+        self.product_bids = [
+            _distinct_bids(self.row_bids, dataset.match_positions([tokens])) if tokens else _NO_BIDS
+            for tokens in self.token_sets
+        ]
+
+    def index(self, version) -> SuggestIndex:
+        index = SuggestIndex(self.products, [len(bids) for bids in self.product_bids], version)
+        index._counted = self
+        return index
+
+    def can_update(self, dataset) -> bool:
+        return _dataset_key(dataset) == self.dataset_key and len(dataset) >= self.rows
+
+    def update(self, dataset) -> "_CountedBids":
+        """Copy with rows [self.rows, len(dataset)) counted in"""
+        start, stop = self.rows, len(dataset)
+        new_bids = np.array([
+            -1 if pd.isna(bid) else self.bid_codes.setdefault(bid, len(self.bid_codes))
+            for bid in dataset.column_values("bid_no", np.arange(start, stop)).tolist()
+        ], dtype=np.int64)
+
+        updated = copy.copy(self)
+        updated.rows = stop
+        updated.row_bids = np.concatenate([self.row_bids, new_bids])
+        updated.product_bids = list(self.product_bids)
+
+        for i, tokens in enumerate(self.token_sets):
+            positions = dataset.match_positions([tokens], start) if tokens else _NO_BIDS
+            if len(positions):
+                updated.product_bids[i] = np.union1d(self.product_bids[i], _distinct_bids(updated.row_bids, positions))
+
+        return updated
+
+
+_NO_BIDS = np.empty(0, dtype=np.int64)
+
+
+def _distinct_bids(row_bids: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Sorted distinct bid codes of the rows (missing bid_no not counted)"""
+    codes = row_bids[positions]
+    return np.unique(codes[codes >= 0])
+
+
+def _dataset_key(dataset):
+    """Same object, same load (a reload starts over)"""
+    return id(dataset), dataset.loaded_at
@@ -0,0 +1,282 @@
+# filters/token_index.py
+
+import numpy as np
+import pandas as pd
+
+from config.columns import OFFERED_ITEM_COLUMN
+from filters.fuzzy_index import FUZZY_MAX_MATCHES, FUZZY_THRESHOLD, FuzzyItemIndex
+from processors.product_fingerprint import fingerprint, fingerprint_many
+
+# Precomputed per-row item fingerprints ("fp1|fp2|...", see utils/financial_cache.py)
+ITEM_FINGERPRINTS_COLUMN = "item_fingerprints"
+
+
+def split_offered_items(offered) -> list:
+    """
+    Splits an "Offered Item" cell into its individual item names.
+    Mirrors the parsing used by filter_competitors.
+    """
+    offered = str(offered).replace("Item Categories :", "")
+
+    return [
+        item.strip()
+        for item in offered.split(",")
+        if item.strip()
+    ]
+
+
+def offered_item_fingerprints(offered_values) -> list:
+    """
+    Fingerprints of the items of each offered value (one list per value).
+    Item names repeated across values are fingerprinted once.
+    """
+    items = [split_offered_items(offered) for offered in offered_values]
+    fps = fingerprint_many([item for row in items for item in row]).tolist()
+
+    result = []
+    start = 0
+    for row in items:
+        result.append(fps[start:start + len(row)])
+        start += len(row)
+
+    return result
+
+
+def item_fingerprints_column(offered_values: pd.Series) -> pd.Series:
+    """
+    Per-row "fp1|fp2|..." of the offered items' fingerprints
+    (precomputed once, e.g. in the columnar cache).
+    """
+    codes, uniques = pd.factorize(offered_values.map(str))
+
+    joined = np.array([
+        "|".join(fp for fp in fps if fp)
+        for fps in offered_item_fingerprints(uniques)
+    ] + [""], dtype=object)
+
+    return pd.Series(joined[codes], index=offered_values.index, dtype=object)
+
+
+class TokenIndex:
+    """
+    Inverted index over fingerprint tokens of offered items.
+
+    - Built ONCE from the financial data
+    - token -> posting set of item ids
+    - item id -> offered-value code -> rows
+
+    Rows repeating the same "Offered Item" text (every seller of a bid)
+    share one code, so each distinct item list is fingerprinted once.
+    Pass item_fingerprints (aligned to offered_values) to skip
+    fingerprinting entirely.
+
+    add_rows() appends rows in O(new rows); token_rows (token -> number
+    of rows offering it) is kept up to date.
+
+    fuzzy_token_sets() falls back to similar item names (MinHash LSH,
+    built on first use) for products without an exact match.
+    """
+
+    def __init__(self, offered_values, item_fingerprints=None):
+        offered_values = [str(v) for v in offered_values]
+
+        codes, uniques = pd.factorize(pd.Series(offered_values, dtype=object))
+
+        self._row_codes = codes.astype(np.int64)
+        self._rows = len(codes)
+        self.offered_codes = {}     # offered value -> code
+        self.code_tokens = []       # code -> tokens of all its items
+        self.item_codes = []        # item id -> offered-value code
+        self.item_tokens = []       # item id -> frozenset of tokens
+        self.postings = {}          # token -> set of item ids
+        self.token_rows = {}        # token -> rows offering it
+
+        self._fuzzy = None          # FuzzyItemIndex, built on first fuzzy query
+        self._fuzzy_items = 0       # items already in it
+
+        if item_fingerprints is None:
+            for code, (offered, fps) in enumerate(zip(uniques, offered_item_fingerprints(uniques))):
+                self._add_code(offered)
+                self._add_fingerprints(code, fps)
+        else:
+            # First row of each code carries that offered value's fingerprints
+            _, first_rows = np.unique(codes, return_index=True)
+            for code, row in enumerate(first_rows):
+                fps = item_fingerprints[row]
+                self._add_code(uniques[code])
+                self._add_fingerprints(code, str(fps).split("|") if isinstance(fps, str) else [])
+
+        self._count_token_rows(codes)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "TokenIndex":
+        if OFFERED_ITEM_COLUMN not in df.columns:
+            return cls([""] * len(df))
+
+        item_fingerprints = None
+        if ITEM_FINGERPRINTS_COLUMN in df.columns:
+            item_fingerprints = df[ITEM_FINGERPRINTS_COLUMN].tolist()
+
+        return cls(df[OFFERED_ITEM_COLUMN].tolist(), item_fingerprints)
+
+    def __len__(self):
+        return self._rows
+
+    @property
+    def row_codes(self) -> np.ndarray:
+        """Offered-value code of every row"""
+        return self._row_codes[:self._rows]
+
+    def add_rows(self, offered_values, item_fingerprints=None):
+        """
+        Appends rows (in order). Only offered values never seen before
+        are fingerprinted; cost is proportional to the new rows.
+        """
+        offered_values = [str(v) for v in offered_values]
+        codes = np.empty(len(offered_values), dtype=np.int64)
+
+        for i, offered in enumerate(offered_values):
+            code = self.offered_codes.get(offered)
+            if code is None:
+                code = self._add_code(offered)
+                fps = item_fingerprints[i] if item_fingerprints is not None else None
+                if isinstance(fps, str):
+                    self._add_fingerprints(code, fps.split("|"))
+                elif item_fingerprints is None:
+                    self._add_offered(code, offered)
+            codes[i] = code
+
+        # Amortized growth of the row-code buffer
+        needed = self._rows + len(codes)
+        if needed > len(self._row_codes):
+            grown = np.empty(max(needed, 2 * len(self._row_codes)), dtype=np.int64)
+            grown[:self._rows] = self.row_codes
+            self._row_codes = grown
+
+        self._row_codes[self._rows:needed] = codes
+        self._rows = needed
+        self._count_token_rows(codes)
+
+    def _add_code(self, offered: str) -> int:
+        code = len(self.code_tokens)
+        self.offered_codes[offered] = code
+        self.code_tokens.append(set())
+        return code
+
+    def _count_token_rows(self, codes: np.ndarray):
+        if len(codes) == 0:
+            return
+
+        unique_codes, counts = np.unique(codes, return_counts=True)
+        for code, count in zip(unique_codes.tolist(), counts.tolist()):
+            for token in self.code_tokens[code]:
+                self.token_rows[token] = self.token_rows.get(token, 0) + count
+
+    def top_tokens(self, limit: int = 10) -> dict:
+        """Most offered tokens → rows offering them (from token_rows)"""
+        ranked = sorted(self.token_rows.items(), key=lambda item: (-item[1], item[0]))
+        return dict(ranked[:limit])
+
+    def _add_offered(self, code: int, offered: str):
+        self._add_fingerprints(
+            code,
+            [fingerprint(item) for item in split_offered_items(offered)]
+        )
+
+    def _add_fingerprints(self, code: int, item_fps):
+        for item_fp in item_fps:
+            if not item_fp:
+                continue
+
+            item_id = len(self.item_codes)
+            tokens = frozenset(item_fp.split())
+
+            self.item_codes.append(code)
+            self.item_tokens.append(tokens)
+            self.code_tokens[code].update(tokens)
+
+            for token in tokens:
+                self.postings.setdefault(token, set()).add(item_id)
+
+    def match_items(self, user_tokens) -> set:
+        """
+        Item ids whose token set contains ALL user tokens.
+        Postings are intersected starting from the rarest token.
+        """
+        postings = []
+        for token in user_tokens:
+            posting = self.postings.get(token)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+
+        matched = set(postings[0])
+        for posting in postings[1:]:
+            matched &= posting
+            if not matched:
+                break
+
+        return matched
+
+    def fuzzy_index(self) -> FuzzyItemIndex:
+        """Item fingerprints in a MinHash LSH index (items added since the last call included)"""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyItemIndex()
+
+        if self._fuzzy_items < len(self.item_tokens):
+            self._fuzzy.add(" ".join(sorted(tokens)) for tokens in self.item_tokens[self._fuzzy_items:])
+            self._fuzzy_items = len(self.item_tokens)
+
+        return self._fuzzy
+
+    def fuzzy_token_sets(
+        self,
+        user_token_sets,
+        threshold: float = FUZZY_THRESHOLD,
+        max_matches: int = FUZZY_MAX_MATCHES
+    ):
+        """
+        Token sets for a fuzzy query: products with an exact match are
+        kept; each product WITHOUT one is replaced by the token sets of
+        its most similar item names (trigram similarity >= threshold).
+
+        RETURNS: (token_sets, fuzzy_matches)
+        - fuzzy_matches: [{"query", "matched_item", "similarity"}, ...]
+        """
+        token_sets = []
+        fuzzy_matches = []
+
+        for user_tokens in user_token_sets:
+            if self.match_items(user_tokens):
+                token_sets.append(user_tokens)
+                continue
+
+            query = " ".join(sorted(user_tokens))
+            for item_fp, similarity in self.fuzzy_index().search(query, threshold)[:max_matches]:
+                token_sets.append(set(item_fp.split()))
+                fuzzy_matches.append({
+                    "query": query,
+                    "matched_item": item_fp,
+                    "similarity": round(similarity, 3)
+                })
+
+        return token_sets, fuzzy_matches
+
+    def match_positions(self, user_token_sets, start: int = 0) -> np.ndarray:
+        """
+        Row positions (ascending) where ANY user token set is a subset
+        of ANY offered item in that row. start skips earlier rows
+        (e.g. only rows appended since a previous scan).
+        """
+        matched_codes = set()
+        for user_tokens in user_token_sets:
+            for item_id in self.match_items(user_tokens):
+                matched_codes.add(self.item_codes[item_id])
+
+        if not matched_codes:
+            return np.empty(0, dtype=np.int64)
+
+        mask = np.isin(self.row_codes[start:], np.fromiter(matched_codes, dtype=np.int64))
+        return start + np.flatnonzero(mask)
@@ -0,0 +1,95 @@
+# ingest_run.py
+
+import sys
+
+import pandas as pd
+import requests
+
+from processors.seller_quantity_analysis import SCRAPER_CSV_OPTIONS
+from utils.ingest import MAX_INGEST_ROWS, ingest
+
+RAW_FILE = "data/raw/scraper_single_bid_results_financial.csv"
+BASIC_FILE = "data/raw/scraper_single_bid_results_basic.csv"
+
+
+def _option(args, name):
+    if name in args:
+        i = args.index(name)
+        value = args[i + 1]
+        del args[i:i + 2]
+        return value
+    return None
+
+
+def read_rows(path: str, **read_options) -> pd.DataFrame:
+    """New scraper rows as text (no NA/number conversion before ingest)"""
+    return pd.read_csv(path, dtype=str, keep_default_na=False, **read_options)
+
+
+def post_rows(url: str, financial_df, basic_df, token: str = None) -> list:
+    """Sends rows to a running API in MAX_INGEST_ROWS batches"""
+    headers = {"X-Ingest-Token": token} if token else {}
+    results = []
+
+    financial = financial_df.to_dict("records") if financial_df is not None else []
+    basic = basic_df.to_dict("records") if basic_df is not None else []
+
+    for start in range(0, max(len(financial), len(basic)), MAX_INGEST_ROWS):
+        response = requests.post(
+            url.rstrip("/") + "/api/v1/ingest",
+            json={
+                "financial_rows": financial[start:start + MAX_INGEST_ROWS],
+                "basic_rows": basic[start:start + MAX_INGEST_ROWS]
+            },
+            headers=headers,
+            timeout=300
+        )
+        response.raise_for_status()
+        results.append(response.json())
+
+    return results
+
+
+def main():
+    """
+    Appends new scraper rows (duplicates skipped).
+    Usage: python ingest_run.py [--financial new_financial.csv] [--basic new_basic.csv]
+                                [--url http://localhost:8000] [--token TOKEN]
+    Without --url the raw CSVs are updated directly; a running API picks
+    the rows up on its next request.
+    """
+    args = sys.argv[1:]
+    financial_csv = _option(args, "--financial")
+    basic_csv = _option(args, "--basic")
+    url = _option(args, "--url")
+    token = _option(args, "--token")
+
+    if not financial_csv and not basic_csv:
+        print(main.__doc__)
+        sys.exit(1)
+
+    financial_df = read_rows(financial_csv) if financial_csv else None
+    basic_df = read_rows(basic_csv, encoding=SCRAPER_CSV_OPTIONS["encoding"]) if basic_csv else None
+
+    print("\n📥 INGEST NEW SCRAPER ROWS\n")
+
+    if url:
+        results = post_rows(url, financial_df, basic_df, token)
+    else:
+        results = [ingest(financial_df, basic_df, RAW_FILE, BASIC_FILE)]
+
+    for result in results:
+        for kind in ("financial", "basic"):
+            if kind in result:
+                stats = result[kind]
+                print(
+                    f"✅ {kind}: {stats['appended']:,} appended, "
+                    f"{stats['duplicates']:,} duplicates skipped"
+                )
+        if "financial" in result:
+            financial = result["financial"]
+            print(f"🔖 Dataset version: {financial['dataset_version']} | {financial['sellers']:,} sellers")
+
+
+if __name__ == "__main__":
+    main()
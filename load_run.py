@@ -0,0 +1,125 @@
+# load_run.py
+
+import asyncio
+import json
+import sys
+
+from benchmarks.load_test import (
+    APPS,
+    DEFAULT_MIX,
+    AsgiDriver,
+    HttpDriver,
+    LocalServer,
+    RequestMix,
+    load_app,
+    load_test_report,
+    parse_mix,
+    quiet_app_output,
+    read_products,
+    run_load_test
+)
+
+USAGE = """Usage: python load_run.py [--app api_main|api] [--url URL | --serve [--port P] [--workers N]]
+                        [--mix predict=8,suggest=2,health=1] [--products products.csv]
+                        [--concurrency 1,8,32] [--rate 20,50] [--duration 10] [--requests N]
+                        [--warmup N] [--seed 0] [--output results.json] [--verbose]"""
+
+
+def _option(args, name, default):
+    if name in args:
+        return args[args.index(name) + 1]
+    return default
+
+
+def _numbers(text, cast):
+    return [cast(x) for x in text.split(",") if x.strip()] if text else []
+
+
+def main():
+    """
+    Load test of the pricing API: in-process (default), against a running
+    server (--url) or a uvicorn started for the run (--serve).
+    Prints per-endpoint throughput, p50/p95/p99 latency and error rate;
+    --output writes the same as JSON for comparing runs.
+    The app's own output is hidden unless --verbose.
+    """
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(USAGE)
+        return
+
+    app_name = _option(args, "--app", "api_main")
+    if app_name not in APPS:
+        print(f"❌ Unknown app: {app_name} (available: {list(APPS)})")
+        sys.exit(1)
+
+    url = _option(args, "--url", None)
+    serve = "--serve" in args
+    duration = float(_option(args, "--duration", 10))
+    total_requests = _option(args, "--requests", None)
+    total_requests = int(total_requests) if total_requests else None
+    concurrency_levels = _numbers(_option(args, "--concurrency", None), int)
+    rates = _numbers(_option(args, "--rate", None), float)
+    if not concurrency_levels and not rates:
+        concurrency_levels = [1, 8, 32]
+
+    try:
+        mix = parse_mix(_option(args, "--mix", DEFAULT_MIX[app_name]), app_name)
+        products, weights = read_products(_option(args, "--products", None))
+    except (ValueError, FileNotFoundError, KeyError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    seed = int(_option(args, "--seed", 0))
+    config = {
+        "app": app_name,
+        "target": url or ("uvicorn" if serve else "in-process"),
+        "mix": mix,
+        "products": len(products),
+        "concurrency": concurrency_levels,
+        "rates": rates,
+        "duration_s": duration,
+        "requests": total_requests,
+        "seed": seed
+    }
+
+    print(f"\n🚦 LOAD TEST | {app_name} ({config['target']}) | mix {mix}")
+
+    verbose = "--verbose" in args
+
+    def run(driver, log=None):
+        return asyncio.run(run_load_test(
+            driver,
+            RequestMix(app_name, mix, products, weights, seed=seed),
+            concurrency_levels,
+            rates,
+            duration,
+            total_requests,
+            warmup_requests=int(_option(args, "--warmup", 5)),
+            log=log
+        ))
+
+    max_connections = max(concurrency_levels + [64])
+    if url:
+        stages = run(HttpDriver(url, max_connections))
+    elif serve:
+        port = int(_option(args, "--port", 8765))
+        workers = int(_option(args, "--workers", 1))
+        print(f"⏳ Starting uvicorn on port {port}...")
+        with LocalServer(app_name, port, workers, quiet=not verbose) as server:
+            stages = run(HttpDriver(server.url, max_connections))
+    elif verbose:
+        stages = run(AsgiDriver(load_app(app_name)))
+    else:
+        with quiet_app_output() as terminal:
+            stages = run(AsgiDriver(load_app(app_name)), terminal)
+
+    output = _option(args, "--output", None)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(load_test_report(config, stages), f, indent=2)
+        print(f"\n💾 Results → {output}")
+
+
+if __name__ == "__main__":
+    main()
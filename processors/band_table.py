@@ -0,0 +1,321 @@
+# processors/band_table.py
+
+import bisect
+import contextlib
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from processors.l1_pipeline import run_l1_pipeline
+from processors.seller_quantity_analysis import QUANTITY_TOLERANCE, QuantityIndex, priced_bids
+from utils.dataset import (
+    BASIC_FILE,
+    QUANTITY_CONTEXT,
+    RAW_FILE,
+    get_dataset,
+    get_quantity_index,
+    source_version
+)
+from utils.prediction_executor import POOL_SIZE, warm_worker
+
+PRODUCT_ITEMS_FILE = "data/processed/product_items.csv"
+BAND_TABLE_FILE = os.environ.get("PRICING_BAND_TABLE", "data/processed/l1_band_table.json")
+
+PREDICTION_BASIS = "filtered_company.csv (L1 percentile pricing)"
+
+# Bumped when stored entries change meaning (2: quantity profiles from parsed prices)
+TABLE_FORMAT_VERSION = 2
+
+
+def canonical_key(product: str) -> str:
+    """Lookup key of a canonical product name (upper case, single spaces)"""
+    return " ".join(str(product).upper().split())
+
+
+def band_summary(company_df: pd.DataFrame) -> dict:
+    """
+    Confidence, competitor count and top 5 competitors (cheapest
+    recommended price first) of a company_check table.
+    """
+    data_points = len(company_df)
+
+    top_competitors = []
+    for _, row in company_df.sort_values("recommended_price").head(5).iterrows():
+        top_competitors.append({
+            "seller_name": row["Seller Name"],
+            "average_bidding_price": round(float(row["average"]), 2),
+            "inflation_rate_percent": round(float(row["inflation_rate_percent"]), 2),
+            "last_l1_price": round(float(row["last_ranked_price"]), 2),
+            "least_quoted_price": round(float(row["least_price"]), 2)
+        })
+
+    return {
+        "confidence": f"{min(95, 50 + (data_points * 5))}%",
+        "competitors_analyzed": data_points,
+        "top_competitors": top_competitors
+    }
+
+
+# ===========================
+# Quantity profile
+# ===========================
+
+def quantity_profile(quantity_index: QuantityIndex, filtered_df: pd.DataFrame) -> dict:
+    """
+    Everything similar_quantity_count needs, for ANY requested quantity:
+    basic-row quantities of the matched bids (sorted, unique) with the
+    cumulative number of (price row, basic row) pairs.
+    """
+    price_bids = priced_bids(filtered_df)
+
+    weights = pd.Series(quantity_index.bid_nos).map(price_bids.value_counts()).fillna(0).to_numpy()
+    matched = weights > 0
+    quantities = quantity_index.quantities[matched]
+    weights = weights[matched].astype(np.int64)
+
+    if len(quantities) == 0:
+        return {"quantities": [], "cumulative": []}
+
+    unique, starts = np.unique(quantities, return_index=True)
+    return {
+        "quantities": unique.tolist(),
+        "cumulative": np.cumsum(np.add.reduceat(weights, starts)).tolist()
+    }
+
+
+def profile_similar_count(profile: dict, user_quantity: float, tolerance: float = QUANTITY_TOLERANCE) -> int:
+    """Same count as quantity_context, from a stored profile (O(log n))"""
+    lower, upper = user_quantity * (1 - tolerance), user_quantity * (1 + tolerance)
+    quantities, cumulative = profile["quantities"], profile["cumulative"]
+
+    start = bisect.bisect_left(quantities, lower)
+    stop = bisect.bisect_right(quantities, upper)
+    if stop <= start:
+        return 0
+
+    return cumulative[stop - 1] - (cumulative[start - 1] if start else 0)
+
+
+# ===========================
+# Offline job
+# ===========================
+
+def price_product(product: str, raw_file: str = RAW_FILE, basic_file: str = BASIC_FILE) -> dict:
+    """
+    Full L1 pipeline for one canonical product (runs in a job worker).
+    RETURNS: table entry, or {"status": "no_match" / "error"}
+    """
+    start = time.perf_counter()
+    entry = {"product": product}
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):     # per-product band printout
+            filtered_df = get_dataset(raw_file).filter(product)
+            if filtered_df.empty:
+                entry["status"] = "no_match"
+            else:
+                pipeline = run_l1_pipeline(filtered_df, 1, with_quantity_context=False)
+                quantity_index = get_quantity_index(basic_file) if QUANTITY_CONTEXT else None
+
+                entry.update({
+                    "status": "ok",
+                    "low_price": round(pipeline["low_price"], 2),
+                    "high_price": round(pipeline["high_price"], 2),
+                    **band_summary(pipeline["company_df"]),
+                    "quantity_profile": (
+                        quantity_profile(quantity_index, filtered_df)
+                        if quantity_index is not None else None
+                    )
+                })
+    except Exception as e:
+        entry.update({"status": "error", "message": str(e)})
+
+    entry["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return entry
+
+
+def read_product_items(product_items_csv: str = PRODUCT_ITEMS_FILE) -> list:
+    """Canonical product names (one per key)"""
+    products = pd.read_csv(product_items_csv)["product_item"].dropna().astype(str)
+    return list({canonical_key(p): p for p in products if canonical_key(p)}.values())
+
+
+def build_band_table(
+    product_items_csv: str = PRODUCT_ITEMS_FILE,
+    output_file: str = BAND_TABLE_FILE,
+    raw_file: str = RAW_FILE,
+    basic_file: str = BASIC_FILE,
+    workers: int = POOL_SIZE
+) -> dict:
+    """
+    Materializes the L1 band of every canonical product.
+
+    - Products are priced in parallel (process pool, dataset loaded
+      once per worker)
+    - The table is stamped with the raw/basic file versions it was
+      built from; the API ignores it once either file changes
+    - Wall time and per-product timings are stored with the table
+    """
+    products = read_product_items(product_items_csv)
+    versions = {
+        "dataset_version": source_version(raw_file),
+        "basic_version": source_version(basic_file)
+    }
+
+    print(f"🧮 Pricing {len(products):,} canonical products on {workers} workers...")
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(
+        max_workers=max(1, workers),
+        initializer=warm_worker,
+        initargs=(raw_file, basic_file)
+    ) as pool:
+        job = partial(price_product, raw_file=raw_file, basic_file=basic_file)
+        chunksize = max(1, len(products) // (max(1, workers) * 16))
+        entries = list(pool.map(job, products, chunksize=chunksize))
+
+    wall_time = time.perf_counter() - start
+
+    timings = [entry["elapsed_ms"] for entry in entries]
+    table = {
+        "format_version": TABLE_FORMAT_VERSION,
+        **versions,
+        "built_at": datetime.now().isoformat(),
+        "workers": workers,
+        "wall_time_s": round(wall_time, 3),
+        "timing_ms": {
+            "mean": round(float(np.mean(timings)), 2) if timings else 0.0,
+            "p50": round(float(np.percentile(timings, 50)), 2) if timings else 0.0,
+            "p95": round(float(np.percentile(timings, 95)), 2) if timings else 0.0,
+            "max": round(float(np.max(timings)), 2) if timings else 0.0
+        },
+        "products": {
+            canonical_key(entry["product"]): entry
+            for entry in entries if entry["status"] == "ok"
+        },
+        "skipped": [
+            {k: entry[k] for k in ("product", "status", "message", "elapsed_ms") if k in entry}
+            for entry in entries if entry["status"] != "ok"
+        ]
+    }
+
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    temp_file = output_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(table, f)
+    os.replace(temp_file, output_file)
+
+    print(f"✅ Band table built | {len(table['products']):,} products, "
+          f"{len(table['skipped']):,} skipped in {wall_time:.2f}s → {output_file}")
+    print(f"⏱️  Per product: mean {table['timing_ms']['mean']}ms, "
+          f"p95 {table['timing_ms']['p95']}ms, max {table['timing_ms']['max']}ms")
+    for entry in sorted(entries, key=lambda e: e["elapsed_ms"], reverse=True)[:5]:
+        print(f"   {entry['elapsed_ms']:>9.2f}ms  {entry['product']}")
+
+    return table
+
+
+# ===========================
+# API lookup
+# ===========================
+
+class BandTable:
+    """
+    Materialized bands, looked up by exact canonical product name (O(1)).
+
+    An entry is served only while the raw and basic files still have the
+    versions the table was built from; otherwise lookup() returns None
+    and the caller computes live.
+    """
+
+    def __init__(self, table: dict, source_file: str = None):
+        self.products = table["products"]
+        self.dataset_version = table["dataset_version"]
+        self.basic_version = table["basic_version"]
+        self.built_at = table.get("built_at")
+        self.source_file = source_file
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+
+    @classmethod
+    def load(cls, path: str = BAND_TABLE_FILE):
+        """BandTable from the job output (None when not built yet or built by an older format)"""
+        if not os.path.exists(path):
+            return None
+
+        with open(path, encoding="utf-8") as f:
+            table = json.load(f)
+
+        if table.get("format_version") != TABLE_FORMAT_VERSION:
+            print(f"⚠️  Band table {path} has an old format, ignored (re-run band_table_run.py)")
+            return None
+
+        return cls(table, path)
+
+    def __len__(self):
+        return len(self.products)
+
+    def lookup(
+        self,
+        product: str,
+        quantity: int,
+        dataset_version,
+        basic_version,
+        with_quantity_context: bool = True
+    ):
+        """Prediction result (same fields as the live one) or None"""
+        entry = self.products.get(canonical_key(product))
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+            if (dataset_version, basic_version) != (self.dataset_version, self.basic_version):
+                self._stale += 1
+                return None
+            self._hits += 1
+
+        profile = entry["quantity_profile"]
+        similar = (
+            profile_similar_count(profile, quantity)
+            if with_quantity_context and profile is not None else None
+        )
+
+        return {
+            "product": product,
+            "quantity": quantity,
+            "low_price": entry["low_price"],
+            "high_price": entry["high_price"],
+            "price_type": "TOTAL_CONTRACT",
+            "confidence": entry["confidence"],
+            "basis": PREDICTION_BASIS,
+            "competitors_analyzed": entry["competitors_analyzed"],
+            "top_competitors": [dict(c) for c in entry["top_competitors"]],
+            "similar_quantity_count": similar,
+            "fuzzy_matches": None,
+            "timestamp": datetime.now().isoformat(),
+            "warnings": None
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "loaded": True,
+                "products": len(self.products),
+                "built_at": self.built_at,
+                "dataset_version": self.dataset_version,
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale": self._stale
+            }
@@ -0,0 +1,209 @@
+# processors/catalog_pipeline.py
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+import pandas as pd
+
+from config.columns import OFFERED_ITEM_COLUMN
+from processors.extract_product_items import normalize_for_raw
+from processors.product_fingerprint import fingerprint
+from utils.csv_tail import iter_csv_chunks, prefix_signature
+from utils.dataset import RAW_FILE, source_version
+from utils.financial_cache import CHUNK_ROWS
+from utils.prediction_executor import POOL_SIZE
+
+CATALOG_FILE = "data/processed/product_items.csv"
+CATALOG_STATE_FILE = os.environ.get("PRICING_CATALOG_STATE", "data/processed/product_catalog_state.json")
+CATALOG_STATE_VERSION = 1  # bump when normalization / fingerprint rules change
+
+# Items that read back as missing from product_items_raw.csv (two-pass tools skip them)
+MISSING_ITEMS = {"NULL", "NA", "N/A", "#N/A", "#NA", "<NA>", "NAN"}
+
+
+def better_variant(a: str, b: str) -> str:
+    """
+    Reducer: the longest (most descriptive) variant, ties → alphabetical first.
+    Order-independent, so chunks can be reduced in any order.
+    """
+    if len(a) != len(b):
+        return a if len(a) > len(b) else b
+    return min(a, b)
+
+
+def merge_variants(groups: dict, other: dict) -> dict:
+    """Merges fingerprint → best variant maps into groups (in place)"""
+    for key, variant in other.items():
+        current = groups.get(key)
+        groups[key] = variant if current is None else better_variant(current, variant)
+    return groups
+
+
+def offered_item_variants(offered_items) -> dict:
+    """
+    "Offered Item" cells → {fingerprint: best normalized variant}
+    (normalize_for_raw + fingerprint, same rules as
+    extract_raw_product_items → fast_canonicalize). Runs in pool workers.
+    """
+    groups = {}
+    seen = set()
+
+    for value in offered_items:
+        clean_value = str(value).replace("Item Categories :", "").strip()
+
+        for item in clean_value.split(","):
+            item = item.strip()
+            if not item or item in seen:
+                continue
+            seen.add(item)
+
+            variant = normalize_for_raw(item)
+            if variant in MISSING_ITEMS:
+                continue
+
+            key = fingerprint(variant)
+            if key:
+                merge_variants(groups, {key: variant})
+
+    return groups
+
+
+def _offered_item_column(name) -> bool:
+    return str(name).strip() == OFFERED_ITEM_COLUMN
+
+
+def _chunk_items(chunk: pd.DataFrame) -> list:
+    """Distinct non-empty Offered Item cells of a chunk"""
+    return chunk.iloc[:, 0].dropna().astype(str).unique().tolist()
+
+
+def load_catalog_state(state_file: str = CATALOG_STATE_FILE):
+    """Saved reducer state, or None (missing / other rules version)"""
+    if not os.path.exists(state_file):
+        return None
+
+    with open(state_file, encoding="utf-8") as f:
+        state = json.load(f)
+
+    if state.get("state_version") != CATALOG_STATE_VERSION:
+        return None
+    return state
+
+
+def _write_json(path: str, data: dict):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_file = path + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(temp_file, path)
+
+
+def _is_append(raw_file: str, state: dict) -> bool:
+    """The bytes the saved state covers are still the CSV's prefix (see CsvTail.is_append)"""
+    if state.get("source_file") != raw_file or os.path.getsize(raw_file) < state["offset"]:
+        return False
+    return prefix_signature(raw_file, state["offset"]) == state.get("signature")
+
+
+def build_catalog(
+    raw_file: str = RAW_FILE,
+    output_csv: str = CATALOG_FILE,
+    state_file: str = CATALOG_STATE_FILE,
+    workers: int = POOL_SIZE,
+    chunk_rows: int = CHUNK_ROWS,
+    full: bool = False
+) -> dict:
+    """
+    Canonical product catalog straight from the financial CSV
+    (one pass, no product_items_raw.csv).
+
+    - The CSV is read in chunks (Offered Item column only); each chunk is
+      normalized + fingerprinted in a process pool and reduced to
+      fingerprint → best variant, merged as chunks finish
+    - Reducer state and the byte offset read so far are saved in
+      state_file: the next run reads only rows appended since
+      (full=True, new rules or a CSV whose already-read bytes changed
+      — replaced, truncated, rewritten — rebuild everything)
+    - Writes output_csv (product_item column, same as fast_canonicalize)
+
+    RETURNS: run summary
+    """
+    if not os.path.exists(raw_file):
+        raise FileNotFoundError(f"Financial data file not found: {raw_file}")
+
+    state = None if full else load_catalog_state(state_file)
+    if state is not None and not _is_append(raw_file, state):
+        print("⚠️ Source CSV replaced or rewritten → full rebuild")
+        state = None
+
+    incremental = state is not None
+    groups = state["groups"] if incremental else {}
+    offset = state["offset"] if incremental else 0
+
+    start = time.perf_counter()
+    chunks, end_offset = iter_csv_chunks(
+        raw_file, offset, chunk_rows,
+        usecols=_offered_item_column,
+        dtype=str,
+        on_bad_lines="skip"
+    )
+
+    rows = 0
+    chunk_count = 0
+    workers = max(1, workers)
+
+    if workers == 1:
+        for chunk in chunks:
+            rows += len(chunk)
+            chunk_count += 1
+            merge_variants(groups, offered_item_variants(_chunk_items(chunk)))
+    else:
+        # At most 2 chunks per worker in flight (memory ~ a few chunks)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            for chunk in chunks:
+                rows += len(chunk)
+                chunk_count += 1
+                pending.add(pool.submit(offered_item_variants, _chunk_items(chunk)))
+
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        merge_variants(groups, future.result())
+
+            for future in pending:
+                merge_variants(groups, future.result())
+
+    elapsed = time.perf_counter() - start
+
+    products = sorted(set(groups.values()))
+    os.makedirs(os.path.dirname(output_csv) or ".", exist_ok=True)
+    pd.DataFrame(products, columns=["product_item"]).to_csv(output_csv, index=False)
+
+    _write_json(state_file, {
+        "state_version": CATALOG_STATE_VERSION,
+        "source_file": raw_file,
+        "source_version": source_version(raw_file),
+        "offset": end_offset,
+        "signature": prefix_signature(raw_file, end_offset),
+        "updated_at": datetime.now().isoformat(),
+        "groups": groups
+    })
+
+    summary = {
+        "mode": "incremental" if incremental else "full",
+        "rows_read": rows,
+        "chunks": chunk_count,
+        "workers": workers,
+        "products": len(products),
+        "elapsed_s": round(elapsed, 3)
+    }
+
+    print(f"⚡ Catalog {summary['mode']} | {rows:,} rows in {chunk_count} chunks "
+          f"on {workers} workers, {elapsed:.2f}s")
+    print(f"📄 Canonical products: {len(products):,} → {output_csv}")
+
+    return summary
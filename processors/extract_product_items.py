@@ -3,6 +3,8 @@
 import pandas as pd
 import re
 
+from utils.financial_cache import CACHE_DIR, load_financial_frame
+
 
 def singularize_word(word: str) -> str:
     """
@@ -53,12 +55,18 @@ def normalize_for_raw(name: str) -> str:
     return " ".join(words)
 
 
-def extract_raw_product_items(input_csv: str, output_csv: str):
+def extract_raw_product_items(
+    input_csv: str,
+    output_csv: str,
+    cache_dir: str = CACHE_DIR,
+    use_cache: bool = True
+):
     """
     Generates a CLEAN, DE-DUPLICATED product_items_raw.csv
+    (use_cache=False for one-off inputs: nothing written to cache_dir)
     """
 
-    df = pd.read_csv(input_csv, on_bad_lines="skip", low_memory=False)
+    df = load_financial_frame(input_csv, cache_dir, use_cache)
     df.columns = df.columns.str.strip()
 
     if "Offered Item" not in df.columns:
@@ -0,0 +1,89 @@
+# processors/l1_pipeline.py
+
+import os
+
+import pandas as pd
+
+from processors.seller_aggregate import QUANTILE_MODE, aggregate_sellers
+from processors.seller_quantity_analysis import QuantityIndex, quantity_context
+from processors.l1_price_band import compute_l1_price_band
+from utils.metrics import StageTimer, timed
+
+
+def run_l1_pipeline(
+    filtered_df: pd.DataFrame,
+    user_quantity: int,
+    basic_csv: str = None,
+    export_filtered_csv: str = None,
+    export_company_check_csv: str = None,
+    quantity_index: QuantityIndex = None,
+    with_quantity_context: bool = True,
+    quantile_mode: str = QUANTILE_MODE,
+    stages: StageTimer = None
+) -> dict:
+    """
+    Runs the full L1 pricing pipeline IN MEMORY.
+
+    filtered competitors → quantity context → seller statistics
+    (average, inflation, last ranked, least and final price in one
+    fused pass, see seller_aggregate.py) → L1 band
+
+    No intermediate CSVs are written. Pass export_* paths to persist
+    filtered_company.csv / company_check.csv as a final export.
+
+    Quantity context uses the resident quantity_index when given
+    (otherwise basic_csv is indexed for this call);
+    with_quantity_context=False skips the stage (neutral factor).
+    quantile_mode="sketch" uses per-seller quantile sketches.
+    stages records the quantity / aggregate / band stage timings.
+
+    RETURNS: dict with company_df, low_price, high_price,
+             quantity_factor, similar_quantity_count and warnings
+    """
+    warnings = []
+    quantity_factor = 1.0
+    similar_quantity_count = None
+
+    # Quantity context (NO rescaling)
+    if with_quantity_context:
+        try:
+            with timed(stages, "quantity"):
+                if quantity_index is None:
+                    if not basic_csv or not os.path.exists(basic_csv):
+                        raise FileNotFoundError(f"Basic data file not found: {basic_csv}")
+                    quantity_index = QuantityIndex.from_csv(basic_csv)
+
+                context = quantity_context(quantity_index, filtered_df, user_quantity)
+
+            quantity_factor = context["quantity_factor"]
+            similar_quantity_count = context["similar_quantity_count"]
+
+            if quantity_factor != 1.0:
+                warnings.append(f"Unexpected quantity factor: {quantity_factor} (expected 1.0)")
+        except Exception as e:
+            warnings.append(f"Quantity analysis failed: {str(e)}. Using neutral factor.")
+            quantity_factor = 1.0
+
+    # Seller statistics + final price, then L1 band
+    with timed(stages, "aggregate"):
+        company_df = aggregate_sellers(filtered_df, quantile_mode)
+    with timed(stages, "band"):
+        low_price, high_price = compute_l1_price_band(company_df)
+
+    if stages is not None:
+        stages.count("sellers_aggregated", len(company_df))
+
+    # Optional final export
+    if export_filtered_csv:
+        filtered_df.to_csv(export_filtered_csv, index=False)
+    if export_company_check_csv:
+        company_df.to_csv(export_company_check_csv, index=False)
+
+    return {
+        "company_df": company_df,
+        "low_price": low_price,
+        "high_price": high_price,
+        "quantity_factor": quantity_factor,
+        "similar_quantity_count": similar_quantity_count,
+        "warnings": warnings
+    }
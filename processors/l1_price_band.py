@@ -5,7 +5,7 @@ import pandas as pd
 
 
 
-def calculate_l1_price_band(company_check_csv: str):
+def compute_l1_price_band(df: pd.DataFrame):
     """
     🔥 L1-SPECIFIC LEARNING:
     - Uses BOTTOM 5-10 PERCENTILE (not minimum)
@@ -17,8 +17,6 @@ def calculate_l1_price_band(company_check_csv: str):
     RETURNS: (low_price, high_price) as TOTAL CONTRACT prices
     """
 
-    df = pd.read_csv(company_check_csv)
-
     if "recommended_price" not in df.columns:
         raise ValueError("recommended_price column missing")
 
@@ -56,3 +54,12 @@ def calculate_l1_price_band(company_check_csv: str):
 
     return low_price, high_price
 
+
+def calculate_l1_price_band(company_check_csv: str):
+    """
+    File-based wrapper around compute_l1_price_band.
+    """
+
+    df = pd.read_csv(company_check_csv)
+
+    return compute_l1_price_band(df)
@@ -1,6 +1,10 @@
 # processors/product_fingerprint.py
 
 import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
 
 STOPWORDS = {
     "PACK", "PCS", "NOS", "NO", "UNIT", "UNITS",
@@ -8,6 +12,13 @@ STOPWORDS = {
     "ML", "MG", "GM", "KG", "OF", "AND", "WITH"
 }
 
+# Bounded memo for single fingerprint() calls (most recent item names)
+FINGERPRINT_CACHE_SIZE = 65536
+
+PARENTHESES_RE = re.compile(r"\(.*?\)")
+NUMBER_RE = re.compile(r"\b\d+(\.\d+)?\b")
+SPLIT_RE = re.compile(r"[\s,/]+")
+
 def normalize_word(word: str) -> str:
     """
     Normalize a word by converting common plurals to singular.
@@ -31,12 +42,17 @@ def fingerprint(name) -> str:
     if not name or name.lower() == "nan":
         return ""
     
+    return _fingerprint_text(name)
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def _fingerprint_text(name: str) -> str:
+    """Cached core of fingerprint() (lru_cache is thread-safe)"""
     name = name.upper()
     
-    name = re.sub(r"\(.*?\)", "", name)
-    name = re.sub(r"\b\d+(\.\d+)?\b", "", name)
+    name = PARENTHESES_RE.sub("", name)
+    name = NUMBER_RE.sub("", name)
     
-    tokens = re.split(r"[\s,/]+", name)
+    tokens = SPLIT_RE.split(name)
     
     clean_tokens = [
         normalize_word(t) for t in tokens
@@ -46,3 +62,33 @@ def fingerprint(name) -> str:
     clean_tokens.sort()
     
     return " ".join(clean_tokens)
+
+def fingerprint_many(names) -> pd.Series:
+    """
+    Batch fingerprint for a column of names.
+    Each distinct name is fingerprinted once; result is aligned to the input.
+    """
+    names = pd.Series(names)
+    codes, uniques = pd.factorize(names)
+
+    unique_fps = [fingerprint(name) for name in uniques]
+    unique_fps.append(fingerprint(None))  # code -1 = missing
+
+    return pd.Series(
+        np.array(unique_fps, dtype=object)[codes],
+        index=names.index,
+        dtype=object
+    )
+
+def fingerprint_cache_info() -> dict:
+    """Hit/miss counters of the single-call memo cache"""
+    info = _fingerprint_text.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize
+    }
+
+def clear_fingerprint_cache():
+    _fingerprint_text.cache_clear()
@@ -0,0 +1,185 @@
+# processors/seller_aggregate.py
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from processors.seller_l1_price import MAX_RANK
+from utils.compact_frame import rank_numbers
+from utils.price_cleaner import clean_price_series
+from utils.quantile_sketch import grouped_sketch, is_sketch, merge_sketches, sketch_quantiles
+
+# Seller 10th percentile: "exact" (every price kept) or "sketch"
+# (mergeable log-bucket summary, ±PRICING_SKETCH_ACCURACY, see utils/quantile_sketch.py)
+QUANTILE_MODE = os.environ.get("PRICING_QUANTILE_MODE", "exact")
+
+# company_check.csv layout
+COMPANY_CHECK_COLUMNS = [
+    "S.No.", "bid_no", "Seller Name",
+    "average", "bid_count", "inflation_rate_percent",
+    "last_ranked_price", "least_price", "recommended_price"
+]
+
+# Per-seller partial state (mergeable across chunks, indexed by seller name)
+PARTIAL_COLUMNS = ["S.No.", "bid_no", "bid_count", "least_price", "best_rank", "last_ranked_price"]
+
+
+def _rank_numbers(df: pd.DataFrame) -> np.ndarray:
+    """L1..L20 → 1..20 (0 = other), from rank_no / rank_norm / Rank"""
+    if "rank_no" in df.columns:
+        return df["rank_no"].to_numpy()
+    if "rank_norm" in df.columns:
+        return rank_numbers(df["rank_norm"]).to_numpy()
+    if "Rank" in df.columns:
+        return rank_numbers(df["Rank"]).to_numpy()
+    return np.zeros(len(df), dtype=np.int8)
+
+
+def _plain(values: pd.Series) -> pd.Series:
+    """Categorical (compact dataset) → plain values"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.astype(values.cat.categories.dtype)
+    return values
+
+
+def seller_partials(filtered_df: pd.DataFrame, quantile_mode: str = QUANTILE_MODE):
+    """
+    One groupby over the matched rows → per-seller partial state.
+
+    RETURNS: (partial, seller_prices)
+    - partial: PARTIAL_COLUMNS indexed by seller name (sorted)
+    - seller_prices: every valid price, indexed by seller name
+      (kept for the exact 10th percentile), or with
+      quantile_mode="sketch" a per-seller quantile sketch
+    """
+    if quantile_mode not in ("exact", "sketch"):
+        raise ValueError(f"Unknown quantile mode: {quantile_mode}")
+
+    df = filtered_df.rename(columns=lambda c: c.strip())
+
+    prices = df["clean_price"] if "clean_price" in df.columns else clean_price_series(df["Total Price"])
+    valid = prices.notna().to_numpy() & df["Seller Name"].notna().to_numpy()
+
+    rows = df[valid]
+    prices = prices[valid].astype("float64").to_numpy()
+
+    # Sorted seller codes (same order as groupby("Seller Name"))
+    codes, sellers = pd.factorize(_plain(rows["Seller Name"]), sort=True)
+    grouped = pd.Series(prices).groupby(codes, sort=True)
+
+    partial = rows[["S.No.", "bid_no"]].groupby(codes, sort=True).first()
+    partial["bid_no"] = _plain(partial["bid_no"])
+    partial["bid_count"] = grouped.size()
+    partial["least_price"] = grouped.min()
+
+    # Best rank per seller (L1 first) and the last price at that rank
+    ranks = _rank_numbers(rows)
+    ranked = (ranks >= 1) & (ranks <= MAX_RANK)
+    ranked_codes = codes[ranked]
+    ranked_ranks = pd.Series(ranks[ranked].astype(np.int16), index=ranked_codes)
+    best_rank = ranked_ranks.groupby(level=0).transform("min").to_numpy()
+    at_best = ranked_ranks.to_numpy() == best_rank
+
+    partial["best_rank"] = ranked_ranks.groupby(level=0).min().reindex(partial.index).astype("float64")
+    partial["last_ranked_price"] = (
+        pd.Series(prices[ranked][at_best])
+        .groupby(ranked_codes[at_best])
+        .last()
+        .reindex(partial.index)
+    )
+
+    partial.index = sellers
+    if quantile_mode == "sketch":
+        seller_prices = grouped_sketch(sellers.take(codes), prices)
+    else:
+        seller_prices = pd.Series(prices, index=sellers.take(codes))
+
+    return partial[PARTIAL_COLUMNS], seller_prices
+
+
+def merge_seller_partials(earlier: pd.DataFrame, later: pd.DataFrame) -> pd.DataFrame:
+    """
+    Merges two partial states (earlier rows first).
+    first S.No./bid_no and "last price at best rank" keep row order.
+    """
+    both = pd.concat([earlier, later])
+    grouped = both.groupby(level=0, sort=True)
+
+    merged = grouped[["S.No.", "bid_no"]].first()
+    merged["bid_count"] = grouped["bid_count"].sum()
+    merged["least_price"] = grouped["least_price"].min()
+    merged["best_rank"] = grouped["best_rank"].min()
+
+    at_best = both[both["best_rank"] == grouped["best_rank"].transform("min")]
+    merged["last_ranked_price"] = (
+        at_best.groupby(level=0)["last_ranked_price"].last().reindex(merged.index)
+    )
+
+    return merged[PARTIAL_COLUMNS]
+
+
+def merge_seller_prices(*parts: pd.Series) -> pd.Series:
+    """Combines seller_prices of several chunks/shards (raw prices or sketches)"""
+    if is_sketch(parts[0]):
+        return merge_sketches(*parts)
+    return pd.concat(parts)
+
+
+def final_prices(average, inflation_rate_percent, least_price) -> list:
+    """
+    max(inflated average, least_price) rounded to paise, per seller.
+    Python round() on each value, as add_final_price does: np.round
+    differs on some halves (172390.0 at 72.15% → 296769.39, np.round gives .38).
+    """
+    inflated = np.asarray(average, dtype="float64") * (1 + np.asarray(inflation_rate_percent, dtype="float64") / 100)
+    least = np.asarray(least_price, dtype="float64")
+
+    return [round(max(price, floor), 2) for price, floor in zip(inflated.tolist(), least.tolist())]
+
+
+def finish_seller_table(partial: pd.DataFrame, seller_prices: pd.Series) -> pd.DataFrame:
+    """
+    Partial state → company_check table:
+    10th percentile, inflation and recommended price.
+    """
+    result = partial[["S.No.", "bid_no"]].copy()
+    result.insert(2, "Seller Name", partial.index)
+    if is_sketch(seller_prices):
+        result["average"] = sketch_quantiles(seller_prices, 0.10)
+    else:
+        result["average"] = seller_prices.groupby(level=0, sort=True).quantile(0.10)
+    result["bid_count"] = partial["bid_count"]
+
+    # Inflation vs the market average of seller averages
+    market_average = result["average"].mean()
+    result["inflation_rate_percent"] = (
+        ((result["average"] - market_average) / market_average) * 100
+    ).round(2)
+
+    result["last_ranked_price"] = partial["last_ranked_price"]
+    result["least_price"] = partial["least_price"]
+
+    # Final price: max(inflated average, least_price) rounded to paise
+    result["recommended_price"] = final_prices(
+        result["average"], result["inflation_rate_percent"], result["least_price"]
+    )
+
+    return result[COMPANY_CHECK_COLUMNS].reset_index(drop=True)
+
+
+def aggregate_sellers(filtered_df: pd.DataFrame, quantile_mode: str = QUANTILE_MODE) -> pd.DataFrame:
+    """
+    Fused seller statistics: one factorization of "Seller Name", one groupby.
+
+    Same output as compute_seller_average → add_inflation_rate →
+    add_last_ranked_price → add_least_price → add_final_price
+    (company_check.csv column-for-column):
+    - average: 10th percentile, bid_count, least_price: min
+    - last_ranked_price: last L1 price, else last price of the best rank L2..L20
+    - recommended_price: average inflated, floored at least_price
+      (no quantity factor: prices are total contract prices)
+
+    quantile_mode="sketch" approximates the 10th percentile (see QUANTILE_MODE).
+    """
+    return finish_seller_table(*seller_partials(filtered_df, quantile_mode))
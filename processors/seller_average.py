@@ -1,9 +1,10 @@
 # processors/seller_average.py
 
 import pandas as pd
-from utils.price_cleaner import clean_price
+from utils.price_cleaner import clean_price_series
 
-def generate_seller_average(input_csv, output_csv):
+
+def compute_seller_average(filtered_df: pd.DataFrame) -> pd.DataFrame:
     """
     🔥 L1-SPECIFIC LEARNING:
     - Uses BOTTOM 10th PERCENTILE instead of average
@@ -11,35 +12,56 @@ def generate_seller_average(input_csv, output_csv):
     - Ignores high-value/catalog prices
     
     CRITICAL: All prices here are TOTAL CONTRACT prices.
+
+    DataFrame in (filtered competitors) → DataFrame out (company_check).
+    A categorical "Seller Name" (compact dataset) is grouped on its codes.
     """
-    df = pd.read_csv(input_csv)
+    df = filtered_df.copy()
     df.columns = df.columns.str.strip()
 
-    df["clean_price"] = df["Total Price"].apply(clean_price)
+    if "clean_price" not in df.columns:
+        df["clean_price"] = clean_price_series(df["Total Price"])
     df = df[df["clean_price"].notna()]
 
     # 🔑 L1 LOGIC: Use 10th percentile (bottom 10%) instead of mean
     # This captures L1-winning bid behavior
     l1_percentile_df = (
-        df.groupby("Seller Name", as_index=False)["clean_price"]
+        df.groupby("Seller Name", as_index=False, observed=True)["clean_price"]
         .quantile(0.10)  # Bottom 10% = L1-adjacent pricing
         .rename(columns={"clean_price": "average"})
     )
 
     # Count number of bids per seller (for filtering experienced bidders)
     bid_count_df = (
-        df.groupby("Seller Name", as_index=False)
+        df.groupby("Seller Name", as_index=False, observed=True)
         .size()
         .rename(columns={"size": "bid_count"})
     )
 
     meta_df = (
-        df.groupby("Seller Name", as_index=False)
+        df.groupby("Seller Name", as_index=False, observed=True)
         .first()[["S.No.", "bid_no", "Seller Name"]]
     )
 
     result = meta_df.merge(l1_percentile_df, on="Seller Name")
     result = result.merge(bid_count_df, on="Seller Name")
+
+    # One row per seller → decode categorical keys back to plain values
+    for column in ["bid_no", "Seller Name"]:
+        if isinstance(result[column].dtype, pd.CategoricalDtype):
+            result[column] = result[column].astype(result[column].cat.categories.dtype)
+
+    return result
+
+
+def generate_seller_average(input_csv, output_csv):
+    """
+    File-based wrapper around compute_seller_average.
+    Reads filtered_company.csv, writes company_check.csv.
+    """
+    df = pd.read_csv(input_csv)
+
+    result = compute_seller_average(df)
     
     try:
         result.to_csv(output_csv, index=False)
@@ -53,4 +75,3 @@ def generate_seller_average(input_csv, output_csv):
 
     print(f"✅ L1-specific pricing generated using 10th percentile (not average)")
     return result
-
@@ -3,12 +3,7 @@
 import pandas as pd
 
 
-
-
-def enrich_with_final_price(
-    company_check_csv: str,
-    quantity_factor: float
-):
+def add_final_price(company_df: pd.DataFrame, quantity_factor: float) -> pd.DataFrame:
     """
     🔥 CRITICAL CHANGE:
     - Treats all prices as TOTAL CONTRACT prices
@@ -17,7 +12,7 @@ def enrich_with_final_price(
     - Uses least_price as floor (actual market minimum)
     """
 
-    df = pd.read_csv(company_check_csv)
+    df = company_df.copy()
 
     recommended_prices = []
 
@@ -38,7 +33,21 @@ def enrich_with_final_price(
         recommended_prices.append(round(price, 2))
 
     df["recommended_price"] = recommended_prices
+
+    return df
+
+
+def enrich_with_final_price(
+    company_check_csv: str,
+    quantity_factor: float
+):
+    """
+    File-based wrapper around add_final_price (in-place on company_check.csv).
+    """
+
+    df = pd.read_csv(company_check_csv)
+
+    df = add_final_price(df, quantity_factor)
     df.to_csv(company_check_csv, index=False)
 
     print("✅ Final recommended_price calculated (TOTAL CONTRACT basis)")
-
@@ -3,17 +3,17 @@
 import pandas as pd
 
 
-def enrich_company_check_with_inflation(company_check_csv):
+def add_inflation_rate(company_df: pd.DataFrame) -> pd.DataFrame:
     """
     Computes inflation_rate_percent using INTERNAL market_average.
-    market_average is NOT stored in CSV.
+    market_average is NOT stored in the output.
     """
 
-    df = pd.read_csv(company_check_csv)
-
-    if "average" not in df.columns:
+    if "average" not in company_df.columns:
         raise ValueError("Missing 'average' column")
 
+    df = company_df.copy()
+
     # INTERNAL ONLY
     market_average = df["average"].mean()
 
@@ -23,6 +23,18 @@ def enrich_company_check_with_inflation(company_check_csv):
 
     df["inflation_rate_percent"] = df["inflation_rate_percent"].round(2)
 
+    return df
+
+
+def enrich_company_check_with_inflation(company_check_csv):
+    """
+    File-based wrapper around add_inflation_rate (in-place on company_check.csv).
+    """
+
+    df = pd.read_csv(company_check_csv)
+
+    df = add_inflation_rate(df)
+
     df.to_csv(company_check_csv, index=False)
 
     print("✅ Checkpoint 2 complete | Inflation calculated (market_average internal)")
@@ -1,35 +1,44 @@
 # processors/seller_l1_price.py
 
 import pandas as pd
-from utils.price_cleaner import clean_price
+from utils.price_cleaner import clean_price_series
 
 MAX_RANK = 20  # supports L1 to L20
 
 
-def enrich_with_last_ranked_price(filtered_csv, company_check_csv):
+def add_last_ranked_price(filtered_df: pd.DataFrame, company_df: pd.DataFrame) -> pd.DataFrame:
     """
-    Adds last_ranked_price column to company_check.csv.
+    Adds last_ranked_price column to company_df.
     Priority:
       - If L1 exists → take last L1 price
       - Else → take last available price from L2 to L20
     """
 
-    filtered_df = pd.read_csv(filtered_csv)
-    company_df = pd.read_csv(company_check_csv)
+    filtered_df = filtered_df.copy()
+    company_df = company_df.copy()
 
     filtered_df.columns = filtered_df.columns.str.strip()
     company_df.columns = company_df.columns.str.strip()
 
     # Clean prices
-    filtered_df["clean_price"] = filtered_df["Total Price"].apply(clean_price)
-
-    # Normalize Rank (L1, L2, ..., L20)
-    filtered_df["Rank"] = (
-        filtered_df["Rank"]
-        .astype(str)
-        .str.upper()
-        .str.strip()
-    )
+    if "clean_price" not in filtered_df.columns:
+        filtered_df["clean_price"] = clean_price_series(filtered_df["Total Price"])
+
+    # Rank key: integer rank_no (compact dataset) or normalized text L1..L20
+    if "rank_no" in filtered_df.columns:
+        filtered_df["__rank"] = filtered_df["rank_no"]
+        rank_key = lambda i: i
+    else:
+        if "rank_norm" in filtered_df.columns:
+            filtered_df["__rank"] = filtered_df["rank_norm"]
+        else:
+            filtered_df["__rank"] = (
+                filtered_df["Rank"]
+                .astype(str)
+                .str.upper()
+                .str.strip()
+            )
+        rank_key = lambda i: f"L{i}"
 
     last_price_map = {}
 
@@ -42,14 +51,13 @@ def enrich_with_last_ranked_price(filtered_csv, company_check_csv):
         last_price = None
 
         # 1️⃣ First priority: L1
-        l1_rows = seller_rows[seller_rows["Rank"] == "L1"]
+        l1_rows = seller_rows[seller_rows["__rank"] == rank_key(1)]
         if not l1_rows.empty:
             last_price = l1_rows.iloc[-1]["clean_price"]
         else:
             # 2️⃣ Fallback: L2 to L20
             for i in range(2, MAX_RANK + 1):
-                rank = f"L{i}"
-                rank_rows = seller_rows[seller_rows["Rank"] == rank]
+                rank_rows = seller_rows[seller_rows["__rank"] == rank_key(i)]
                 if not rank_rows.empty:
                     last_price = rank_rows.iloc[-1]["clean_price"]
                     break
@@ -59,6 +67,20 @@ def enrich_with_last_ranked_price(filtered_csv, company_check_csv):
     # Add column
     company_df["last_ranked_price"] = company_df["Seller Name"].map(last_price_map)
 
+    return company_df
+
+
+def enrich_with_last_ranked_price(filtered_csv, company_check_csv):
+    """
+    File-based wrapper around add_last_ranked_price.
+    Adds last_ranked_price column to company_check.csv (in-place).
+    """
+
+    filtered_df = pd.read_csv(filtered_csv)
+    company_df = pd.read_csv(company_check_csv)
+
+    company_df = add_last_ranked_price(filtered_df, company_df)
+
     # Save IN-PLACE
     company_df.to_csv(company_check_csv, index=False)
 
@@ -1,28 +1,30 @@
 # processors/seller_least_price.py
 
 import pandas as pd
-from utils.price_cleaner import clean_price
+from utils.price_cleaner import clean_price_series
 
-def enrich_with_least_price(filtered_csv, company_check_csv):
+
+def add_least_price(filtered_df: pd.DataFrame, company_df: pd.DataFrame) -> pd.DataFrame:
     """
-    Adds least_price column to company_check.csv (in-place).
+    Adds least_price column to company_df.
     Least price = minimum price quoted by the seller.
     """
 
-    filtered_df = pd.read_csv(filtered_csv)
-    company_df = pd.read_csv(company_check_csv)
+    filtered_df = filtered_df.copy()
+    company_df = company_df.copy()
 
     filtered_df.columns = filtered_df.columns.str.strip()
     company_df.columns = company_df.columns.str.strip()
 
     # Clean Total Price
-    filtered_df["clean_price"] = filtered_df["Total Price"].apply(clean_price)
+    if "clean_price" not in filtered_df.columns:
+        filtered_df["clean_price"] = clean_price_series(filtered_df["Total Price"])
 
     # Compute least price per seller
     least_price_map = (
         filtered_df
         .dropna(subset=["clean_price"])
-        .groupby("Seller Name")["clean_price"]
+        .groupby("Seller Name", observed=True)["clean_price"]
         .min()
         .to_dict()
     )
@@ -30,6 +32,20 @@ def enrich_with_least_price(filtered_csv, company_check_csv):
     # Add column
     company_df["least_price"] = company_df["Seller Name"].map(least_price_map)
 
+    return company_df
+
+
+def enrich_with_least_price(filtered_csv, company_check_csv):
+    """
+    File-based wrapper around add_least_price.
+    Adds least_price column to company_check.csv (in-place).
+    """
+
+    filtered_df = pd.read_csv(filtered_csv)
+    company_df = pd.read_csv(company_check_csv)
+
+    company_df = add_least_price(filtered_df, company_df)
+
     # Save IN-PLACE
     company_df.to_csv(company_check_csv, index=False)
 
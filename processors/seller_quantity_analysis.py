@@ -1,88 +1,312 @@
 # processors/seller_quantity_analysis.py
 
+import os
+import threading
+
+import numpy as np
 import pandas as pd
 
+from utils.csv_tail import CsvTail, RowDeduper, read_stable, row_keys
+from utils.price_cleaner import clean_price_series
 
-def get_quantity_scaling_factor(
-    basic_csv: str,
-    filtered_financial_csv: str,
-    user_quantity: int
-) -> float:
-    """
-    ⚠️ CRITICAL: filtered_company.csv contains TOTAL CONTRACT PRICES.
-    
-    HARD RULES:
-    - NEVER divide prices by quantity
-    - Quantity is for CONTEXT ONLY (to find similar tender sizes)
-    - Prices in CSV are NOT unit prices
-    
-    This function now returns a contextual weight factor based on
-    quantity similarity, NOT a price rescaling factor.
-    
-    RETURNS: Always 1.0 (neutral) - prices should NOT be rescaled.
-    """
+# CSV options for scraper exports (malformed rows, latin-1 text)
+SCRAPER_CSV_OPTIONS = dict(
+    low_memory=False,
+    on_bad_lines='skip',
+    encoding='latin-1',
+    quoting=1,
+    escapechar='\\'
+)
+
+
+def load_basic_csv(basic_csv: str) -> pd.DataFrame:
+    """Reads the basic bid results CSV (bid_no, quantity, ...)"""
+    return pd.read_csv(basic_csv, **SCRAPER_CSV_OPTIONS)
 
-    # Read CSVs with error handling for malformed rows
-    basic_df = pd.read_csv(
-        basic_csv, 
-        low_memory=False,
-        on_bad_lines='skip',
-        encoding='latin-1',
-        quoting=1,
-        escapechar='\\'
-    )
-    fin_df = pd.read_csv(
-        filtered_financial_csv, 
-        low_memory=False,
-        on_bad_lines='skip',
-        encoding='latin-1',
-        quoting=1,
-        escapechar='\\'
-    )
 
-    # Normalize bid_no
-    basic_df["bid_no"] = basic_df["bid_no"].astype(str)
-    fin_df["bid_no"] = fin_df["bid_no"].astype(str)
+# Similar tender size = within ±50% of the requested quantity
+QUANTITY_TOLERANCE = 0.5
 
-    # Quantity lookup (for context/filtering only)
-    qty_df = basic_df[["bid_no", "quantity"]].dropna().copy()
-    qty_df["quantity"] = (
-        qty_df["quantity"]
+
+def numeric_quantity(values: pd.Series) -> pd.Series:
+    """"392 nos" → 392.0 (first number in the text)"""
+    return (
+        values
         .astype(str)
         .str.extract(r"(\d+\.?\d*)")[0]
         .astype(float)
     )
-    qty_df = qty_df[qty_df["quantity"] > 0]
 
-    # Price lookup
-    price_df = fin_df[["bid_no", "Total Price"]].dropna().copy()
-    price_df["Total Price"] = pd.to_numeric(
-        price_df["Total Price"], errors="coerce"
+
+class QuantityIndex:
+    """
+    bid_no → numeric quantity, built ONCE from the basic CSV.
+
+    - Rows sorted by quantity → band lookups are two binary searches
+    - Only quantities > 0 are kept (same as the per-request merge)
+    - add() / refresh() take appended basic rows incrementally: each
+      batch is kept as its own sorted run, merged into the base once
+      runs pile up (cost proportional to the new rows, amortized)
+    - A replaced or rewritten source is re-indexed in full
+    """
+
+    MAX_RUNS = 16
+
+    def __init__(
+        self,
+        bid_nos,
+        quantities,
+        source_file: str = None,
+        source_offset: int = 0,
+        source_signature: str = None
+    ):
+        self._lock = threading.RLock()
+        self.source_file = source_file
+        self._set_rows(bid_nos, quantities, source_offset, source_signature)
+
+    def _set_rows(self, bid_nos, quantities, source_offset: int = 0, source_signature: str = None):
+        self._runs = [self._sorted_run(*self._clean(bid_nos, quantities))]
+        self._rows = len(self._runs[0][0])
+
+        self.source = None
+        if self.source_file and os.path.exists(self.source_file):
+            self.source = CsvTail(self.source_file, source_offset, source_signature)
+        self._deduper = None
+
+    @staticmethod
+    def _clean(bid_nos, quantities):
+        """Valid (bid_no, quantity > 0) pairs as arrays"""
+        qty_df = pd.DataFrame({
+            "bid_no": pd.Series(bid_nos).astype(str).to_numpy(),
+            "quantity": pd.Series(quantities).to_numpy()
+        }).dropna()
+
+        qty_df["quantity"] = numeric_quantity(qty_df["quantity"])
+        qty_df = qty_df[qty_df["quantity"] > 0]
+
+        return qty_df["bid_no"].to_numpy(dtype=object), qty_df["quantity"].to_numpy(dtype="float64")
+
+    @staticmethod
+    def _sorted_run(bids: np.ndarray, qtys: np.ndarray) -> tuple:
+        """(quantities, bid_nos) ordered by quantity"""
+        order = np.argsort(qtys, kind="stable")
+        return qtys[order], bids[order]
+
+    @classmethod
+    def from_basic_df(cls, basic_df: pd.DataFrame, **kwargs) -> "QuantityIndex":
+        return cls(basic_df["bid_no"], basic_df["quantity"], **kwargs)
+
+    @classmethod
+    def from_csv(cls, basic_csv: str) -> "QuantityIndex":
+        basic_df, offset, signature = read_stable(basic_csv, load_basic_csv)
+        return cls.from_basic_df(basic_df, source_file=basic_csv, source_offset=offset, source_signature=signature)
+
+    def __len__(self):
+        return self._rows
+
+    @property
+    def quantities(self) -> np.ndarray:
+        """Every indexed quantity, sorted (pending runs merged first)"""
+        return self._merged_runs()[0]
+
+    @property
+    def bid_nos(self) -> np.ndarray:
+        """bid_no of every indexed tender, aligned to quantities"""
+        return self._merged_runs()[1]
+
+    def _merged_runs(self) -> tuple:
+        runs = self._runs
+        if len(runs) == 1:
+            return runs[0]
+
+        with self._lock:
+            runs = self._runs
+            if len(runs) > 1:
+                # Stable sort of already-sorted runs (timsort merges them)
+                self._runs = [self._sorted_run(
+                    np.concatenate([bids for _, bids in runs]),
+                    np.concatenate([qtys for qtys, _ in runs])
+                )]
+            return self._runs[0]
+
+    def add(self, bid_nos, quantities) -> int:
+        """Indexes rows as a new sorted run; returns rows indexed"""
+        bids, qtys = self._clean(bid_nos, quantities)
+        if len(qtys) == 0:
+            return 0
+
+        with self._lock:
+            runs = self._runs + [self._sorted_run(bids, qtys)]
+            self._rows += len(qtys)
+            self._runs = runs
+
+            # Same policy as FinancialDataset.append: merge when runs pile up
+            # or the appended rows outgrow a quarter of the base
+            base = len(runs[0][0])
+            if len(runs) > self.MAX_RUNS or self._rows - base > base // 4:
+                self._merged_runs()
+
+            if self._deduper is not None:
+                self._deduper.add(basic_row_keys(bids, qtys))
+
+        return len(qtys)
+
+    def refresh(self) -> int:
+        """
+        Indexes rows appended to the source CSV since the last read
+        (re-indexes everything when the file was replaced)
+        """
+        if self.source is None or not self.source.changed():
+            return 0
+
+        with self._lock:
+            if not self.source.changed() or not os.path.exists(self.source_file):
+                return 0
+
+            if not self.source.is_append():
+                basic_df, offset, signature = read_stable(self.source_file, load_basic_csv)
+                basic_df.columns = basic_df.columns.str.strip()
+                self._set_rows(basic_df["bid_no"], basic_df["quantity"], offset, signature)
+                print(f"🔄 Quantity index reloaded (source replaced) | {len(self):,} tenders")
+                return len(self)
+
+            new_df = self.source.read(**SCRAPER_CSV_OPTIONS)
+            if new_df is None or new_df.empty:
+                return 0
+
+            new_df.columns = new_df.columns.str.strip()
+            return self.add(new_df["bid_no"], new_df["quantity"])
+
+    def row_deduper(self) -> RowDeduper:
+        """Known (bid_no, quantity) pairs (built on first ingest)"""
+        if self._deduper is None:
+            qtys, bids = self._merged_runs()
+            self._deduper = RowDeduper(basic_row_keys(bids, qtys))
+        return self._deduper
+
+    def band(self, user_quantity: float, tolerance: float = QUANTITY_TOLERANCE):
+        """(lower, upper) quantity bounds around user_quantity"""
+        return user_quantity * (1 - tolerance), user_quantity * (1 + tolerance)
+
+    def _band_slices(self, user_quantity: float, tolerance: float) -> list:
+        """(run, positions within the band) for every run (O(runs x log n))"""
+        lower, upper = self.band(user_quantity, tolerance)
+
+        slices = []
+        for run in self._runs:
+            start = np.searchsorted(run[0], lower, side="left")
+            stop = np.searchsorted(run[0], upper, side="right")
+            slices.append((run, slice(int(start), int(stop))))
+        return slices
+
+    def count_in_band(self, user_quantity: float, tolerance: float = QUANTITY_TOLERANCE) -> int:
+        """Number of tenders within the band"""
+        return sum(band.stop - band.start for _, band in self._band_slices(user_quantity, tolerance))
+
+    def bids_in_band(self, user_quantity: float, tolerance: float = QUANTITY_TOLERANCE) -> np.ndarray:
+        """bid_no of every tender within the band (one entry per basic row)"""
+        return np.concatenate([bids[band] for (_, bids), band in self._band_slices(user_quantity, tolerance)])
+
+
+def basic_row_keys(bid_nos, quantities) -> np.ndarray:
+    """Dedup keys of basic rows: (bid_no, numeric quantity)"""
+    return row_keys(
+        pd.DataFrame({
+            "bid_no": np.asarray(bid_nos, dtype=object),
+            "quantity": np.asarray(quantities, dtype="float64")
+        }),
+        ["bid_no", "quantity"]
     )
-    price_df = price_df.dropna()
 
-    merged = qty_df.merge(price_df, on="bid_no", how="inner")
 
-    if merged.empty:
-        print("⚠️ No quantity+price data available → using neutral factor")
-        return 1.0
+def priced_bids(filtered_df: pd.DataFrame) -> pd.Series:
+    """
+    bid_no of every matched row with a usable price (scraped
+    "` 222047.64" text parsed like clean_price; precomputed
+    clean_price column used when present)
+    """
+    if "clean_price" in filtered_df.columns:
+        prices = filtered_df["clean_price"]
+    else:
+        prices = clean_price_series(filtered_df["Total Price"])
 
-    # 🔥 NEW LOGIC: Use quantity for CONTEXT, not rescaling
-    # Filter tenders with similar quantity range (±50% of user quantity)
-    qty_lower = user_quantity * 0.5
-    qty_upper = user_quantity * 1.5
+    return filtered_df["bid_no"].astype(str)[prices.notna().to_numpy()]
+
+
+def quantity_context(
+    quantity_index: QuantityIndex,
+    filtered_df: pd.DataFrame,
+    user_quantity: int,
+    tolerance: float = QUANTITY_TOLERANCE
+) -> dict:
+    """
+    Quantity CONTEXT for the matched competitors (prices are never rescaled).
+
+    similar_quantity_count = matched price rows × basic rows of the same
+    bid_no whose quantity lies within ±tolerance of user_quantity.
+
+    RETURNS: dict with quantity_factor (always 1.0),
+             similar_quantity_count and quantity_band
+    """
+    lower, upper = quantity_index.band(user_quantity, tolerance)
+
+    price_bids = priced_bids(filtered_df)
+
+    band_counts = pd.Series(quantity_index.bids_in_band(user_quantity, tolerance)).value_counts()
+    similar = int(price_bids.map(band_counts).fillna(0).sum()) if len(band_counts) else 0
+
+    return {
+        "quantity_factor": 1.0,
+        "similar_quantity_count": similar,
+        "quantity_band": [lower, upper]
+    }
+
+
+def compute_quantity_scaling_factor(
+    basic_df: pd.DataFrame,
+    filtered_df: pd.DataFrame,
+    user_quantity: int
+) -> float:
+    """
+    ⚠️ CRITICAL: filtered_df contains TOTAL CONTRACT PRICES.
+    
+    HARD RULES:
+    - NEVER divide prices by quantity
+    - Quantity is for CONTEXT ONLY (to find similar tender sizes)
+    - Prices are NOT unit prices
     
-    similar_qty = merged[
-        (merged["quantity"] >= qty_lower) & 
-        (merged["quantity"] <= qty_upper)
-    ]
+    This function now returns a contextual weight factor based on
+    quantity similarity, NOT a price rescaling factor.
+    (Builds a throwaway QuantityIndex; services keep one resident.)
     
-    if not similar_qty.empty:
-        print(f"✅ Found {len(similar_qty)} tenders with similar quantity context")
+    RETURNS: Always 1.0 (neutral) - prices should NOT be rescaled.
+    """
+    context = quantity_context(QuantityIndex.from_basic_df(basic_df), filtered_df, user_quantity)
+    qty_lower, qty_upper = context["quantity_band"]
+
+    if context["similar_quantity_count"]:
+        print(f"✅ Found {context['similar_quantity_count']} tenders with similar quantity context")
     else:
         print(f"⚠️ No tenders in quantity range [{qty_lower}-{qty_upper}]")
 
     # 🔑 CRITICAL: Return 1.0 (neutral factor)
     # Prices in filtered_company.csv are TOTAL CONTRACT prices
     # They should NOT be rescaled by quantity
-    return 1.0
+    return context["quantity_factor"]
+
+
+def get_quantity_scaling_factor(
+    basic_csv: str,
+    filtered_financial_csv: str,
+    user_quantity: int
+) -> float:
+    """
+    File-based wrapper around compute_quantity_scaling_factor.
+    RETURNS: Always 1.0 (neutral) - prices should NOT be rescaled.
+    """
+
+    # Read CSVs with error handling for malformed rows
+    basic_df = load_basic_csv(basic_csv)
+    fin_df = pd.read_csv(filtered_financial_csv, **SCRAPER_CSV_OPTIONS)
+
+    return compute_quantity_scaling_factor(basic_df, fin_df, user_quantity)
@@ -0,0 +1,92 @@
+# processors/streaming_pipeline.py
+
+import os
+
+from filters.competitor_filter import filter_competitors
+from processors.l1_price_band import compute_l1_price_band
+from processors.seller_aggregate import (
+    QUANTILE_MODE,
+    finish_seller_table,
+    merge_seller_partials,
+    merge_seller_prices,
+    seller_partials
+)
+from processors.seller_quantity_analysis import QuantityIndex, quantity_context
+from utils.financial_cache import CHUNK_ROWS, iter_financial_chunks
+
+
+def run_streaming_pipeline(
+    raw_file: str,
+    user_input: str,
+    user_quantity: int,
+    basic_csv: str = None,
+    chunk_rows: int = CHUNK_ROWS,
+    quantity_index: QuantityIndex = None,
+    with_quantity_context: bool = True,
+    quantile_mode: str = QUANTILE_MODE
+) -> dict:
+    """
+    L1 pricing pipeline over a financial CSV that does not fit in RAM.
+
+    Per chunk: parse → filter competitors → per-seller partial state
+    (merged into a running total, see seller_aggregate.py).
+    Peak memory ~ one chunk + matched prices; the band is the same
+    as run_l1_pipeline on the fully loaded file.
+    quantile_mode="sketch" keeps per-seller sketches instead of the
+    matched prices (memory independent of matched rows, approximate
+    10th percentile).
+
+    RETURNS: run_l1_pipeline's dict + rows_scanned, rows_matched, chunks
+    RAISES: ValueError when no competitors match
+    """
+    warnings = []
+
+    if with_quantity_context and quantity_index is None:
+        if basic_csv and os.path.exists(basic_csv):
+            quantity_index = QuantityIndex.from_csv(basic_csv)
+        else:
+            warnings.append(
+                f"Quantity analysis failed: Basic data file not found: {basic_csv}. Using neutral factor."
+            )
+
+    partial = None
+    price_parts = []
+    similar_quantity_count = 0 if quantity_index is not None and with_quantity_context else None
+    rows_scanned = rows_matched = chunks = 0
+
+    for chunk in iter_financial_chunks(raw_file, chunk_rows):
+        chunks += 1
+        rows_scanned += len(chunk)
+
+        matched = filter_competitors(chunk, user_input)
+        if matched.empty:
+            continue
+        rows_matched += len(matched)
+
+        chunk_partial, chunk_prices = seller_partials(matched, quantile_mode)
+        partial = chunk_partial if partial is None else merge_seller_partials(partial, chunk_partial)
+        price_parts.append(chunk_prices)
+        if quantile_mode == "sketch":
+            price_parts = [merge_seller_prices(*price_parts)]
+
+        if similar_quantity_count is not None:
+            context = quantity_context(quantity_index, matched, user_quantity)
+            similar_quantity_count += context["similar_quantity_count"]
+
+    if partial is None:
+        raise ValueError(f"No competitors found for product: {user_input}")
+
+    company_df = finish_seller_table(partial, merge_seller_prices(*price_parts))
+    low_price, high_price = compute_l1_price_band(company_df)
+
+    return {
+        "company_df": company_df,
+        "low_price": low_price,
+        "high_price": high_price,
+        "quantity_factor": 1.0,
+        "similar_quantity_count": similar_quantity_count,
+        "warnings": warnings,
+        "rows_scanned": rows_scanned,
+        "rows_matched": rows_matched,
+        "chunks": chunks
+    }
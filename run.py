@@ -19,6 +19,7 @@ from processors.seller_least_price import enrich_with_least_price
 from processors.seller_quantity_analysis import get_quantity_scaling_factor
 from processors.seller_final_price import enrich_with_final_price
 from processors.l1_price_band import calculate_l1_price_band
+from utils.financial_cache import DERIVED_COLUMNS, load_financial_frame
 
 RAW_FILE = "data/raw/scraper_single_bid_results_financial.csv"
 BASIC_FILE = "data/raw/scraper_single_bid_results_basic.csv"
@@ -42,7 +43,7 @@ def main():
     print("\n📂 Phase 1: Filtering Competitors...")
     
     try:
-        df = pd.read_csv(RAW_FILE, low_memory=False)
+        df = load_financial_frame(RAW_FILE)
     except FileNotFoundError:
         print(f"\n❌ ERROR: Data file not found: {RAW_FILE}")
         print("   Please ensure the raw data file exists.")
@@ -58,7 +59,8 @@ def main():
         return
 
     try:
-        filtered_df.to_csv(FILTERED_FILE, index=False)
+        # Derived cache columns are recomputed by the processors
+        filtered_df.drop(columns=DERIVED_COLUMNS, errors="ignore").to_csv(FILTERED_FILE, index=False)
     except PermissionError:
         print(f"\n❌ PERMISSION ERROR: Cannot write to {FILTERED_FILE}")
         print("\n📋 TROUBLESHOOTING:")
@@ -1,66 +1,74 @@
 # run_engine.py
 
-import pandas as pd
-
-from filters.competitor_filter import filter_competitors
-from processors.seller_average import generate_seller_average
-from processors.seller_inflation import enrich_company_check_with_inflation
-from processors.seller_l1_price import enrich_with_last_ranked_price
-from processors.seller_least_price import enrich_with_least_price
-from processors.seller_quantity_analysis import get_quantity_scaling_factor
-from processors.seller_final_price import enrich_with_final_price
-from processors.l1_price_band import calculate_l1_price_band
+from processors.l1_pipeline import run_l1_pipeline
+from utils.dataset import QUANTITY_CONTEXT, get_dataset, get_quantity_index
+from utils.metrics import StageTimer, timed
 
 RAW_FILE = "data/raw/scraper_single_bid_results_financial.csv"
 BASIC_FILE = "data/raw/scraper_single_bid_results_basic.csv"
 
-FILTERED_FILE = "data/processed/filtered_company.csv"
-COMPANY_CHECK_FILE = "data/processed/company_check.csv"
-
-
-def run_pricing_engine(product: str, quantity: int):
-    df = pd.read_csv(RAW_FILE, low_memory=False)
-
-    filtered_df = filter_competitors(df, product)
-    if filtered_df.empty:
-        return None
 
-    filtered_df.to_csv(FILTERED_FILE, index=False)
+def run_pricing_engine(product: str, quantity: int, stages: StageTimer = None, shard_pool=None):
+    if shard_pool is not None:
+        # Rows partitioned across shard processes (utils/shard_pool.py)
+        try:
+            pipeline = shard_pool.run_pipeline(
+                product,
+                quantity,
+                with_quantity_context=QUANTITY_CONTEXT,
+                stages=stages
+            )
+        except ValueError:
+            return None
+    else:
+        pipeline = run_resident_engine(product, quantity, stages)
+        if pipeline is None:
+            return None
 
-    # Core pipeline
-    generate_seller_average(FILTERED_FILE, COMPANY_CHECK_FILE)
-    enrich_company_check_with_inflation(COMPANY_CHECK_FILE)
-    enrich_with_last_ranked_price(FILTERED_FILE, COMPANY_CHECK_FILE)
-    enrich_with_least_price(FILTERED_FILE, COMPANY_CHECK_FILE)
-
-    # Quantity logic (IN MEMORY)
-    quantity_factor = get_quantity_scaling_factor(
-        BASIC_FILE,
-        FILTERED_FILE,
-        quantity
-    )
-
-    enrich_with_final_price(
-        COMPANY_CHECK_FILE,
-        quantity_factor
-    )
-
-    low, high = calculate_l1_price_band(COMPANY_CHECK_FILE)
+    low = pipeline["low_price"]
+    high = pipeline["high_price"]
 
     # 🔥 TOP 5 SELLERS (MOST COMPETITIVE)
-    company_df = pd.read_csv(COMPANY_CHECK_FILE)
+    company_df = pipeline["company_df"]
 
-    top_5_sellers = (
-        company_df
-        .sort_values("recommended_price")
-        .head(5)["Seller Name"]
-        .tolist()
-    )
+    with timed(stages, "summary"):
+        top_5_sellers = (
+            company_df
+            .sort_values("recommended_price")
+            .head(5)["Seller Name"]
+            .tolist()
+        )
 
     return {
         "product": product,
         "quantity": quantity,
         "low_price": low,
         "high_price": high,
-        "top_5_sellers": top_5_sellers
+        "top_5_sellers": top_5_sellers,
+        "similar_quantity_count": pipeline["similar_quantity_count"]
     }
+
+
+def run_resident_engine(product: str, quantity: int, stages: StageTimer = None):
+    """run_l1_pipeline on this process's resident dataset (None when nothing matches)"""
+    # Resident dataset (parsed once per process, shared read-only)
+    with timed(stages, "load"):
+        dataset = get_dataset(RAW_FILE)
+        quantity_index = get_quantity_index(BASIC_FILE) if QUANTITY_CONTEXT else None
+
+    with timed(stages, "filter"):
+        filtered_df = dataset.filter(product)
+    if filtered_df.empty:
+        return None
+    if stages is not None:
+        stages.count("rows_matched", len(filtered_df))
+
+    # Core pipeline (in memory, no intermediate CSVs)
+    return run_l1_pipeline(
+        filtered_df,
+        quantity,
+        BASIC_FILE,
+        quantity_index=quantity_index,
+        with_quantity_context=QUANTITY_CONTEXT,
+        stages=stages
+    )
@@ -0,0 +1,60 @@
+# stream_run.py
+
+import sys
+
+from processors.seller_aggregate import QUANTILE_MODE
+from processors.streaming_pipeline import run_streaming_pipeline
+from utils.financial_cache import CHUNK_ROWS
+
+RAW_FILE = "data/raw/scraper_single_bid_results_financial.csv"
+BASIC_FILE = "data/raw/scraper_single_bid_results_basic.csv"
+
+
+def main():
+    """
+    L1 price band for financial files larger than RAM.
+    Usage: python stream_run.py "<product>" <quantity> [--chunk-rows N] [--sketch]
+    --sketch: per-seller quantile sketches instead of every matched price
+    """
+    args = sys.argv[1:]
+    chunk_rows = CHUNK_ROWS
+    quantile_mode = QUANTILE_MODE
+
+    if "--sketch" in args:
+        args.remove("--sketch")
+        quantile_mode = "sketch"
+
+    if "--chunk-rows" in args:
+        i = args.index("--chunk-rows")
+        chunk_rows = int(args[i + 1])
+        del args[i:i + 2]
+
+    if len(args) != 2:
+        print('Usage: python stream_run.py "<product>" <quantity> [--chunk-rows N] [--sketch]')
+        sys.exit(1)
+
+    product, quantity = args[0], int(args[1])
+
+    print(f"\n🌊 STREAMING L1 PRICING | {chunk_rows:,} rows per chunk | {quantile_mode} quantiles\n")
+
+    try:
+        result = run_streaming_pipeline(
+            RAW_FILE, product, quantity, BASIC_FILE, chunk_rows,
+            quantile_mode=quantile_mode
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"\n📦 Scanned {result['rows_scanned']:,} rows in {result['chunks']} chunks")
+    print(f"🎯 Matched {result['rows_matched']:,} rows | {len(result['company_df'])} sellers")
+    if result["similar_quantity_count"] is not None:
+        print(f"📏 Similar quantity tenders: {result['similar_quantity_count']}")
+    for warning in result["warnings"]:
+        print(f"⚠️ {warning}")
+
+    print(f"\n💰 L1 band: ₹{result['low_price']:,.2f} - ₹{result['high_price']:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
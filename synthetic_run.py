@@ -0,0 +1,70 @@
+# synthetic_run.py
+
+import os
+import sys
+
+from benchmarks.runner import parse_sizes
+from benchmarks.synthetic import (
+    BENCHMARK_PRODUCT,
+    SYNTHETIC_PRODUCTS,
+    SYNTHETIC_SELLERS,
+    write_gem_csvs
+)
+
+FINANCIAL_NAME = "scraper_single_bid_results_financial.csv"
+BASIC_NAME = "scraper_single_bid_results_basic.csv"
+
+USAGE = """Usage: python synthetic_run.py [--rows 1m] [--seed 0] [--products 5000] [--sellers 20000]
+                             [--output-dir data/raw] [--force]"""
+
+
+def _option(args, name, default):
+    if name in args:
+        return args[args.index(name) + 1]
+    return default
+
+
+def main():
+    """
+    Writes a seeded GeM-shaped dataset (financial + basic CSVs) under
+    --output-dir with the scraper file names, so every tool runs on it.
+    Same seed and options → byte-identical files.
+    """
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(USAGE)
+        return
+
+    try:
+        rows = parse_sizes(_option(args, "--rows", "1m"))[0]
+        seed = int(_option(args, "--seed", 0))
+        products = int(_option(args, "--products", SYNTHETIC_PRODUCTS))
+        sellers = int(_option(args, "--sellers", SYNTHETIC_SELLERS))
+    except (ValueError, IndexError) as e:
+        print(f"❌ Invalid option: {e}")
+        sys.exit(1)
+
+    output_dir = _option(args, "--output-dir", "data/raw")
+    financial_csv = os.path.join(output_dir, FINANCIAL_NAME)
+    basic_csv = os.path.join(output_dir, BASIC_NAME)
+
+    print(f"\n🧪 SYNTHETIC GeM DATA | {rows:,} rows | seed {seed} | "
+          f"{products:,} products | {sellers:,} sellers")
+
+    try:
+        summary = write_gem_csvs(
+            financial_csv, basic_csv, rows, seed,
+            force="--force" in args, products=products, sellers=sellers
+        )
+    except (FileExistsError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"✅ {summary['rows']:,} price rows, {summary['bids']:,} bids in {summary['elapsed_s']}s")
+    print(f"💾 Financial → {financial_csv}")
+    print(f"💾 Basic     → {basic_csv}")
+    print(f"🔎 Most frequent product: \"{BENCHMARK_PRODUCT}\"")
+
+
+if __name__ == "__main__":
+    main()
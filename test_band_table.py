@@ -0,0 +1,86 @@
+# test_band_table.py
+"""
+Checks that band table entries answer like the live pipeline:
+stored quantity profiles give quantity_context's count for any
+quantity, and entries are not served once the data files change.
+"""
+
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from processors.band_table import TABLE_FORMAT_VERSION, BandTable, profile_similar_count, quantity_profile
+from processors.seller_quantity_analysis import QuantityIndex, quantity_context
+from test_quantity_index import FIXTURE_FILE, make_frames
+
+
+def test_profile_matches_quantity_context():
+    basic_df, filtered_df = make_frames()
+    index = QuantityIndex.from_basic_df(basic_df)
+    profile = quantity_profile(index, filtered_df)
+
+    for user_quantity in [1, 5, 8, 10, 12, 75, 100, 150, 151, 1000]:
+        expected = quantity_context(index, filtered_df, user_quantity)["similar_quantity_count"]
+        assert profile_similar_count(profile, user_quantity) == expected
+
+
+def test_profile_on_real_price_format():
+    filtered_df = pd.read_csv(FIXTURE_FILE)
+    bids = filtered_df["bid_no"].drop_duplicates()
+    index = QuantityIndex.from_basic_df(pd.DataFrame({"bid_no": bids, "quantity": ["10 nos"] * len(bids)}))
+
+    profile = quantity_profile(index, filtered_df)
+    assert profile["quantities"] == [10.0]
+    assert profile_similar_count(profile, 10) == quantity_context(index, filtered_df, 10)["similar_quantity_count"] > 0
+
+
+def test_old_format_not_loaded():
+    table = {"dataset_version": "1-1", "basic_version": "1-1", "products": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.json")
+        for format_version, loaded in ((None, False), (TABLE_FORMAT_VERSION, True)):
+            with open(path, "w") as f:
+                json.dump({**table, "format_version": format_version}, f)
+            with redirect_stdout(io.StringIO()):
+                assert (BandTable.load(path) is not None) == loaded
+
+
+def test_lookup_versions():
+    basic_df, filtered_df = make_frames()
+    profile = quantity_profile(QuantityIndex.from_basic_df(basic_df), filtered_df)
+    table = BandTable({
+        "dataset_version": "100-1",
+        "basic_version": "50-1",
+        "products": {
+            "LIGATION CLIPS": {
+                "product": "LIGATION CLIPS",
+                "low_price": 100.0,
+                "high_price": 110.0,
+                "confidence": "65%",
+                "competitors_analyzed": 3,
+                "top_competitors": [],
+                "quantity_profile": profile
+            }
+        }
+    })
+
+    result = table.lookup("ligation  clips", 12, "100-1", "50-1")
+    assert result["product"] == "ligation  clips"
+    assert result["low_price"] == 100.0
+    assert result["similar_quantity_count"] == profile_similar_count(profile, 12)
+
+    assert table.lookup("ligation clips", 12, "200-2", "50-1") is None     # data appended
+    assert table.lookup("clips", 12, "100-1", "50-1") is None               # not canonical
+    assert table.stats()["hits"] == 1 and table.stats()["stale"] == 1
+
+
+if __name__ == "__main__":
+    test_profile_matches_quantity_context()
+    test_profile_on_real_price_format()
+    test_old_format_not_loaded()
+    test_lookup_versions()
+    print("✅ Band table matches live quantity context")
@@ -0,0 +1,79 @@
+# test_batch_predict.py
+"""
+Checks /api/v1/predict/batch: one NDJSON line per item, an inline 404
+for an unmatched product, and repeated products computed once.
+"""
+
+import asyncio
+import io
+import json
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+import api_main
+from utils.dataset import FinancialDataset, set_dataset
+from utils.prediction_executor import PredictionExecutor
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+ITEMS = [
+    {"product": "HIV ELISA Test Kits", "quantity": 5},
+    {"product": "Zzz Unknown Widget", "quantity": 1},
+    {"product": "hiv elisa  test kits", "quantity": 5},
+    {"product": "HCV ELISA Test Kits", "quantity": 2},
+    {"product": "HIV ELISA Test Kits", "quantity": 5},
+]
+
+
+def test_batch_stream():
+    set_dataset(FinancialDataset(pd.read_csv(FIXTURE_FILE), FIXTURE_FILE))
+    api_main.result_cache.clear()
+
+    computed = []
+    measured = api_main.measured_pricing_prediction
+
+    def counting_prediction(product, quantity, fuzzy=False):
+        computed.append(product)
+        return measured(product, quantity, fuzzy)
+
+    executor = api_main.executor
+    api_main.executor = PredictionExecutor(mode="thread", workers=2)
+    api_main.measured_pricing_prediction = counting_prediction
+
+    async def run():
+        request = api_main.BatchPricingRequest(items=ITEMS)
+        response = await api_main.predict_pricing_batch(request)
+        assert response.media_type == "application/x-ndjson"
+        return [chunk async for chunk in response.body_iterator]
+
+    try:
+        with redirect_stdout(io.StringIO()):
+            chunks = asyncio.run(run())
+    finally:
+        api_main.executor.shutdown()
+        api_main.executor = executor
+        api_main.measured_pricing_prediction = measured
+        set_dataset(None)
+
+    # One complete JSON line per item
+    assert all(chunk.endswith("\n") and chunk.count("\n") == 1 for chunk in chunks)
+    lines = sorted((json.loads(chunk) for chunk in chunks), key=lambda line: line["index"])
+    assert [line["index"] for line in lines] == list(range(len(ITEMS)))
+    assert [line["product"] for line in lines] == [item["product"] for item in ITEMS]
+
+    # Unmatched product → inline 404, the rest still answered
+    assert lines[1]["status"] == "error"
+    assert (lines[1]["status_code"], lines[1]["error"]) == (404, "No Data Found")
+    assert all(line["status"] == "ok" for i, line in enumerate(lines) if i != 1)
+
+    # Same normalized query → computed once, same band for every copy
+    assert len(computed) == 3
+    bands = {(line["result"]["low_price"], line["result"]["high_price"]) for line in (lines[0], lines[2], lines[4])}
+    assert len(bands) == 1
+    assert lines[2]["result"]["product"] == "hiv elisa  test kits"
+
+
+if __name__ == "__main__":
+    test_batch_stream()
+    print("✅ Batch predictions stream one NDJSON line per item")
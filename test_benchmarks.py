@@ -0,0 +1,44 @@
+# test_benchmarks.py
+"""
+Checks the benchmark runner on a tiny dataset and that comparisons
+flag regressions beyond the threshold only.
+"""
+
+import contextlib
+import copy
+import io
+
+from benchmarks.cases import CASES
+from benchmarks.runner import compare_results, parse_sizes, run_suite
+
+
+def test_suite_runs_every_case():
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = run_suite([2000], min_runs=1, max_runs=1, min_time=0)
+
+    assert set(results["results"]) == set(CASES)
+    for by_size in results["results"].values():
+        stats = by_size["2000"]
+        assert stats["runs"] == 1 and stats["min_ms"] > 0 and stats["peak_mb"] >= 0
+
+
+def test_compare_flags_regressions():
+    baseline = {"results": {
+        "clean_price": {"100000": {"min_ms": 100.0, "peak_mb": 10.0}},
+        "l1_price_band": {"100000": {"min_ms": 0.2, "peak_mb": 0.1}}
+    }}
+    current = copy.deepcopy(baseline)
+    current["results"]["clean_price"]["100000"]["min_ms"] = 140.0     # +40%
+    current["results"]["clean_price"]["100000"]["peak_mb"] = 11.0     # +10%
+    current["results"]["l1_price_band"]["100000"]["min_ms"] = 0.4     # +100%, under noise floor
+
+    flagged = {(r["case"], r["metric"]) for r in compare_results(current, baseline, 0.25) if r["regression"]}
+    assert flagged == {("clean_price", "min_ms")}
+
+    assert parse_sizes("10k, 100k,1m") == [10_000, 100_000, 1_000_000]
+
+
+if __name__ == "__main__":
+    test_suite_runs_every_case()
+    test_compare_flags_regressions()
+    print("✅ Benchmark runner and regression check work")
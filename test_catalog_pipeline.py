@@ -0,0 +1,93 @@
+# test_catalog_pipeline.py
+"""
+Checks the streaming catalog pipeline against the two-pass tools
+(extract_raw_product_items → fast_canonicalize), full and incremental,
+and that a replaced source CSV is rebuilt, not appended.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_financial
+from processors.catalog_pipeline import build_catalog
+from processors.extract_product_items import extract_raw_product_items
+from processors.fast_canonicalizer import fast_canonicalize
+
+
+def two_pass_catalog(raw_file: str, work_dir: str) -> list:
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Not cached: nothing written to data/cache
+        extract_raw_product_items(raw_file, os.path.join(work_dir, "raw.csv"), use_cache=False)
+        out = fast_canonicalize(os.path.join(work_dir, "raw.csv"), os.path.join(work_dir, "old.csv"))
+    return out["product_item"].tolist()
+
+
+def test_full_and_incremental_match_two_pass():
+    df = synthetic_financial(3000, seed=11, products=300)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        raw_file = os.path.join(work_dir, "financial.csv")
+        output = os.path.join(work_dir, "product_items.csv")
+        state = os.path.join(work_dir, "state.json")
+
+        # First half, then the rest appended (last line left incomplete once)
+        df.iloc[:1500].to_csv(raw_file, index=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = build_catalog(raw_file, output, state, workers=2, chunk_rows=400, full=True)
+        assert summary["mode"] == "full" and summary["rows_read"] == 1500
+
+        tail = df.iloc[1500:].to_csv(index=False, header=False)
+        cut = tail.index("\n", len(tail) // 2) + 5
+        with open(raw_file, "a") as f:
+            f.write(tail[:cut])
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_catalog(raw_file, output, state, workers=1, chunk_rows=400)
+        with open(raw_file, "a") as f:
+            f.write(tail[cut:])
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = build_catalog(raw_file, output, state, workers=2, chunk_rows=400)
+
+        assert summary["mode"] == "incremental"
+        incremental = pd.read_csv(output)["product_item"].tolist()
+        expected = two_pass_catalog(raw_file, work_dir)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_catalog(raw_file, output, state, workers=1, chunk_rows=700, full=True)
+        full = pd.read_csv(output)["product_item"].tolist()
+
+    assert len(expected) > 50
+    assert incremental == expected
+    assert full == expected
+
+
+def test_replaced_source_rebuilt():
+    first = synthetic_financial(1500, seed=11, products=300)
+    second = synthetic_financial(3000, seed=12, products=300)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        raw_file = os.path.join(work_dir, "financial.csv")
+        output = os.path.join(work_dir, "product_items.csv")
+        state = os.path.join(work_dir, "state.json")
+
+        first.to_csv(raw_file, index=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_catalog(raw_file, output, state, workers=1, chunk_rows=400, full=True)
+
+        # A different, larger export swapped in under the same name
+        second.to_csv(raw_file + ".new", index=False)
+        os.replace(raw_file + ".new", raw_file)
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = build_catalog(raw_file, output, state, workers=1, chunk_rows=400)
+
+        assert summary["mode"] == "full" and summary["rows_read"] == 3000
+        assert pd.read_csv(output)["product_item"].tolist() == two_pass_catalog(raw_file, work_dir)
+
+
+if __name__ == "__main__":
+    test_full_and_incremental_match_two_pass()
+    test_replaced_source_rebuilt()
+    print("✅ Streaming catalog matches the two-pass canonicalization")
@@ -0,0 +1,64 @@
+# test_compact_frame.py
+"""
+Checks the compact representation (categorical codes, integer ranks)
+gives the same seller results as the plain frame.
+"""
+
+import io
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from processors.seller_average import compute_seller_average
+from processors.seller_l1_price import add_last_ranked_price
+from processors.seller_least_price import add_least_price
+from utils.compact_frame import compact_financial_frame, rank_numbers
+from utils.dataset import FinancialDataset
+from utils.price_cleaner import clean_price_series
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def load_fixture() -> pd.DataFrame:
+    df = pd.read_csv(FIXTURE_FILE)
+    df["clean_price"] = clean_price_series(df["Total Price"])
+    return df
+
+
+def seller_results(df: pd.DataFrame) -> pd.DataFrame:
+    company_df = compute_seller_average(df)
+    company_df = add_last_ranked_price(df, company_df)
+    company_df = add_least_price(df, company_df)
+
+    company_df["Seller Name"] = company_df["Seller Name"].astype(str)
+    company_df["bid_no"] = company_df["bid_no"].astype(str)
+    return company_df.sort_values(["Seller Name", "bid_no"]).reset_index(drop=True)
+
+
+def test_rank_numbers():
+    ranks = pd.Series(["L1", " l3 ", "L20", "L0", "LL2", "L999", None, "H1"])
+    assert rank_numbers(ranks).tolist() == [1, 3, 20, 0, 0, 0, 0, 0]
+
+
+def test_compact_results_identical():
+    df = load_fixture()
+    compact_df, report = compact_financial_frame(df, price_dtype="float64")
+
+    assert report["bytes_saved"] > 0
+    pd.testing.assert_frame_equal(seller_results(df), seller_results(compact_df))
+
+
+def test_summary_reports_bytes_saved():
+    with redirect_stdout(io.StringIO()):
+        compact = FinancialDataset(pd.read_csv(FIXTURE_FILE), compact=True)
+    plain = FinancialDataset(pd.read_csv(FIXTURE_FILE))
+
+    assert compact.summary()["compact"] and compact.summary()["bytes_saved"] == compact.memory_report["bytes_saved"] > 0
+    assert not plain.summary()["compact"] and plain.summary()["bytes_saved"] == 0
+
+
+if __name__ == "__main__":
+    test_rank_numbers()
+    test_compact_results_identical()
+    test_summary_reports_bytes_saved()
+    print("✅ Compact frame matches plain frame")
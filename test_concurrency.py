@@ -0,0 +1,55 @@
+# test_concurrency.py
+"""
+Fires mixed-product predictions concurrently and checks every answer
+matches the serial result for the same product.
+"""
+
+import io
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import api_main
+import run_engine
+from utils.dataset import FinancialDataset, set_dataset
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+PRODUCTS = [
+    ("HIV ELISA Test Kits", 5),
+    ("HCV ELISA Test Kits", 2),
+    ("HBsAg Rapid Test Kits", 10),
+    ("Malaria Eliza Kit", 1),
+    ("Dengue ELISA Test Kit", 3),
+    ("VDRL Eliza Kit, HCV Rapid Test", 4),
+]
+
+
+def predict(product, quantity):
+    result = api_main.generate_pricing_prediction(product, quantity)
+    engine = run_engine.run_pricing_engine(product, quantity)
+
+    result.pop("timestamp")
+    return result, engine
+
+
+def test_concurrent_predictions_match_serial():
+    set_dataset(FinancialDataset(pd.read_csv(FIXTURE_FILE), FIXTURE_FILE))
+
+    jobs = PRODUCTS * 8
+
+    # Pipeline progress output is silenced for the whole run
+    with redirect_stdout(io.StringIO()):
+        serial = {p: predict(p, q) for p, q in PRODUCTS}
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda job: predict(*job), jobs))
+
+    for (product, _), result in zip(jobs, results):
+        assert result == serial[product], product
+
+
+if __name__ == "__main__":
+    test_concurrent_predictions_match_serial()
+    print(f"✅ {len(PRODUCTS) * 8} concurrent predictions match serial results")
@@ -0,0 +1,122 @@
+# test_financial_cache.py
+"""
+Checks the columnar cache: fresh while the CSV is unchanged (also after
+a touch), rebuilt after a change or a corrupt Parquet file, one cache per
+source path, and the same frame as a plain CSV parse. Malformed rows
+fail a full load and are skipped (and counted) in an appended tail.
+"""
+
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+import pandas as pd
+from pandas.errors import ParserError
+
+from utils.dataset import FinancialDataset
+from utils.financial_cache import _cache_paths, is_cache_fresh, iter_financial_chunks, load_financial_frame
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def _write_fixture(path, rows=None):
+    df = pd.read_csv(FIXTURE_FILE, dtype=str, keep_default_na=False)
+    df.iloc[:rows].to_csv(path, index=False)
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+
+def test_freshness_and_invalidation():
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_file = os.path.join(tmp, "financial.csv")
+        cache_dir = os.path.join(tmp, "cache")
+        _write_fixture(raw_file, 200)
+
+        assert not is_cache_fresh(raw_file, cache_dir)
+        built = load_financial_frame(raw_file, cache_dir)
+        assert is_cache_fresh(raw_file, cache_dir)
+        assert not [name for name in os.listdir(cache_dir) if name.endswith(".tmp")]
+
+        # Parquet returns str dtype where the CSV parse has object: compare values
+        pd.testing.assert_frame_equal(load_financial_frame(raw_file, cache_dir), built, check_dtype=False)
+        pd.testing.assert_frame_equal(load_financial_frame(raw_file, use_cache=False), built)
+
+        # Touched, same content → still fresh (hash decides)
+        _bump_mtime(raw_file)
+        assert is_cache_fresh(raw_file, cache_dir)
+
+        # Rewritten with more rows → stale, rebuilt
+        _write_fixture(raw_file, 300)
+        _bump_mtime(raw_file)
+        assert not is_cache_fresh(raw_file, cache_dir)
+        assert len(load_financial_frame(raw_file, cache_dir)) == 300
+        assert is_cache_fresh(raw_file, cache_dir)
+
+        # Corrupt Parquet with a fresh stamp → rebuilt from the CSV
+        cache_file, _ = _cache_paths(raw_file, cache_dir)
+        with open(cache_file, "wb") as f:
+            f.write(b"not parquet")
+        assert len(load_financial_frame(raw_file, cache_dir)) == 300
+
+
+def test_one_cache_per_source_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "cache")
+        paths = []
+        for name, rows in (("a", 50), ("b", 80)):
+            os.makedirs(os.path.join(tmp, name))
+            paths.append(os.path.join(tmp, name, "financial.csv"))
+            _write_fixture(paths[-1], rows)
+
+        assert _cache_paths(paths[0], cache_dir) != _cache_paths(paths[1], cache_dir)
+        assert [len(load_financial_frame(path, cache_dir)) for path in paths] == [50, 80]
+        assert all(is_cache_fresh(path, cache_dir) for path in paths)
+
+        # use_cache=False writes nothing
+        before = sorted(os.listdir(cache_dir))
+        load_financial_frame(paths[0], os.path.join(tmp, "unused"), use_cache=False)
+        assert not os.path.exists(os.path.join(tmp, "unused"))
+        assert sorted(os.listdir(cache_dir)) == before
+
+
+def test_malformed_rows():
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_file = os.path.join(tmp, "financial.csv")
+        _write_fixture(raw_file, 40)
+        dataset = FinancialDataset(load_financial_frame(raw_file, use_cache=False), raw_file)
+
+        columns = len(pd.read_csv(raw_file, nrows=0).columns)
+        good = pd.read_csv(FIXTURE_FILE, dtype=str, keep_default_na=False).iloc[40:45]
+        with open(raw_file, "a") as f:
+            f.write(",".join(["x"] * (columns + 2)) + "\n")
+        good.to_csv(raw_file, mode="a", header=False, index=False)
+        with open(raw_file, "a") as f:
+            f.write(",".join(["y"] * (columns + 3)) + "\n")
+
+        # Appended tail: good rows kept, malformed ones skipped and reported
+        out = io.StringIO()
+        with redirect_stdout(out):
+            assert dataset.refresh() == len(good)
+        assert "2 malformed rows skipped" in out.getvalue()
+
+        # Full loads raise instead of silently dropping rows
+        for load in (
+            lambda: load_financial_frame(raw_file, os.path.join(tmp, "cache")),
+            lambda: list(iter_financial_chunks(raw_file, 10))
+        ):
+            try:
+                load()
+                assert False, "expected ParserError"
+            except ParserError:
+                pass
+
+
+if __name__ == "__main__":
+    test_freshness_and_invalidation()
+    test_one_cache_per_source_path()
+    test_malformed_rows()
+    print("✅ Columnar cache freshness and invalidation")
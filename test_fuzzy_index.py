@@ -0,0 +1,67 @@
+# test_fuzzy_index.py
+"""
+Checks the MinHash LSH fuzzy matcher against a brute-force similarity
+scan and the fuzzy fallback of the token index.
+"""
+
+import numpy as np
+import pandas as pd
+
+from filters.competitor_filter import user_token_sets
+from filters.fuzzy_index import FUZZY_THRESHOLD, FuzzyItemIndex, jaccard, shingles
+from filters.token_index import TokenIndex
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def brute_force(index: FuzzyItemIndex, text: str, threshold: float = FUZZY_THRESHOLD) -> set:
+    query = shingles(text)
+    return {
+        fp for fp, shingle_set in zip(index.fingerprints, index.shingle_sets)
+        if jaccard(query, shingle_set) >= threshold
+    }
+
+
+def test_lsh_recall_against_brute_force():
+    rng = np.random.default_rng(5)
+    words = ["".join(rng.choice(list("ABCDEHIKLMNOPRSTUY"), rng.integers(4, 10))) for _ in range(400)]
+    fingerprints = [" ".join(sorted(set(rng.choice(words, rng.integers(1, 4))))) for _ in range(3000)]
+
+    index = FuzzyItemIndex()
+    index.add(fingerprints)
+
+    expected = found = 0
+    for fp in fingerprints[:200]:
+        typo = list(fp)
+        typo[rng.integers(len(typo))] = "E"
+        typo = "".join(typo)
+
+        matches = {match for match, _ in index.search(typo)}
+        truth = brute_force(index, typo)
+
+        assert matches <= truth                 # verified similarities only
+        expected += len(truth)
+        found += len(matches)
+
+    assert found / expected >= 0.9
+
+
+def test_fuzzy_fallback_only_for_unmatched_products():
+    df = pd.read_csv(FIXTURE_FILE)
+    index = TokenIndex.from_dataframe(df)
+
+    token_sets, matches = index.fuzzy_token_sets(user_token_sets("HIV ELISA Test Kits, Dengu ELISA Tst Kit"))
+
+    assert token_sets[0] == user_token_sets("HIV ELISA Test Kits")[0]
+    assert matches and all(match["query"] == "DENGU ELISA KIT TST" for match in matches)
+    assert all(match["similarity"] >= FUZZY_THRESHOLD for match in matches)
+    assert len(index.match_positions(token_sets[1:])) > 0
+
+    token_sets, matches = index.fuzzy_token_sets(user_token_sets("HIV ELISA Test Kits"))
+    assert matches == []
+
+
+if __name__ == "__main__":
+    test_lsh_recall_against_brute_force()
+    test_fuzzy_fallback_only_for_unmatched_products()
+    print("✅ Fuzzy matching agrees with brute-force similarity")
@@ -0,0 +1,151 @@
+# test_ingest.py
+"""
+Checks that rows ingested into a loaded dataset give the same
+matches and seller aggregates as loading the whole file at once,
+that re-sent rows are skipped (also by concurrent processes), and
+that a replaced or truncated source is reloaded, not appended.
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+
+from processors.seller_aggregate import aggregate_sellers
+from processors.seller_quantity_analysis import QuantityIndex
+from utils.dataset import FinancialDataset, load_dataset, set_dataset
+from utils.financial_cache import prepare_financial_frame
+from utils.ingest import ingest_financial_rows
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+QUERIES = ["HIV ELISA Test Kits", "HCV", "Ligation Clips", "test"]
+
+
+def _load(raw_file):
+    """Dataset straight from the CSV (no columnar cache written)"""
+    return FinancialDataset(prepare_financial_frame(pd.read_csv(raw_file)), raw_file)
+
+
+def _split_fixture(directory):
+    """Unique fixture rows: first half on disk, second half as new rows"""
+    rows = pd.read_csv(FIXTURE_FILE, dtype=str, keep_default_na=False).drop_duplicates()
+    half = len(rows) // 2
+
+    raw_file = os.path.join(directory, "financial.csv")
+    full_file = os.path.join(directory, "full.csv")
+    rows.iloc[:half].to_csv(raw_file, index=False)
+    rows.to_csv(full_file, index=False)
+
+    return raw_file, full_file, rows.iloc[half:]
+
+
+def test_ingest_matches_full_load():
+    directory = tempfile.mkdtemp()
+    try:
+        raw_file, full_file, new_rows = _split_fixture(directory)
+        dataset = _load(raw_file)
+        set_dataset(dataset)
+        version = dataset.version
+
+        result = ingest_financial_rows(new_rows, raw_file)
+        assert result["appended"] == len(new_rows)
+        assert dataset.version != version
+
+        full = _load(full_file)
+
+        _assert_same_matches(dataset, full)
+        pd.testing.assert_frame_equal(aggregate_sellers(dataset.df), aggregate_sellers(full.df))
+
+        # Incrementally maintained aggregates equal a full load's
+        pd.testing.assert_frame_equal(dataset.seller_stats.sort_index(), full.seller_stats.sort_index())
+        assert dataset.index.token_rows == full.index.token_rows
+        assert dataset.summary()["top_tokens"] == full.summary()["top_tokens"]
+        assert result["sellers"] == len(full.seller_stats)
+
+        again = ingest_financial_rows(new_rows, raw_file)
+        assert again["appended"] == 0
+        assert again["duplicates"] == len(new_rows)
+    finally:
+        set_dataset(None)
+        shutil.rmtree(directory)
+
+
+def _assert_same_matches(dataset, expected):
+    assert len(dataset) == len(expected)
+    for query in QUERIES:
+        pd.testing.assert_frame_equal(
+            dataset.filter(query).reset_index(drop=True),
+            expected.filter(query).reset_index(drop=True)
+        )
+
+
+def test_replaced_source_is_reloaded():
+    rows = pd.read_csv(FIXTURE_FILE, dtype=str, keep_default_na=False).drop_duplicates()
+
+    with tempfile.TemporaryDirectory() as directory:
+        raw_file = os.path.join(directory, "financial.csv")
+        cache_dir = os.path.join(directory, "cache")
+        rows.iloc[:80].to_csv(raw_file, index=False)
+        dataset = load_dataset(raw_file, cache_dir=cache_dir)
+
+        # Reordered, larger export swapped in (not an append)
+        export = rows.iloc[:150].sample(frac=1, random_state=3)
+        export.to_csv(raw_file + ".new", index=False)
+        os.replace(raw_file + ".new", raw_file)
+        assert dataset.refresh() == 150
+        assert dataset.appended_rows == 0
+        _assert_same_matches(dataset, _load(raw_file))
+
+        # Rewritten in place, smaller
+        rows.iloc[20:120].to_csv(raw_file, index=False)
+        assert dataset.refresh() == 100
+        _assert_same_matches(dataset, _load(raw_file))
+
+        # A real append is still read incrementally
+        rows.iloc[120:170].to_csv(raw_file, mode="a", header=False, index=False)
+        assert dataset.refresh() == 50
+        assert dataset.appended_rows == 50
+        _assert_same_matches(dataset, _load(raw_file))
+
+        # Quantity index: same rules
+        basic_file = os.path.join(directory, "basic.csv")
+        pd.DataFrame({"bid_no": ["B1", "B2"], "quantity": ["5 nos", "9 nos"]}).to_csv(basic_file, index=False)
+        index = QuantityIndex.from_csv(basic_file)
+        pd.DataFrame({"bid_no": ["B3"], "quantity": ["7 nos"]}).to_csv(basic_file, index=False)
+        index.refresh()
+        assert index.bid_nos.tolist() == ["B3"]
+
+
+def _ingest_in_process(raw_file, cache_dir, new_rows):
+    set_dataset(load_dataset(raw_file, cache_dir=cache_dir))
+    ingest_financial_rows(new_rows, raw_file)
+
+
+def test_concurrent_process_ingest_appends_once():
+    with tempfile.TemporaryDirectory() as directory:
+        raw_file, _, new_rows = _split_fixture(directory)
+        cache_dir = os.path.join(directory, "cache")
+        on_disk = len(pd.read_csv(raw_file))
+
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_ingest_in_process, args=(raw_file, cache_dir, new_rows))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert [worker.exitcode for worker in workers] == [0, 0, 0]
+        assert len(pd.read_csv(raw_file)) == on_disk + len(new_rows)
+
+
+if __name__ == "__main__":
+    test_ingest_matches_full_load()
+    test_replaced_source_is_reloaded()
+    test_concurrent_process_ingest_appends_once()
+    print("✅ Ingest test passed")
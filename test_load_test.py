@@ -0,0 +1,64 @@
+# test_load_test.py
+"""
+Checks the load-test harness in-process against a tiny app:
+status accounting, error rates and closed/open loop request counts.
+"""
+
+import asyncio
+import contextlib
+import io
+
+from fastapi import FastAPI, HTTPException
+
+from benchmarks.load_test import AsgiDriver, RequestMix, parse_mix, run_load_test
+
+app = FastAPI()
+started = []
+
+
+@app.on_event("startup")
+def startup():
+    started.append(True)
+
+
+@app.get("/health")
+def health():
+    return {"status": "ok"}
+
+
+@app.post("/pricing/suggest")
+async def suggest(payload: dict):
+    await asyncio.sleep(0.001)
+    if payload["product"] == "missing":
+        raise HTTPException(status_code=404, detail="No competitors")
+    if payload["product"] == "broken":
+        raise HTTPException(status_code=500, detail="Broken")
+    return {"product": payload["product"]}
+
+
+def test_closed_and_open_loop():
+    mix = RequestMix("api", parse_mix("predict=3,health=1", "api"), ["ok", "missing", "broken"], seed=1)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        stages = asyncio.run(run_load_test(
+            AsgiDriver(app), mix, concurrency_levels=[4], rates=[200.0], total_requests=120
+        ))
+
+    assert started
+    closed, open_ = stages
+    assert closed["mode"] == "closed" and closed["all"]["requests"] == 120
+    assert open_["mode"] == "open" and open_["all"]["requests"] == 120
+
+    for stage in stages:
+        predict = stage["endpoints"]["predict"]
+        codes = predict["status_codes"]
+        assert set(codes) == {"200", "404", "500"}
+        assert predict["errors"] == codes["500"]
+        assert predict["ok"] == codes["200"]
+        assert predict["p50_ms"] <= predict["p95_ms"] <= predict["p99_ms"] <= predict["max_ms"]
+        assert stage["endpoints"]["health"]["error_rate"] == 0.0
+
+
+if __name__ == "__main__":
+    test_closed_and_open_loop()
+    print("✅ Load test harness counts statuses and latencies")
@@ -0,0 +1,99 @@
+# test_metrics.py
+"""
+Checks the Prometheus metrics: exposition format of the registry and
+stage timings / outcomes / cache sources recorded by api_main predictions.
+"""
+
+import asyncio
+import io
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+import api_main
+from utils.dataset import FinancialDataset, set_dataset
+from utils.metrics import MetricsRegistry, StageTimer
+from utils.prediction_executor import PredictionExecutor
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def samples(text: str) -> dict:
+    """Exposition text → {series: value} (comments skipped)"""
+    series = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            series[name] = float(value)
+    return series
+
+
+def test_registry_format():
+    metrics = MetricsRegistry(prefix="t")
+    metrics.collect("cache_entries", "Entries", "gauge", lambda: 3)
+    metrics.collect("broken", "Raises on scrape", "gauge", lambda: 1 / 0)
+
+    for seconds in (0.0004, 0.003, 0.003, 20.0):
+        stages = StageTimer()
+        stages.seconds["filter"] = seconds
+        stages.count("rows_matched", 42)
+        metrics.record(stages, seconds=seconds)
+    metrics.predictions.inc('we"ird')
+
+    text = metrics.render()
+    series = samples(text)
+
+    assert "# TYPE t_stage_duration_seconds histogram" in text
+    assert series['t_stage_duration_seconds_bucket{stage="filter",le="0.0005"}'] == 1
+    assert series['t_stage_duration_seconds_bucket{stage="filter",le="0.005"}'] == 3
+    assert series['t_stage_duration_seconds_bucket{stage="filter",le="+Inf"}'] == 4
+    assert series['t_stage_duration_seconds_count{stage="filter"}'] == 4
+    assert abs(series['t_stage_duration_seconds_sum{stage="filter"}'] - 20.0064) < 1e-9
+    assert series['t_prediction_duration_seconds_count{source="computed"}'] == 4
+    assert series['t_last_prediction_rows{kind="rows_matched"}'] == 42
+    assert series['t_predictions_total{outcome="we\\"ird"}'] == 1
+    assert series["t_cache_entries"] == 3
+    assert "t_broken" not in text
+
+
+def test_prediction_metrics():
+    set_dataset(FinancialDataset(pd.read_csv(FIXTURE_FILE), FIXTURE_FILE))
+    api_main.result_cache.clear()
+
+    executor = api_main.executor
+    api_main.executor = PredictionExecutor(mode="thread", workers=2)
+
+    async def run():
+        for product in ("HIV ELISA Test Kits", "HIV ELISA Test Kits", "Zzz Unknown Widget"):
+            try:
+                await api_main.cached_pricing_prediction(product, 5)
+            except ValueError:
+                pass
+        return await api_main.prometheus_metrics()
+
+    try:
+        with redirect_stdout(io.StringIO()):
+            response = asyncio.run(run())
+    finally:
+        api_main.executor.shutdown()
+        api_main.executor = executor
+
+    assert response.media_type.startswith("text/plain; version=0.0.4")
+    series = samples(response.body.decode())
+
+    for stage in ("load", "filter", "aggregate", "band", "summary"):
+        assert series[f'pricing_stage_duration_seconds_count{{stage="{stage}"}}'] >= 1, stage
+
+    assert series['pricing_prediction_duration_seconds_count{source="computed"}'] >= 1
+    assert series['pricing_prediction_duration_seconds_count{source="cache"}'] >= 1
+    assert series['pricing_predictions_total{outcome="no_match"}'] >= 1
+    assert series['pricing_last_prediction_rows{kind="rows_matched"}'] > 0
+    assert series['pricing_last_prediction_rows{kind="sellers_aggregated"}'] > 0
+    assert series['pricing_result_cache_lookups_total{result="hit"}'] >= 1
+    assert series["pricing_dataset_rows"] > 0
+
+
+if __name__ == "__main__":
+    test_registry_format()
+    test_prediction_metrics()
+    print("✅ Metrics render in Prometheus format and record prediction stages")
@@ -0,0 +1,142 @@
+# test_prediction_executor.py
+"""
+Checks the prediction executor in thread mode: a full queue is
+rejected (503 + Retry-After from /api/v1/predict), dataset refreshes
+run off the event loop, and workers are
+recycled every workers x max_tasks_per_child predictions, without
+losing in-flight work.
+"""
+
+import asyncio
+import io
+import threading
+import time
+from contextlib import redirect_stdout
+
+import pandas as pd
+from fastapi import HTTPException
+
+import api_main
+from utils.dataset import FinancialDataset, set_dataset
+from utils.prediction_executor import ExecutorBusyError, PredictionExecutor
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def current_thread(delay: float = 0.0):
+    time.sleep(delay)
+    return threading.current_thread()
+
+
+async def wait_pending(executor, count: int):
+    while executor.stats()["pending"] < count:
+        await asyncio.sleep(0.001)
+
+
+def test_full_queue_rejected():
+    set_dataset(FinancialDataset(pd.read_csv(FIXTURE_FILE), FIXTURE_FILE))
+    api_main.result_cache.clear()
+
+    release = threading.Event()
+    measured = api_main.measured_pricing_prediction
+
+    def blocked_prediction(product, quantity, fuzzy=False):
+        release.wait(10)
+        return measured(product, quantity, fuzzy)
+
+    executor = api_main.executor
+    api_main.executor = PredictionExecutor(mode="thread", workers=1, max_queue_depth=1)
+    api_main.measured_pricing_prediction = blocked_prediction
+
+    async def run():
+        first = asyncio.ensure_future(api_main.cached_pricing_prediction("HIV ELISA Test Kits", 5))
+        await wait_pending(api_main.executor, 1)
+
+        try:
+            await api_main.executor.run(current_thread)
+            assert False, "expected ExecutorBusyError"
+        except ExecutorBusyError:
+            pass
+
+        try:
+            await api_main.predict_pricing(api_main.PricingRequest(product="HCV ELISA Test Kits", quantity=2))
+            assert False, "expected HTTPException"
+        except HTTPException as e:
+            busy = e
+
+        release.set()
+        return busy, await first
+
+    try:
+        with redirect_stdout(io.StringIO()):
+            busy, result = asyncio.run(run())
+        stats = api_main.executor.stats()
+    finally:
+        release.set()
+        api_main.executor.shutdown()
+        api_main.executor = executor
+        api_main.measured_pricing_prediction = measured
+        set_dataset(None)
+
+    assert busy.status_code == 503
+    assert busy.headers == {"Retry-After": "1"}
+    assert busy.detail["error"] == "Server Busy"
+
+    # The in-flight prediction still completes; rejections are counted
+    assert result["low_price"] <= result["high_price"]
+    assert (stats["rejected"], stats["completed"], stats["pending"]) == (2, 1, 0)
+
+
+def test_refresh_off_event_loop():
+    dataset = FinancialDataset(pd.read_csv(FIXTURE_FILE), FIXTURE_FILE)
+    set_dataset(dataset)
+
+    refresh_threads = []
+    dataset.refresh = lambda: refresh_threads.append(threading.current_thread()) or 0
+
+    async def versions():
+        unchanged = await api_main.current_dataset_version()
+        dataset.source.changed = lambda: True
+        changed = await api_main.current_dataset_version()
+        return unchanged, changed
+
+    try:
+        unchanged, changed = asyncio.run(versions())
+    finally:
+        set_dataset(None)
+
+    # Unchanged source → stat only; changed → refreshed in a worker thread
+    assert unchanged == changed == dataset.version
+    assert len(refresh_threads) == 1
+    assert refresh_threads[0] is not threading.main_thread()
+
+
+def test_workers_recycled():
+    executor = PredictionExecutor(mode="thread", workers=2, max_tasks_per_child=2)
+
+    async def run():
+        # Sequential: one pool per 4 predictions
+        threads = [await executor.run(current_thread) for _ in range(8)]
+
+        # Concurrent across a recycle: in-flight work finishes on the retiring pool
+        concurrent = await asyncio.gather(*[executor.run(current_thread, 0.01) for _ in range(6)])
+        return threads, concurrent
+
+    try:
+        threads, concurrent = asyncio.run(run())
+        stats = executor.stats()
+    finally:
+        executor.shutdown()
+
+    assert not set(threads[:4]) & set(threads[4:8])
+    assert len(set(threads[:4])) <= 2 and len(set(threads[4:8])) <= 2
+    assert len(concurrent) == 6
+    assert stats["recycled"] == 3
+    assert (stats["completed"], stats["pending"]) == (14, 0)
+
+
+if __name__ == "__main__":
+    test_full_queue_rejected()
+    test_refresh_off_event_loop()
+    test_workers_recycled()
+    print("✅ Executor rejects a full queue, refreshes off the loop and recycles workers")
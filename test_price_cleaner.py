@@ -0,0 +1,51 @@
+# test_price_cleaner.py
+"""
+Checks the vectorized clean_price_series against the scalar clean_price.
+Results must be bit-identical.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.price_cleaner import clean_price, clean_price_series
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+EDGE_CASES = [
+    "` 222047.64",
+    "₹1,23,456.78",
+    "INR 45000",
+    "  `  1132800.00  ",
+    "Rs. 99.5 only",
+    "I`NR 12",
+    "0.1234567890123456789",
+    "abc",
+    "",
+    None,
+    np.nan,
+    12.5,
+    3,
+]
+
+
+def assert_identical(values: pd.Series):
+    expected = values.apply(clean_price).astype("float64").to_numpy()
+    result = clean_price_series(values).to_numpy()
+    assert np.array_equal(expected, result, equal_nan=True)
+
+
+def test_fixture_prices_identical():
+    df = pd.read_csv(FIXTURE_FILE)
+    assert_identical(df["Total Price"])
+
+
+def test_edge_cases_identical():
+    assert_identical(pd.Series(EDGE_CASES, dtype=object))
+    assert_identical(pd.Series([1.5, np.nan, 2.0]))
+    assert_identical(pd.Series([], dtype=object))
+
+
+if __name__ == "__main__":
+    test_fixture_prices_identical()
+    test_edge_cases_identical()
+    print("✅ clean_price_series is bit-identical to clean_price")
@@ -0,0 +1,59 @@
+# test_product_fingerprint.py
+"""
+Checks the fingerprint memo cache (hit/miss counters in
+fingerprint_cache_info) and that the batch helpers give the same
+fingerprints as one fingerprint() call per name.
+"""
+
+import numpy as np
+import pandas as pd
+
+from filters.token_index import item_fingerprints_column, split_offered_items
+from processors.product_fingerprint import (
+    clear_fingerprint_cache,
+    fingerprint,
+    fingerprint_cache_info,
+    fingerprint_many
+)
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def test_memo_cache_counters():
+    clear_fingerprint_cache()
+    assert fingerprint_cache_info()["size"] == 0
+
+    first = fingerprint("MIRUS Ligation Clips (Poly-400)")
+    info = fingerprint_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (0, 1, 1)
+
+    # Same text → served from the cache, same result
+    assert fingerprint("MIRUS Ligation Clips (Poly-400)") == first == "CLIP LIGATION MIRU"
+    info = fingerprint_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (1, 1, 1)
+
+    # Empty / missing names never reach the cache
+    assert fingerprint(None) == fingerprint(" nan ") == fingerprint("") == ""
+    assert fingerprint_cache_info()["misses"] == 1
+    assert fingerprint_cache_info()["maxsize"] > 0
+
+    clear_fingerprint_cache()
+    assert fingerprint_cache_info()["size"] == 0
+
+
+def test_batch_matches_single_calls():
+    names = ["Test Kits", None, "test kits", "Test Kits", np.nan, "Syringes 10ml"]
+    assert fingerprint_many(names).tolist() == [fingerprint(name) for name in names]
+
+    offered = pd.read_csv(FIXTURE_FILE)["Offered Item"]
+    expected = [
+        "|".join(fp for fp in (fingerprint(item) for item in split_offered_items(value)) if fp)
+        for value in offered
+    ]
+    assert item_fingerprints_column(offered).tolist() == expected
+
+
+if __name__ == "__main__":
+    test_memo_cache_counters()
+    test_batch_matches_single_calls()
+    print("✅ Fingerprint memo cache and batch helpers")
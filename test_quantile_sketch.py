@@ -0,0 +1,75 @@
+# test_quantile_sketch.py
+"""
+Checks the sketch quantile error bound against exact quantiles,
+that merged sketches equal the sketch of all values, and the sketch
+mode of aggregate_sellers against the exact company_check table.
+"""
+
+import numpy as np
+import pandas as pd
+
+from processors.seller_aggregate import aggregate_sellers, merge_seller_prices, seller_partials
+from utils.price_cleaner import clean_price_series
+from utils.quantile_sketch import SKETCH_ACCURACY, grouped_sketch, merge_sketches, sketch_quantiles
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+# Float slack on top of the documented bound
+EPSILON = 1e-9
+
+
+def assert_within_bound(values: np.ndarray, estimate: float, q: float):
+    """estimate within ±accuracy of the exact (interpolated) quantile"""
+    exact = pd.Series(values).quantile(q)
+    assert abs(estimate - exact) <= SKETCH_ACCURACY * abs(exact) + EPSILON, (estimate, exact)
+
+
+def make_prices(seed: int = 11, n: int = 20000):
+    """Wide price range, zeros, and sellers with only a few prices"""
+    rng = np.random.default_rng(seed)
+    keys = rng.choice([f"Seller {i}" for i in range(60)], n)
+    keys[:12] = ["Seller 100"] * 2 + ["Seller 101"] * 3 + ["Seller 102"] * 7
+    values = np.round(rng.lognormal(11, 2.5, n), 2)
+    values[rng.random(n) < 0.05] = 0.0
+    return keys, values
+
+
+def test_error_bound():
+    keys, values = make_prices()
+    sketch = grouped_sketch(keys, values)
+
+    for q in (0.0, 0.05, 0.10, 0.5, 0.9, 1.0):
+        estimates = sketch_quantiles(sketch, q)
+        for key, group in pd.Series(values).groupby(keys):
+            assert_within_bound(group.to_numpy(), estimates[key], q)
+
+
+def test_merge_equals_whole():
+    keys, values = make_prices()
+    parts = [grouped_sketch(keys[i:i + 3000], values[i:i + 3000]) for i in range(0, len(values), 3000)]
+    pd.testing.assert_series_equal(merge_sketches(*parts), grouped_sketch(keys, values))
+
+
+def test_sketch_company_check():
+    df = pd.read_csv(FIXTURE_FILE)
+    exact = aggregate_sellers(df, quantile_mode="exact")
+    sketched = aggregate_sellers(df, quantile_mode="sketch")
+
+    for column in ["Seller Name", "bid_count", "least_price", "last_ranked_price"]:
+        pd.testing.assert_series_equal(exact[column], sketched[column])
+
+    prices = clean_price_series(df["Total Price"])
+    for _, row in sketched.iterrows():
+        seller_prices = prices[(df["Seller Name"] == row["Seller Name"]) & prices.notna()]
+        assert_within_bound(seller_prices.to_numpy(), row["average"], 0.10)
+
+    # Chunked sketches merge to the same table
+    halves = [seller_partials(part, "sketch")[1] for part in (df.iloc[:300], df.iloc[300:])]
+    pd.testing.assert_series_equal(merge_seller_prices(*halves), seller_partials(df, "sketch")[1])
+
+
+if __name__ == "__main__":
+    test_error_bound()
+    test_merge_equals_whole()
+    test_sketch_company_check()
+    print(f"✅ Sketch quantiles within ±{SKETCH_ACCURACY:.0%} of exact quantiles")
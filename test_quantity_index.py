@@ -0,0 +1,101 @@
+# test_quantity_index.py
+"""
+Checks QuantityIndex band lookups and quantity_context against a
+brute-force scan of the basic rows, also on real-format scraped prices,
+and that rows added in batches answer like an index built in one go.
+"""
+
+import numpy as np
+import pandas as pd
+
+from processors.seller_quantity_analysis import QuantityIndex, quantity_context
+from utils.price_cleaner import clean_price
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def make_frames(seed: int = 3):
+    rng = np.random.default_rng(seed)
+    bids = [f"GEM/2024/B/{i}" for i in range(300)]
+
+    basic_df = pd.DataFrame({
+        "bid_no": rng.choice(bids, 400),
+        "quantity": rng.choice(["12 nos", "5", "0", "abc", None, "150.5 units", "75"], 400)
+    })
+    filtered_df = pd.DataFrame({
+        "bid_no": rng.choice(bids, 1000),
+        "Total Price": rng.choice(["` 222047.64", "1200.50", "980", None, "NA"], 1000)
+    })
+    return basic_df, filtered_df
+
+
+def brute_force_count(basic_df, filtered_df, user_quantity):
+    quantities = basic_df["quantity"].astype(str).str.extract(r"(\d+\.?\d*)")[0].astype(float)
+    qty_df = pd.DataFrame({"bid_no": basic_df["bid_no"], "quantity": quantities})
+    qty_df = qty_df[(qty_df["quantity"] > 0) & qty_df["quantity"].between(user_quantity * 0.5, user_quantity * 1.5)]
+
+    # Row by row, with the scalar cleaner ("` 222047.64" is a price)
+    prices = filtered_df["Total Price"].map(clean_price)
+    price_bids = filtered_df.loc[prices.notna(), ["bid_no"]]
+
+    return len(qty_df.merge(price_bids, on="bid_no"))
+
+
+def test_band_lookups():
+    basic_df, filtered_df = make_frames()
+    index = QuantityIndex.from_basic_df(basic_df)
+
+    assert np.all(np.diff(index.quantities) >= 0)
+
+    for user_quantity in [1, 5, 10, 100, 150, 1000]:
+        lower, upper = index.band(user_quantity)
+        expected = int(((index.quantities >= lower) & (index.quantities <= upper)).sum())
+        assert index.count_in_band(user_quantity) == expected
+
+        context = quantity_context(index, filtered_df, user_quantity)
+        assert context["quantity_factor"] == 1.0
+        assert context["similar_quantity_count"] == brute_force_count(basic_df, filtered_df, user_quantity)
+
+
+def test_real_price_format_counted():
+    filtered_df = pd.read_csv(FIXTURE_FILE)
+    assert pd.to_numeric(filtered_df["Total Price"], errors="coerce").notna().sum() == 0
+
+    bids = filtered_df["bid_no"].drop_duplicates()
+    basic_df = pd.DataFrame({"bid_no": bids, "quantity": ["10 nos"] * len(bids)})
+    index = QuantityIndex.from_basic_df(basic_df)
+
+    count = quantity_context(index, filtered_df, 10)["similar_quantity_count"]
+    assert count > 0
+    assert count == brute_force_count(basic_df, filtered_df, 10)
+    assert quantity_context(index, filtered_df, 1000)["similar_quantity_count"] == 0
+
+
+def test_added_runs_match_full_build():
+    basic_df, filtered_df = make_frames(seed=5)
+    index = QuantityIndex.from_basic_df(basic_df.iloc[:200])
+
+    # Small batches stay separate runs until the merge threshold
+    for start in range(200, 400, 10):
+        index.add(basic_df["bid_no"].iloc[start:start + 10], basic_df["quantity"].iloc[start:start + 10])
+        if start == 200:
+            assert len(index._runs) == 2
+
+    full = QuantityIndex.from_basic_df(basic_df)
+    assert len(index) == len(full)
+    assert len(index._runs) <= QuantityIndex.MAX_RUNS
+
+    for user_quantity in [1, 5, 10, 100, 150, 1000]:
+        assert index.count_in_band(user_quantity) == full.count_in_band(user_quantity)
+        assert sorted(index.bids_in_band(user_quantity)) == sorted(full.bids_in_band(user_quantity))
+        assert quantity_context(index, filtered_df, user_quantity) == quantity_context(full, filtered_df, user_quantity)
+
+    np.testing.assert_array_equal(index.quantities, full.quantities)
+    assert len(index._runs) == 1
+
+
+if __name__ == "__main__":
+    test_band_lookups()
+    test_real_price_format_counted()
+    test_added_runs_match_full_build()
+    print("✅ Quantity index matches brute-force scan")
@@ -0,0 +1,97 @@
+# test_result_cache.py
+"""
+Checks the prediction result cache: normalized keys, LRU eviction,
+TTL expiry, and invalidation on a new dataset version or a changed
+basic CSV (quantity context).
+"""
+
+import asyncio
+import io
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+import api_main
+import utils.dataset
+from utils.dataset import FinancialDataset, set_dataset
+from utils.prediction_executor import PredictionExecutor
+from utils.result_cache import ResultCache, prediction_cache_key
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def test_normalized_keys():
+    assert prediction_cache_key("Ligation Clips", 5) == prediction_cache_key("clip ligation", 5)
+    assert prediction_cache_key("HIV ELISA Test Kits", 1) == prediction_cache_key("elisa hiv kit test", 1)
+    assert prediction_cache_key("Ligation Clips, Suture", 2) == prediction_cache_key("suture, clips ligation", 2)
+    assert prediction_cache_key("Ligation Clips", 5) != prediction_cache_key("Ligation Clips", 6)
+
+
+def test_lru_ttl_and_version():
+    cache = ResultCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", "v1", {"low_price": 1.0})
+    cache.put("b", "v1", {"low_price": 2.0})
+    assert cache.get("a", "v1") == {"low_price": 1.0}
+
+    cache.put("c", "v1", {"low_price": 3.0})   # evicts "b" (least recent)
+    assert cache.get("b", "v1") is None
+    assert cache.get("a", "v1") is not None
+
+    # Returned values are copies
+    cache.get("a", "v1")["low_price"] = 99.0
+    assert cache.get("a", "v1") == {"low_price": 1.0}
+
+    # Reloaded data → everything dropped
+    assert cache.get("a", "v2") is None
+    assert cache.stats()["size"] == 0
+
+    cache = ResultCache(max_entries=2, ttl_seconds=0.01)
+    cache.put("a", "v1", {"low_price": 1.0})
+    time.sleep(0.02)
+    assert cache.get("a", "v1") is None
+
+
+def test_basic_csv_change_invalidates():
+    financial = pd.read_csv(FIXTURE_FILE)
+    set_dataset(FinancialDataset(financial, FIXTURE_FILE))
+    api_main.result_cache.clear()
+
+    executor, basic_file = api_main.executor, api_main.BASIC_FILE
+    api_main.executor = PredictionExecutor(mode="thread", workers=1)
+
+    async def sources():
+        return [(await api_main.lookup_pricing_prediction("HIV ELISA Test Kits", 10))[1] for _ in range(2)]
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            api_main.BASIC_FILE = os.path.join(directory, "basic.csv")
+            bids = financial["bid_no"].drop_duplicates()
+            pd.DataFrame({"bid_no": bids.iloc[:5], "quantity": "10"}).to_csv(api_main.BASIC_FILE, index=False)
+
+            with redirect_stdout(io.StringIO()):
+                first = asyncio.run(sources())
+
+                # Same financial data, more tenders of a similar size
+                pd.DataFrame({"bid_no": bids.iloc[5:], "quantity": "10"}).to_csv(
+                    api_main.BASIC_FILE, mode="a", header=False, index=False
+                )
+                second = asyncio.run(sources())
+    finally:
+        api_main.executor.shutdown()
+        api_main.executor, api_main.BASIC_FILE = executor, basic_file
+        utils.dataset._quantity_index = None
+        set_dataset(None)
+
+    assert api_main.QUANTITY_CONTEXT
+    assert first == ["computed", "cache"]
+    assert second == ["computed", "cache"]
+
+
+if __name__ == "__main__":
+    test_normalized_keys()
+    test_lru_ttl_and_version()
+    test_basic_csv_change_invalidates()
+    print("✅ Result cache OK")
@@ -0,0 +1,103 @@
+# test_seller_aggregate.py
+"""
+Checks the fused aggregate_sellers kernel against the stage-by-stage
+seller processors (company_check.csv column-for-column, exact values).
+"""
+
+import numpy as np
+import pandas as pd
+
+from processors.seller_aggregate import (
+    aggregate_sellers,
+    final_prices,
+    finish_seller_table,
+    merge_seller_partials,
+    seller_partials
+)
+from processors.seller_average import compute_seller_average
+from processors.seller_final_price import add_final_price
+from processors.seller_inflation import add_inflation_rate
+from processors.seller_l1_price import add_last_ranked_price
+from processors.seller_least_price import add_least_price
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def staged_company_check(filtered_df: pd.DataFrame) -> pd.DataFrame:
+    company_df = compute_seller_average(filtered_df)
+    company_df = add_inflation_rate(company_df)
+    company_df = add_last_ranked_price(filtered_df, company_df)
+    company_df = add_least_price(filtered_df, company_df)
+    return add_final_price(company_df, 1.0)
+
+
+def assert_same_company_check(filtered_df: pd.DataFrame):
+    pd.testing.assert_frame_equal(
+        staged_company_check(filtered_df),
+        aggregate_sellers(filtered_df),
+        check_exact=True
+    )
+
+
+def test_fixture_identical():
+    assert_same_company_check(pd.read_csv(FIXTURE_FILE))
+
+
+def test_ranks_and_missing_values_identical():
+    rng = np.random.default_rng(7)
+    n = 2000
+    prices = rng.uniform(0, 1e6, n)
+
+    df = pd.DataFrame({
+        "S.No.": rng.choice([1.0, 2.0, np.nan], n),
+        "bid_no": rng.choice(["GEM/2024/B/1", "GEM/2024/B/2"], n),
+        "Seller Name": rng.choice([f"Seller {i}" for i in range(80)] + [None], n),
+        "Total Price": [f"` {p:.2f}" if p > 5e4 else "NA" for p in prices],
+        "Rank": rng.choice(["L1", " l2", "L3 ", "L20", "L21", "L01", "H1", None], n)
+    })
+
+    assert_same_company_check(df)
+    assert_same_company_check(df.iloc[0:0])
+
+
+def test_merged_chunk_partials_identical():
+    df = pd.read_csv(FIXTURE_FILE)
+
+    for chunk_rows in [7, 100]:
+        partial, price_parts = None, []
+        for start in range(0, len(df), chunk_rows):
+            chunk_partial, chunk_prices = seller_partials(df.iloc[start:start + chunk_rows])
+            partial = chunk_partial if partial is None else merge_seller_partials(partial, chunk_partial)
+            price_parts.append(chunk_prices)
+
+        pd.testing.assert_frame_equal(
+            aggregate_sellers(df),
+            finish_seller_table(partial, pd.concat(price_parts)),
+            check_exact=True
+        )
+
+
+def test_final_price_rounding_matches_staged():
+    # inflated 296769.385: Python round() → .39, np.round → .38
+    # (company_check rows are mixed-type, so add_final_price rounds Python floats)
+    company_df = pd.DataFrame({
+        "Seller Name": ["A", "B", "C"],
+        "average": [172390.0, 1000.0, 250.0],
+        "inflation_rate_percent": [72.15, -10.0, np.nan],
+        "least_price": [0.0, 950.0, 100.0]
+    })
+
+    staged = add_final_price(company_df, 1.0)["recommended_price"].tolist()
+    assert staged[0] == 296769.39
+    np.testing.assert_array_equal(
+        final_prices(company_df["average"], company_df["inflation_rate_percent"], company_df["least_price"]),
+        staged
+    )
+
+
+if __name__ == "__main__":
+    test_fixture_identical()
+    test_final_price_rounding_matches_staged()
+    test_ranks_and_missing_values_identical()
+    test_merged_chunk_partials_identical()
+    print("✅ Fused seller aggregation matches staged processors")
@@ -0,0 +1,115 @@
+# test_sharded_scan.py
+"""
+Checks that the sharded scan (rows split across shard processes,
+partial aggregates merged) gives exactly the single-process results,
+also after rows are appended and after the CSV is replaced.
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from processors.l1_pipeline import run_l1_pipeline
+from run_engine import run_pricing_engine
+from utils.dataset import FinancialDataset
+from utils.financial_cache import load_financial_frame, load_financial_snapshot
+from utils.shard_pool import ShardPool, load_snapshot_rows
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+QUERIES = ["HIV ELISA Test Kits", "HCV", "Dengue ELISA Test Kit, HBsAg Rapid Test Kits", "test"]
+
+
+def test_sharded_pipeline_identical():
+    directory = tempfile.mkdtemp()
+    raw_file = os.path.join(directory, "financial.csv")
+    shutil.copy(FIXTURE_FILE, raw_file)
+
+    pool = ShardPool(3, raw_file=raw_file, basic_file=os.path.join(directory, "basic.csv"), cache_dir=directory)
+    try:
+        with redirect_stdout(io.StringIO()):
+            dataset = FinancialDataset(load_financial_frame(raw_file, directory), raw_file)
+            assert sum(pool.start()) == len(dataset)
+
+            for query in QUERIES:
+                expected = run_l1_pipeline(dataset.filter(query), 1, with_quantity_context=False)
+                sharded = pool.run_pipeline(query, 1, with_quantity_context=False)
+
+                pd.testing.assert_frame_equal(expected["company_df"], sharded["company_df"], check_exact=True)
+                assert (expected["low_price"], expected["high_price"]) == (sharded["low_price"], sharded["high_price"])
+                assert sharded["rows_matched"] == len(dataset.filter(query))
+
+            try:
+                pool.run_pipeline("zzzz", 1)
+                assert False, "expected ValueError"
+            except ValueError:
+                pass
+
+            # Engine used by api/main.py in sharded mode
+            expected = run_l1_pipeline(dataset.filter(QUERIES[0]), 1, with_quantity_context=False)
+            result = run_pricing_engine(QUERIES[0], 1, shard_pool=pool)
+            assert (result["low_price"], result["high_price"]) == (expected["low_price"], expected["high_price"])
+            assert run_pricing_engine("zzzz", 1, shard_pool=pool) is None
+    finally:
+        pool.shutdown()
+        shutil.rmtree(directory)
+
+
+def _assert_same_rows(pool, dataset):
+    for query in QUERIES:
+        pd.testing.assert_frame_equal(
+            pool.filter(query),
+            dataset.filter(query).reset_index(drop=True),
+            check_dtype=False
+        )
+
+
+def test_shards_follow_appends_and_replacement():
+    directory = tempfile.mkdtemp()
+    raw_file = os.path.join(directory, "financial.csv")
+    rows = pd.read_csv(FIXTURE_FILE, dtype=str, keep_default_na=False)
+    rows.iloc[:400].to_csv(raw_file, index=False)
+
+    pool = ShardPool(2, raw_file=raw_file, basic_file=os.path.join(directory, "basic.csv"), cache_dir=directory)
+    try:
+        with redirect_stdout(io.StringIO()):
+            assert pool.start() == [200, 200]
+
+            # Appended after the snapshot: a late shard parses only the snapshot's bytes
+            _, offset, signature = load_financial_snapshot(raw_file, directory)
+            rows.iloc[400:500].to_csv(raw_file, mode="a", header=False, index=False)
+            assert len(load_snapshot_rows(raw_file, offset, signature, directory)) == 400
+
+            # ... and the last shard tails it
+            assert not pool.check_source()
+            _assert_same_rows(pool, FinancialDataset(load_financial_frame(raw_file, use_cache=False), raw_file))
+            assert pool.stats()["restarts"] == 0
+
+            # Replaced by a different export: every shard reloads
+            rows.iloc[200:].to_csv(raw_file + ".new", index=False)
+            os.replace(raw_file + ".new", raw_file)
+            assert pool.check_source()
+            assert pool.start() == [276, 276]
+            _assert_same_rows(pool, FinancialDataset(load_financial_frame(raw_file, use_cache=False), raw_file))
+    finally:
+        pool.shutdown()
+        shutil.rmtree(directory)
+
+
+def test_api_main_accepts_sharded_mode():
+    script = "import api.main as m; assert m.shard_pool is not None and m.executor.mode == 'thread'"
+    env = dict(os.environ, PRICING_EXECUTOR="sharded")
+    subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+
+if __name__ == "__main__":
+    test_sharded_pipeline_identical()
+    test_shards_follow_appends_and_replacement()
+    test_api_main_accepts_sharded_mode()
+    print("✅ Sharded scan matches the single-process pipeline")
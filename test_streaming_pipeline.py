@@ -0,0 +1,73 @@
+# test_streaming_pipeline.py
+"""
+Checks that the chunked pipeline (stream_run.py) gives the same seller
+table, band and similar-quantity count as run_l1_pipeline on the fully
+loaded file, for chunk sizes smaller and larger than a seller's rows.
+"""
+
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from benchmarks.synthetic import write_gem_csvs
+from processors.l1_pipeline import run_l1_pipeline
+from processors.seller_quantity_analysis import QuantityIndex
+from processors.streaming_pipeline import run_streaming_pipeline
+from utils.dataset import FinancialDataset
+from utils.financial_cache import iter_financial_chunks, load_financial_frame
+
+QUERIES = ["HIV ELISA Test Kits", "Ligation Clips", "Analyzer"]
+
+CHUNK_SIZES = [7, 150, 100_000]
+
+
+def test_streaming_matches_in_memory():
+    with tempfile.TemporaryDirectory() as directory:
+        raw_file = os.path.join(directory, "financial.csv")
+        basic_file = os.path.join(directory, "basic.csv")
+        write_gem_csvs(raw_file, basic_file, 1200, seed=21, products=120, sellers=30)
+
+        full = load_financial_frame(raw_file, use_cache=False)
+        dataset = FinancialDataset(full.copy())
+        quantity_index = QuantityIndex.from_csv(basic_file)
+
+        # Chunks concatenate back to the full parse
+        for chunk_rows in (7, 500):
+            chunks = list(iter_financial_chunks(raw_file, chunk_rows))
+            assert len(chunks) == -(-len(full) // chunk_rows)
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), full, check_dtype=False)
+
+        for query in QUERIES:
+            filtered = dataset.filter(query)
+            largest_seller = filtered["Seller Name"].value_counts().max()
+            assert largest_seller > CHUNK_SIZES[0]
+
+            with redirect_stdout(io.StringIO()):
+                expected = run_l1_pipeline(filtered, 10, quantity_index=quantity_index)
+
+            for chunk_rows in CHUNK_SIZES:
+                with redirect_stdout(io.StringIO()):
+                    streamed = run_streaming_pipeline(
+                        raw_file, query, 10, chunk_rows=chunk_rows, quantity_index=quantity_index
+                    )
+
+                pd.testing.assert_frame_equal(streamed["company_df"], expected["company_df"], check_exact=True)
+                assert (streamed["low_price"], streamed["high_price"]) == (expected["low_price"], expected["high_price"])
+                assert streamed["similar_quantity_count"] == expected["similar_quantity_count"] > 0
+                assert streamed["rows_matched"] == len(filtered)
+                assert streamed["rows_scanned"] == len(full)
+                assert streamed["chunks"] == -(-len(full) // chunk_rows)
+
+        try:
+            run_streaming_pipeline(raw_file, "zzzz widget", 1, chunk_rows=500, with_quantity_context=False)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_streaming_matches_in_memory()
+    print("✅ Streaming pipeline matches the in-memory pipeline")
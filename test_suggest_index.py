@@ -0,0 +1,90 @@
+# test_suggest_index.py
+"""
+Checks typeahead suggestions against a brute-force prefix scan,
+bid-volume ranking against the resident dataset, and that appended
+rows counted in incrementally give the same index as a rebuild.
+"""
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_financial
+from filters.suggest_index import SuggestIndex, query_prefixes
+from filters.token_index import split_offered_items
+from processors.product_fingerprint import fingerprint
+from utils.dataset import FinancialDataset
+from utils.financial_cache import prepare_financial_frame
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+
+def brute_force(index: SuggestIndex, query: str, limit: int) -> list:
+    prefixes = query_prefixes(query)
+    matches = [
+        product for product in index.products
+        if all(any(token.startswith(p) for token in fingerprint(product).split()) for p in prefixes)
+    ]
+    return matches[:limit]
+
+
+def test_prefix_of_any_word_against_brute_force():
+    rng = np.random.default_rng(3)
+    words = ["".join(rng.choice(list("ABCDEHIKLMNOPRSTUY"), rng.integers(4, 9))) for _ in range(300)]
+    products = [" ".join(rng.choice(words, rng.integers(1, 4))) for _ in range(2000)]
+    index = SuggestIndex(products, rng.integers(0, 500, len(products)).tolist())
+
+    for query in ["a", "KL", "ab c", "m n o", words[0][:3].lower(), "zzzz"]:
+        got = [s["product"] for s in index.suggest(query, 10)]
+        assert got == brute_force(index, query, 10)
+
+    counts = [s["bid_count"] for s in index.suggest("a", 50)]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_ranked_by_dataset_bid_volume():
+    df = prepare_financial_frame(pd.read_csv(FIXTURE_FILE))
+    dataset = FinancialDataset(df)
+
+    products = ["HIV ELISA Test Kit", "Dengue ELISA Test Kit", "Ligation Clip"]
+    index = SuggestIndex.from_dataset(dataset, products)
+
+    suggestions = index.suggest("elisa k")
+    assert {s["product"] for s in suggestions} == {"HIV ELISA Test Kit", "Dengue ELISA Test Kit"}
+    for s in suggestions:
+        assert s["bid_count"] == dataset.filter(s["product"])["bid_no"].nunique()
+        assert s["bid_count"] < len(dataset.filter(s["product"]))
+
+    assert index.suggest("clips") == index.suggest("lig")
+    assert index.suggest("the") == []
+
+
+def test_appended_rows_counted_incrementally():
+    df = prepare_financial_frame(synthetic_financial(4000, seed=5, products=120))
+    df.loc[df.sample(40, random_state=1).index, "bid_no"] = np.nan
+    products = sorted({item for offered in df["Offered Item"] for item in split_offered_items(offered)})
+
+    dataset = FinancialDataset(df.iloc[:2500].reset_index(drop=True))
+    index = SuggestIndex.from_dataset(dataset, products, version=1)
+
+    # Appended rows: new bids and more sellers of already counted bids
+    for start, stop in ((2500, 3200), (3200, 4000)):
+        dataset.append(df.iloc[start:stop])
+        index = index.updated(dataset, version=start)
+        rebuilt = SuggestIndex.from_dataset(dataset, products)
+
+        assert index.version == start
+        assert sum(index.bid_counts) > 0
+        assert (index.products, index.bid_counts) == (rebuilt.products, rebuilt.bid_counts)
+        for query in ("a", "kit", "test k"):
+            assert index.suggest(query, 50) == rebuilt.suggest(query, 50)
+
+    # Another dataset (e.g. reloaded) → no incremental update
+    assert index.updated(FinancialDataset(df)) is None
+    assert SuggestIndex(products, [1] * len(products)).updated(dataset) is None
+
+
+if __name__ == "__main__":
+    test_prefix_of_any_word_against_brute_force()
+    test_ranked_by_dataset_bid_volume()
+    test_appended_rows_counted_incrementally()
+    print("✅ Suggestions agree with brute-force prefix matching")
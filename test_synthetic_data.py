@@ -0,0 +1,86 @@
+# test_synthetic_data.py
+"""
+Checks the synthetic GeM generator: byte-identical output per seed,
+exact row counts, scraper-compatible columns/prices/quantities and
+skewed (Zipf) product and seller frequencies.
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+
+from benchmarks.synthetic import BENCHMARK_PRODUCT, synthetic_financial, write_gem_csvs
+from config.columns import FINANCIAL_COLUMNS
+from processors.seller_l1_price import MAX_RANK
+from processors.seller_quantity_analysis import load_basic_csv, numeric_quantity
+from utils.price_cleaner import clean_price_series
+
+
+def _write(tmp, name, rows, seed, **options):
+    financial_csv = os.path.join(tmp, name, "financial.csv")
+    basic_csv = os.path.join(tmp, name, "basic.csv")
+    return write_gem_csvs(financial_csv, basic_csv, rows, seed, **options)
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_same_seed_same_bytes():
+    with tempfile.TemporaryDirectory() as tmp:
+        a = _write(tmp, "a", 25_000, seed=7)
+        b = _write(tmp, "b", 25_000, seed=7)
+        c = _write(tmp, "c", 25_000, seed=8)
+
+        assert a["rows"] == b["rows"] == c["rows"] == 25_000
+        assert _read_bytes(a["financial_csv"]) == _read_bytes(b["financial_csv"])
+        assert _read_bytes(a["basic_csv"]) == _read_bytes(b["basic_csv"])
+        assert _read_bytes(a["financial_csv"]) != _read_bytes(c["financial_csv"])
+
+        # Existing files are never overwritten silently
+        try:
+            _write(tmp, "a", 100, seed=7)
+            assert False, "expected FileExistsError"
+        except FileExistsError:
+            pass
+        assert _write(tmp, "a", 100, seed=7, force=True)["rows"] == 100
+
+
+def test_scraper_compatible_rows():
+    with tempfile.TemporaryDirectory() as tmp:
+        summary = _write(tmp, "gem", 30_000, seed=0)
+        financial = pd.read_csv(summary["financial_csv"], dtype=str, keep_default_na=False)
+        basic = load_basic_csv(summary["basic_csv"])
+
+    assert list(financial.columns) == FINANCIAL_COLUMNS
+    assert len(financial) == 30_000
+    assert set(basic["bid_no"]) == set(financial["bid_no"])
+    assert len(basic) == summary["bids"]
+
+    ranks = set(financial["Rank"])
+    assert ranks <= {""} | {f"L{k}" for k in range(1, MAX_RANK + 1)}
+
+    parsed = clean_price_series(financial["Total Price"]).notna().mean()
+    assert 0.95 < parsed < 1.0
+
+    quantities = numeric_quantity(basic["quantity"])
+    assert 0.85 < (quantities > 0).mean() < 0.95
+
+
+def test_zipf_skew():
+    df = synthetic_financial(40_000, seed=1)
+
+    sellers = df["Seller Name"].value_counts()
+    assert sellers.iloc[0] > 20 * sellers.median()
+
+    first_items = df["Offered Item"].str.removeprefix("Item Categories : ").str.split(",").str[0]
+    assert first_items.value_counts().index[0] == BENCHMARK_PRODUCT
+
+
+if __name__ == "__main__":
+    test_same_seed_same_bytes()
+    test_scraper_compatible_rows()
+    test_zipf_skew()
+    print("✅ Synthetic GeM data is deterministic, scraper-shaped and skewed")
@@ -0,0 +1,67 @@
+# test_token_index.py
+"""
+Checks that the inverted token index returns exactly the same rows
+as the original row-by-row subset scan.
+"""
+
+import pandas as pd
+
+from filters.competitor_filter import filter_competitors, user_token_sets
+from filters.token_index import TokenIndex, split_offered_items
+from processors.product_fingerprint import fingerprint
+
+FIXTURE_FILE = "data/processed/filtered_company.csv"
+
+QUERIES = [
+    "HIV ELISA Test Kits",
+    "hiv elisa kit",
+    "HCV",
+    "Malaria Eliza Kit",
+    "Dengue ELISA Test Kit, HBsAg Rapid Test Kits",
+    "Ligation Clips",
+    "test",
+    "",
+]
+
+
+def scan_filter(df, user_input):
+    """Reference implementation: full iterrows scan"""
+    token_sets = user_token_sets(user_input)
+    if not token_sets:
+        return df.iloc[0:0]
+
+    matched = []
+    for idx, row in df.iterrows():
+        for item in split_offered_items(row.get("Offered Item", "")):
+            item_fp = fingerprint(item)
+            if not item_fp:
+                continue
+            item_tokens = set(item_fp.split())
+            if any(tokens.issubset(item_tokens) for tokens in token_sets):
+                matched.append(idx)
+                break
+
+    return df.loc[matched]
+
+
+def test_index_matches_scan():
+    df = pd.read_csv(FIXTURE_FILE)
+    index = TokenIndex.from_dataframe(df)
+
+    for query in QUERIES:
+        expected = scan_filter(df, query)
+        result = filter_competitors(df, query, index=index)
+        assert result.index.tolist() == expected.index.tolist(), query
+
+
+def test_index_built_on_demand():
+    df = pd.read_csv(FIXTURE_FILE)
+
+    result = filter_competitors(df, "HIV ELISA Test Kits")
+    assert result.index.tolist() == scan_filter(df, "HIV ELISA Test Kits").index.tolist()
+
+
+if __name__ == "__main__":
+    test_index_matches_scan()
+    test_index_built_on_demand()
+    print("✅ Token index matches full scan for all queries")
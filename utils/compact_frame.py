@@ -0,0 +1,77 @@
+# utils/compact_frame.py
+
+import numpy as np
+import pandas as pd
+
+# Repeated strings → dictionary-encoded (categorical) codes
+CATEGORICAL_COLUMNS = ["Seller Name", "bid_no", "Offered Item"]
+
+# "L1".."L20" → 1..20 (0 = missing / not an L-rank)
+RANK_NO_COLUMN = "rank_no"
+
+
+def rank_numbers(ranks: pd.Series) -> pd.Series:
+    """
+    Normalized rank text → small integer.
+    Only exact "L<n>" (after upper/strip) maps to n, so rank_no == i
+    is equivalent to the text check Rank == f"L{i}".
+    """
+    text = ranks.astype(str).str.upper().str.strip()
+    numbers = pd.to_numeric(
+        text.str.extract(r"^L([1-9]\d{0,2})$", expand=False),
+        errors="coerce"
+    )
+    numbers = numbers.where(numbers <= np.iinfo(np.int8).max, 0)
+
+    return numbers.fillna(0).astype(np.int8)
+
+
+def compact_financial_frame(df: pd.DataFrame, price_dtype: str = "float32"):
+    """
+    Compact in-memory representation of the financial table.
+
+    - Seller Name / bid_no / Offered Item → categorical codes
+    - Rank → rank_no (int8), text Rank kept as categorical
+    - clean_price → price_dtype (float32 halves the column;
+      pass "float64" to keep prices bit-identical)
+
+    RETURNS: (compact_df, report) where report lists bytes before/after
+    """
+    before = df.memory_usage(deep=True)
+    out = df.copy()
+
+    for column in CATEGORICAL_COLUMNS:
+        if column in out.columns:
+            out[column] = out[column].astype("category")
+
+    if "Rank" in out.columns:
+        out[RANK_NO_COLUMN] = rank_numbers(out["Rank"])
+        out["Rank"] = out["Rank"].astype("category")
+        out = out.drop(columns=["rank_norm"], errors="ignore")
+
+    if "clean_price" in out.columns:
+        out["clean_price"] = out["clean_price"].astype(price_dtype)
+
+    after = out.memory_usage(deep=True)
+
+    return out, memory_report(before, after)
+
+
+def memory_report(before: pd.Series, after: pd.Series) -> dict:
+    """Bytes per column before/after compaction"""
+    columns = {}
+    for column in sorted(set(before.index) | set(after.index)):
+        b = int(before.get(column, 0))
+        a = int(after.get(column, 0))
+        columns[column] = {"before": b, "after": a, "saved": b - a}
+
+    total_before = int(before.sum())
+    total_after = int(after.sum())
+
+    return {
+        "bytes_before": total_before,
+        "bytes_after": total_after,
+        "bytes_saved": total_before - total_after,
+        "saved_percent": round(100 * (total_before - total_after) / total_before, 1) if total_before else 0.0,
+        "columns": columns
+    }
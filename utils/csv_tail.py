@@ -0,0 +1,312 @@
+# utils/csv_tail.py
+
+import hashlib
+import io
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+from pandas.errors import ParserError, ParserWarning
+
+
+# Bytes hashed at each end of the already-read prefix (see prefix_signature)
+SIGNATURE_BYTES = 65536
+
+
+def file_stamp(path: str):
+    """(inode, size, mtime_ns) of a file, None when missing — one stat call"""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def prefix_signature(path: str, offset: int) -> str:
+    """
+    Identity of the first `offset` bytes of a file: inode + hash of their
+    first and last SIGNATURE_BYTES. Unchanged when rows are appended;
+    changes when the file is replaced or those bytes are rewritten.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    with open(path, "rb") as f:
+        digest.update(f"{os.fstat(f.fileno()).st_ino}:{offset}".encode())
+        digest.update(f.read(min(offset, SIGNATURE_BYTES)))
+        start = max(0, offset - SIGNATURE_BYTES)
+        f.seek(start)
+        digest.update(f.read(offset - start))
+
+    return digest.hexdigest()
+
+
+def read_stable(path: str, load, attempts: int = 3):
+    """
+    load(path) while the file does not change underneath it
+    (retried when it did). RETURNS: (result, bytes covered, prefix signature)
+    """
+    for _ in range(attempts):
+        before = file_stamp(path)
+        result = load(path)
+        signature = prefix_signature(path, before[1])
+        if file_stamp(path) == before:
+            break
+    return result, before[1], signature
+
+
+class CsvTail:
+    """
+    Read position in a CSV that normally only grows (scraper exports, ingest).
+
+    - changed(): one stat call, False until the file is touched
+    - is_append(): the bytes read so far are still the file's prefix
+      (False when the file was replaced, truncated or rewritten)
+    - read(): rows after the read position (complete lines), moves it forward
+    """
+
+    def __init__(self, path: str, offset: int, signature: str = None):
+        self.path = path
+        self.offset = offset
+        self.signature = signature if signature is not None else prefix_signature(path, offset)
+        self._stamp = file_stamp(path)
+
+    def changed(self) -> bool:
+        return file_stamp(self.path) != self._stamp
+
+    def is_append(self) -> bool:
+        stamp = file_stamp(self.path)
+        if stamp is None or stamp[1] < self.offset:
+            return False
+        return prefix_signature(self.path, self.offset) == self.signature
+
+    def mark_seen(self):
+        """Current file state is known (e.g. an append read elsewhere): changed() → False"""
+        self._stamp = file_stamp(self.path)
+
+    def read(self, **read_options):
+        """RETURNS: DataFrame of the appended rows, or None"""
+        stamp = file_stamp(self.path)
+        df, self.offset = read_csv_tail(self.path, self.offset, **read_options)
+        self.signature = prefix_signature(self.path, self.offset)
+        self._stamp = stamp
+        return df
+
+
+def read_csv_tail(path: str, offset: int, **read_options):
+    """
+    Rows appended to a CSV after byte offset (header taken from line 1).
+    Only complete lines are read.
+
+    RETURNS: (DataFrame or None, new offset)
+    """
+    size = os.path.getsize(path)
+    if size <= offset:
+        return None, offset
+
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read(size - offset)
+
+    complete = data.rfind(b"\n") + 1
+    if complete == 0:
+        return None, offset
+
+    # Parsed under the file's own header line → same field-count checks
+    # (malformed rows) as a full parse
+    with open(path, "rb") as f:
+        header = f.readline()
+
+    # A first row with more fields than the header would be read as an
+    # (implicit) index instead of being rejected like the later rows
+    body = data[:complete]
+    while body and _has_extra_fields(header, body[:body.find(b"\n") + 1], read_options):
+        _bad_first_line(read_options.get("on_bad_lines", "error"))
+        body = body[body.find(b"\n") + 1:]
+
+    df = pd.read_csv(io.BytesIO(header + body), **read_options)
+
+    return df, offset + complete
+
+
+def _has_extra_fields(header: bytes, line: bytes, read_options) -> bool:
+    try:
+        first = pd.read_csv(io.BytesIO(header + line), **read_options)
+    except ParserError:
+        return False    # e.g. a quoted field spanning lines: left to the full parse
+    return not isinstance(first.index, pd.RangeIndex)
+
+
+def _bad_first_line(on_bad_lines):
+    """Handles a malformed first tail row the way pandas handles the others"""
+    if on_bad_lines == "error":
+        raise ParserError("Malformed first row in appended CSV data (more fields than the header)")
+    if on_bad_lines == "warn":
+        warnings.warn("Skipping line 2: more fields than the header\n", ParserWarning)
+
+
+def read_skipping_bad_lines(read, **read_options):
+    """
+    read(on_bad_lines="warn", **read_options) with malformed rows
+    skipped AND counted (pandas reports each one as a ParserWarning line).
+
+    RETURNS: (result, rows skipped)
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ParserWarning)
+        result = read(on_bad_lines="warn", **read_options)
+
+    skipped = sum(
+        str(w.message).count("Skipping line")
+        for w in caught
+        if issubclass(w.category, ParserWarning)
+    )
+    return result, skipped
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of the next `remaining` bytes of an open file"""
+
+    def __init__(self, f, remaining: int):
+        self._f = f
+        self._remaining = remaining
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        view = memoryview(buffer)[:min(len(buffer), self._remaining)]
+        read = self._f.readinto(view) if len(view) else 0
+        self._remaining -= read
+        return read
+
+
+def complete_size(path: str) -> int:
+    """Bytes up to (and including) the last newline of the file"""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        while size > 0:
+            start = max(0, size - 65536)
+            f.seek(start)
+            block = f.read(size - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            size = start
+    return 0
+
+
+def iter_csv_chunks(path: str, offset: int, chunk_rows: int, **read_options):
+    """
+    Streams the rows after byte offset in chunks (offset 0 = first data row;
+    header taken from line 1). Only complete lines are read.
+
+    RETURNS: (chunk iterator, end offset to resume from)
+    """
+    with open(path, "rb") as f:
+        header_end = len(f.readline())
+
+    start = max(offset, header_end)
+    end = complete_size(path)
+
+    def chunks():
+        if end <= start:
+            return
+
+        header_options = {k: v for k, v in read_options.items() if k != "usecols"}
+        columns = pd.read_csv(path, nrows=0, **header_options).columns
+        with open(path, "rb") as f:
+            f.seek(start)
+            stream = io.BufferedReader(_ByteRange(f, end - start))
+            with pd.read_csv(
+                stream,
+                header=None,
+                names=columns,
+                chunksize=chunk_rows,
+                **read_options
+            ) as reader:
+                yield from reader
+
+    return chunks(), max(end, start)
+
+
+def append_csv_rows(path: str, rows: pd.DataFrame, encoding: str = "utf-8", **to_csv_options):
+    """
+    Appends rows to an existing CSV in the file's own column order
+    (header names compared stripped; missing columns are left empty).
+    """
+    header = pd.read_csv(path, nrows=0, encoding=encoding).columns
+    rows = rows.rename(columns=lambda c: str(c).strip())
+    rows = rows.reindex(columns=[c.strip() for c in header])
+
+    needs_newline = False
+    if os.path.getsize(path) > 0:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+
+    with open(path, "a", encoding=encoding, newline="") as f:
+        if needs_newline:
+            f.write("\n")
+        rows.to_csv(f, header=False, index=False, **to_csv_options)
+
+
+def parse_like_csv(rows: pd.DataFrame, to_csv_options: dict = None, **read_options) -> pd.DataFrame:
+    """
+    Rows as they will read back from the CSV (NA markers, number parsing),
+    so keys of incoming rows compare with keys of parsed history.
+    """
+    text = rows.to_csv(index=False, **(to_csv_options or {}))
+    read_options = {k: v for k, v in read_options.items() if k != "encoding"}
+    return pd.read_csv(io.StringIO(text), **read_options)
+
+
+def _normalized_text(values: pd.Series) -> pd.Series:
+    """Comparable text: stripped, numbers as float text, missing as "" """
+    text = values.astype(object).where(values.notna(), "").astype(str).str.strip()
+    numbers = pd.to_numeric(text, errors="coerce").astype("float64")
+    return text.where(numbers.isna(), numbers.astype(str))
+
+
+def row_keys(df: pd.DataFrame, columns) -> np.ndarray:
+    """
+    64-bit content hash per row over columns.
+    Rows parsed from CSV and rows sent as JSON text hash the same.
+    """
+    normalized = pd.DataFrame({
+        column: _normalized_text(df[column]) if column in df.columns else ""
+        for column in columns
+    }, index=df.index)
+
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+class RowDeduper:
+    """
+    Known row keys: a sorted array of the history + a set of appended keys.
+    new_mask() costs O(new rows x log history).
+    """
+
+    def __init__(self, keys: np.ndarray):
+        self._known = np.unique(keys)
+        self._added = set()
+
+    def __len__(self):
+        return len(self._known) + len(self._added)
+
+    def new_mask(self, keys: np.ndarray) -> np.ndarray:
+        """True for keys not seen before (first occurrence within keys)"""
+        positions = np.searchsorted(self._known, keys)
+        positions[positions == len(self._known)] = 0
+
+        known = (
+            self._known[positions] == keys
+            if len(self._known) else np.zeros(len(keys), dtype=bool)
+        )
+        added = np.fromiter((key in self._added for key in keys.tolist()), dtype=bool, count=len(keys))
+        repeated = pd.Series(keys).duplicated().to_numpy()
+
+        return ~(known | added | repeated)
+
+    def add(self, keys: np.ndarray):
+        self._added.update(keys.tolist())
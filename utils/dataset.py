@@ -0,0 +1,380 @@
+# utils/dataset.py
+
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from config.columns import FINANCIAL_COLUMNS, OFFERED_ITEM_COLUMN
+from filters.competitor_filter import user_token_sets
+from filters.token_index import ITEM_FINGERPRINTS_COLUMN, TokenIndex
+from processors.seller_aggregate import merge_seller_partials, seller_partials
+from processors.seller_quantity_analysis import QuantityIndex
+from utils.compact_frame import CATEGORICAL_COLUMNS, compact_financial_frame
+from utils.csv_tail import CsvTail, RowDeduper, read_skipping_bad_lines, row_keys
+from utils.financial_cache import CACHE_DIR, load_financial_snapshot, prepare_financial_frame
+from utils.price_cleaner import clean_price_series
+
+RAW_FILE = "data/raw/scraper_single_bid_results_financial.csv"
+BASIC_FILE = "data/raw/scraper_single_bid_results_basic.csv"
+
+# "0" skips the quantity context stage (neutral factor, no count)
+QUANTITY_CONTEXT = os.environ.get("PRICING_QUANTITY_CONTEXT", "1") != "0"
+
+# Compact ingest: categorical sellers/bids/items, int8 ranks, float32 prices
+COMPACT_DATASET = os.environ.get("PRICING_COMPACT_DATASET", "0") == "1"
+COMPACT_PRICE_DTYPE = os.environ.get("PRICING_COMPACT_PRICE_DTYPE", "float32")
+
+
+class FinancialDataset:
+    """
+    Financial bid results loaded ONCE per process.
+
+    - clean_price precomputed from "Total Price"
+    - Offered Item fingerprints precomputed in a TokenIndex
+    - Per-seller aggregates (bid_count, least price, best rank) kept current
+    - Shared READ-ONLY by every request (never mutate self.df)
+    - compact=True stores the table with dictionary-encoded strings,
+      integer ranks and float32 prices (see utils/compact_frame.py)
+
+    Rows appended to the source CSV are picked up by refresh() in
+    O(new rows): they are kept as extra parts (merged into one frame
+    once they outgrow a quarter of it) and added to the index.
+    A source that was replaced or rewritten (not appended to) is
+    reloaded in full (reload_on_replace=False: left to the owner).
+    """
+
+    MAX_PARTS = 16
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        source_file: str = None,
+        compact: bool = False,
+        source_offset: int = None,
+        source_signature: str = None,
+        reload_on_replace: bool = True,
+        cache_dir: str = CACHE_DIR
+    ):
+        self.compact = compact
+        self.source_file = source_file
+        self.reload_on_replace = reload_on_replace
+        self.cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._set_frame(df, source_offset, source_signature)
+
+    def _set_frame(self, df: pd.DataFrame, source_offset: int = None, source_signature: str = None):
+        """(Re)builds every derived structure from df"""
+        if "Total Price" in df.columns and "clean_price" not in df.columns:
+            df["clean_price"] = clean_price_series(df["Total Price"])
+
+        self.index = TokenIndex.from_dataframe(df)
+
+        # Cached item fingerprints live in the index now
+        if ITEM_FINGERPRINTS_COLUMN in df.columns:
+            df = df.drop(columns=[ITEM_FINGERPRINTS_COLUMN])
+
+        self.memory_report = None
+        if self.compact:
+            df, self.memory_report = compact_financial_frame(df, COMPACT_PRICE_DTYPE)
+            print(
+                f"🗜️  Compact dataset | {self.memory_report['bytes_saved']:,} bytes saved "
+                f"({self.memory_report['saved_percent']}%)"
+            )
+
+        self._parts = [df]
+        self._rows = len(df)
+        self._deduper = None
+
+        self.seller_stats = seller_partials(df)[0] if "Seller Name" in df.columns else None
+        self.source = None
+        if self.source_file and os.path.exists(self.source_file):
+            offset = source_offset if source_offset is not None else _source_size(self.source_file)
+            self.source = CsvTail(self.source_file, offset, source_signature)
+        self.version = source_version(self.source_file)
+        self.loaded_at = datetime.now().isoformat()
+        self.appended_rows = 0
+
+    def __len__(self):
+        return self._rows
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """The whole table as one frame"""
+        with self._lock:
+            if len(self._parts) > 1:
+                self._merge_parts()
+            return self._parts[0]
+
+    def filter(self, user_input: str) -> pd.DataFrame:
+        """Matched rows for user_input (a copy, safe to modify)"""
+        return self.filter_token_sets(user_token_sets(user_input))
+
+    def filter_token_sets(self, token_sets) -> pd.DataFrame:
+        """Matched rows for already fingerprinted products (see user_token_sets)"""
+        if not token_sets:
+            return self._parts[0].iloc[0:0]
+
+        with self._lock:
+            return self._take(self.index.match_positions(token_sets))
+
+    def match_positions(self, token_sets, start: int = 0) -> np.ndarray:
+        """Row positions (ascending, >= start) filter_token_sets would return"""
+        if not token_sets:
+            return np.empty(0, dtype=np.int64)
+
+        with self._lock:
+            return self.index.match_positions(token_sets, start)
+
+    def column_values(self, column: str, positions: np.ndarray) -> np.ndarray:
+        """Values of one column at row positions (no frame copy)"""
+        with self._lock:
+            return self._take(positions, [column])[column].to_numpy()
+
+    def fuzzy_token_sets(self, user_input: str):
+        """
+        Token sets of user_input with fuzzy fallbacks for products that
+        match nothing exactly. RETURNS: (token_sets, fuzzy_matches)
+        """
+        with self._lock:
+            return self.index.fuzzy_token_sets(user_token_sets(user_input))
+
+    def _take(self, positions: np.ndarray, columns: list = None) -> pd.DataFrame:
+        parts = self._parts if columns is None else [part[columns] for part in self._parts]
+        if len(parts) == 1:
+            return parts[0].iloc[positions]
+
+        pieces = []
+        start = 0
+        for part in parts:
+            stop = start + len(part)
+            inside = positions[(positions >= start) & (positions < stop)]
+            if len(inside):
+                pieces.append(part.iloc[inside - start])
+            start = stop
+
+        return pd.concat(pieces) if pieces else parts[0].iloc[0:0]
+
+    def _merge_parts(self):
+        merged = pd.concat(self._parts)
+        if self.compact:
+            for column in CATEGORICAL_COLUMNS + ["Rank"]:
+                if column in merged.columns:
+                    merged[column] = merged[column].astype("category")
+        self._parts = [merged]
+
+    def append(self, new_df: pd.DataFrame):
+        """
+        Appends parsed rows (derived columns included, see
+        prepare_financial_frame): index, seller aggregates, dedup state.
+        """
+        if new_df.empty:
+            return
+
+        with self._lock:
+            item_fingerprints = None
+            if ITEM_FINGERPRINTS_COLUMN in new_df.columns:
+                item_fingerprints = new_df[ITEM_FINGERPRINTS_COLUMN].tolist()
+                new_df = new_df.drop(columns=[ITEM_FINGERPRINTS_COLUMN])
+
+            offered = new_df[OFFERED_ITEM_COLUMN].tolist() if OFFERED_ITEM_COLUMN in new_df.columns else [""] * len(new_df)
+            self.index.add_rows(offered, item_fingerprints)
+
+            if self._deduper is not None:
+                self._deduper.add(row_keys(new_df, self.key_columns()))
+
+            if self.compact:
+                new_df, _ = compact_financial_frame(new_df, COMPACT_PRICE_DTYPE)
+
+            if self.seller_stats is not None:
+                self._update_seller_stats(new_df)
+
+            new_df.index = pd.RangeIndex(self._rows, self._rows + len(new_df))
+            self._parts.append(new_df)
+            self._rows += len(new_df)
+            self.appended_rows += len(new_df)
+
+            # Merge once the appended parts outgrow a quarter of the base
+            if len(self._parts) > self.MAX_PARTS or self._rows - len(self._parts[0]) > len(self._parts[0]) // 4:
+                self._merge_parts()
+
+    def _update_seller_stats(self, new_df: pd.DataFrame):
+        new_stats, _ = seller_partials(new_df)
+        touched = self.seller_stats.index.intersection(new_stats.index)
+        merged = merge_seller_partials(self.seller_stats.loc[touched], new_stats)
+        self.seller_stats = pd.concat([self.seller_stats.drop(touched), merged])
+
+    def refresh(self) -> int:
+        """
+        Reads rows appended to the source CSV since the last read, or
+        reloads it when it was replaced. Cheap when nothing changed
+        (one stat call). RETURNS: rows added (all rows after a reload)
+        """
+        if self.source is None or not self.source.changed():
+            return 0
+
+        with self._lock:
+            if not self.source.changed() or not os.path.exists(self.source_file):
+                return 0
+
+            if not self.source.is_append():
+                return self.reload() if self.reload_on_replace else 0
+
+            new_df, skipped = read_skipping_bad_lines(self.source.read)
+            if skipped:
+                print(f"⚠️ {skipped:,} malformed rows skipped in rows appended to {self.source_file}")
+            if new_df is None or new_df.empty:
+                return 0
+
+            self.append(prepare_financial_frame(new_df))
+            self.version = source_version(self.source_file)
+            return len(new_df)
+
+    def reload(self) -> int:
+        """Re-reads the whole source file (it was not purely appended to)"""
+        with self._lock:
+            start = time.perf_counter()
+            df, offset, signature = load_financial_snapshot(self.source_file, self.cache_dir)
+            self._set_frame(df, offset, signature)
+            print(f"🔄 Dataset reloaded (source replaced) | {len(self):,} rows in {time.perf_counter() - start:.2f}s")
+            return len(self)
+
+    def key_columns(self) -> list:
+        return [c for c in FINANCIAL_COLUMNS if c in self._parts[0].columns]
+
+    def row_deduper(self) -> RowDeduper:
+        """Content keys of every row (built on first ingest)"""
+        with self._lock:
+            if self._deduper is None:
+                self._deduper = RowDeduper(row_keys(self.df, self.key_columns()))
+            return self._deduper
+
+    def summary(self) -> dict:
+        return {
+            "rows": self._rows,
+            "appended_rows": self.appended_rows,
+            "sellers": len(self.seller_stats) if self.seller_stats is not None else 0,
+            "tokens": len(self.index.postings),
+            "top_tokens": self.index.top_tokens(),
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "source_file": self.source_file,
+            "memory_bytes": int(sum(part.memory_usage(deep=True).sum() for part in self._parts)),
+            "compact": self.memory_report is not None,
+            "bytes_saved": self.memory_report["bytes_saved"] if self.memory_report else 0
+        }
+
+
+def _source_size(path) -> int:
+    return os.path.getsize(path) if path and os.path.exists(path) else 0
+
+
+def source_version(path):
+    """File version stamp: size + mtime ("memory" without a file)"""
+    if not path or not os.path.exists(path):
+        return "memory"
+
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def load_dataset(
+    raw_file: str = RAW_FILE,
+    compact: bool = COMPACT_DATASET,
+    cache_dir: str = CACHE_DIR
+) -> FinancialDataset:
+    """Loads the financial data (columnar cache when fresh) and precomputes derived columns"""
+    start = time.perf_counter()
+    df, offset, signature = load_financial_snapshot(raw_file, cache_dir)
+    dataset = FinancialDataset(
+        df, raw_file, compact=compact, source_offset=offset, source_signature=signature, cache_dir=cache_dir
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ Dataset loaded | {len(dataset):,} rows in {elapsed:.2f}s")
+    return dataset
+
+
+# ===========================
+# Process-wide shared instance
+# ===========================
+
+_dataset = None
+_dataset_lock = threading.Lock()
+
+
+def get_dataset(raw_file: str = RAW_FILE) -> FinancialDataset:
+    """
+    Returns the shared dataset, loading it on first use.
+    Rows appended to the CSV since the last call are picked up first.
+    """
+    global _dataset
+
+    if _dataset is None:
+        with _dataset_lock:
+            if _dataset is None:
+                _dataset = load_dataset(raw_file)
+                return _dataset
+
+    _dataset.refresh()
+    return _dataset
+
+
+def set_dataset(dataset: FinancialDataset):
+    """Replaces the shared dataset (reload, tests)"""
+    global _dataset
+
+    with _dataset_lock:
+        _dataset = dataset
+
+
+def is_dataset_ready() -> bool:
+    return _dataset is not None
+
+
+def dataset_version(refresh: bool = True):
+    """
+    Current version stamp of the shared dataset (None until loaded).
+    refresh=False skips reading appended rows (no file I/O beyond a stat)
+    """
+    dataset = _dataset
+    if dataset is None:
+        return None
+
+    if refresh:
+        dataset.refresh()
+    return dataset.version
+
+
+def dataset_changed() -> bool:
+    """True when the shared dataset's source CSV changed since the last read (one stat)"""
+    dataset = _dataset
+    return dataset is not None and dataset.source is not None and dataset.source.changed()
+
+
+_quantity_index = None
+
+
+def get_quantity_index(basic_file: str = BASIC_FILE):
+    """
+    Returns the shared bid_no → quantity index, loading it on first use.
+    None while the basic CSV is missing (checked again on the next call).
+    """
+    global _quantity_index
+
+    if _quantity_index is None:
+        with _dataset_lock:
+            if _quantity_index is None and os.path.exists(basic_file):
+                start = time.perf_counter()
+                _quantity_index = QuantityIndex.from_csv(basic_file)
+                elapsed = time.perf_counter() - start
+                print(f"✅ Quantity index loaded | {len(_quantity_index):,} tenders in {elapsed:.2f}s")
+                return _quantity_index
+
+    if _quantity_index is not None:
+        _quantity_index.refresh()
+
+    return _quantity_index
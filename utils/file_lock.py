@@ -0,0 +1,33 @@
+# utils/file_lock.py
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Exclusive lock on <path>.lock shared by every process (uvicorn
+    workers, ingest_run.py). Blocks until the current holder releases it.
+    """
+    with open(path + ".lock", "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            # LK_LOCK retries for ~10 s, then raises OSError
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
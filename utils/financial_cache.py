@@ -0,0 +1,243 @@
+# utils/financial_cache.py
+
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+from config.columns import FINANCIAL_COLUMNS, OFFERED_ITEM_COLUMN
+from filters.token_index import ITEM_FINGERPRINTS_COLUMN, item_fingerprints_column
+from utils.csv_tail import read_stable
+from utils.price_cleaner import clean_price_series
+
+CACHE_DIR = "data/cache"
+CACHE_FORMAT_VERSION = 2  # bump when derived columns / fingerprint rules / meta change
+
+# Derived columns stored alongside the raw financial columns
+RANK_NORM_COLUMN = "rank_norm"
+DERIVED_COLUMNS = ["clean_price", RANK_NORM_COLUMN, ITEM_FINGERPRINTS_COLUMN]
+
+# Rows per chunk for streaming reads (peak memory ~ one chunk)
+CHUNK_ROWS = int(os.environ.get("PRICING_CHUNK_ROWS", 100_000))
+
+
+def _cache_paths(raw_file: str, cache_dir: str):
+    """<name>-<hash of the absolute path> → one cache per source file"""
+    name = os.path.splitext(os.path.basename(raw_file))[0]
+    path_hash = hashlib.sha256(os.path.abspath(raw_file).encode("utf-8")).hexdigest()[:12]
+    base = os.path.join(cache_dir, f"{name}-{path_hash}")
+    return base + ".parquet", base + ".meta.json"
+
+
+def _temp_path(path: str) -> str:
+    """Per-process temp name next to path (renamed into place when complete)"""
+    return f"{path}.{os.getpid()}.tmp"
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_stamp(raw_file: str, with_hash: bool = True) -> dict:
+    stat = os.stat(raw_file)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _file_sha256(raw_file) if with_hash else None
+    }
+
+
+def _read_meta(meta_file: str):
+    try:
+        with open(meta_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_file: str, meta: dict):
+    temp_file = _temp_path(meta_file)
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(temp_file, meta_file)
+
+
+def is_cache_fresh(raw_file: str, cache_dir: str = CACHE_DIR) -> bool:
+    """
+    Cache is fresh when the source CSV is unchanged:
+    - size + mtime match → fresh (no hashing)
+    - otherwise the content hash decides (e.g. file touched/copied)
+    """
+    cache_file, meta_file = _cache_paths(raw_file, cache_dir)
+    meta = _read_meta(meta_file)
+
+    if meta is None or not os.path.exists(cache_file):
+        return False
+    if meta.get("format_version") != CACHE_FORMAT_VERSION:
+        return False
+
+    stamp = _source_stamp(raw_file, with_hash=False)
+    if stamp["size"] != meta["source"]["size"]:
+        return False
+    if stamp["mtime_ns"] == meta["source"]["mtime_ns"]:
+        return True
+
+    if _file_sha256(raw_file) != meta["source"]["sha256"]:
+        return False
+
+    # Same content, new mtime → remember it to skip hashing next time
+    meta["source"]["mtime_ns"] = stamp["mtime_ns"]
+    _write_meta(meta_file, meta)
+    return True
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """clean_price, normalized Rank and per-row item fingerprints"""
+    if "Total Price" in df.columns:
+        df["clean_price"] = clean_price_series(df["Total Price"])
+
+    if "Rank" in df.columns:
+        df[RANK_NORM_COLUMN] = df["Rank"].astype(str).str.upper().str.strip()
+
+    if OFFERED_ITEM_COLUMN in df.columns:
+        df[ITEM_FINGERPRINTS_COLUMN] = item_fingerprints_column(df[OFFERED_ITEM_COLUMN])
+
+    return df
+
+
+def prepare_financial_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Parsed CSV rows → needed columns + derived columns"""
+    df.columns = df.columns.str.strip()
+    keep = [c for c in FINANCIAL_COLUMNS if c in df.columns]
+    return add_derived_columns(df[keep].copy())
+
+
+def parse_financial_csv(raw_file: str) -> pd.DataFrame:
+    """
+    Raw financial CSV → needed + derived columns.
+    A malformed row raises pandas.errors.ParserError (as the original
+    loader did) instead of silently dropping part of the history.
+    """
+    return prepare_financial_frame(pd.read_csv(raw_file, low_memory=False))
+
+
+def _parse_snapshot(raw_file: str):
+    """Parsed CSV + source stamp, taken while the file did not change"""
+    (df, stamp), offset, signature = read_stable(
+        raw_file, lambda path: (parse_financial_csv(path), _source_stamp(path))
+    )
+    return df, stamp, offset, signature
+
+
+def _build_snapshot(raw_file: str, cache_dir: str) -> tuple:
+    """
+    build_financial_cache + the CSV bytes the rows cover (offset, prefix signature).
+
+    Both files are written to temp names and renamed into place, so
+    concurrent readers see the old cache or the new one, never a partial file.
+    """
+    start = time.perf_counter()
+
+    df, stamp, offset, signature = _parse_snapshot(raw_file)
+
+    cache_file, meta_file = _cache_paths(raw_file, cache_dir)
+    temp_file = _temp_path(cache_file)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_parquet(temp_file, index=False)
+        os.replace(temp_file, cache_file)
+    except (ImportError, OSError) as e:
+        print(f"⚠️ Columnar cache not written ({e}) → using parsed CSV")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        return df, offset, signature
+
+    _write_meta(meta_file, {
+        "format_version": CACHE_FORMAT_VERSION,
+        "source_file": os.path.abspath(raw_file),
+        "source": stamp,
+        "offset": offset,
+        "signature": signature,
+        "rows": len(df),
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+    })
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ Columnar cache built | {len(df):,} rows in {elapsed:.2f}s → {cache_file}")
+
+    return df, offset, signature
+
+
+def build_financial_cache(raw_file: str, cache_dir: str = CACHE_DIR) -> pd.DataFrame:
+    """
+    Parses the raw financial CSV once and writes a Parquet cache
+    (needed columns + derived columns) with a source stamp.
+    """
+    return _build_snapshot(raw_file, cache_dir)[0]
+
+
+def load_financial_snapshot(
+    raw_file: str,
+    cache_dir: str = CACHE_DIR,
+    use_cache: bool = True
+) -> tuple:
+    """
+    load_financial_frame + the CSV bytes its rows cover.
+
+    RETURNS: (df, offset, signature) — rows after offset are new
+    (see CsvTail); a different prefix signature means the file was replaced
+    """
+    if not os.path.exists(raw_file):
+        raise FileNotFoundError(f"Financial data file not found: {raw_file}")
+
+    if not use_cache:
+        df, _, offset, signature = _parse_snapshot(raw_file)
+        return df, offset, signature
+
+    if is_cache_fresh(raw_file, cache_dir):
+        cache_file, meta_file = _cache_paths(raw_file, cache_dir)
+        meta = _read_meta(meta_file)
+        try:
+            return pd.read_parquet(cache_file), meta["offset"], meta["signature"]
+        except (ImportError, OSError, ValueError, KeyError, TypeError) as e:
+            # ValueError covers Arrow's invalid/truncated file errors
+            print(f"⚠️ Columnar cache unreadable ({e}) → rebuilding from CSV")
+
+    return _build_snapshot(raw_file, cache_dir)
+
+
+def load_financial_frame(
+    raw_file: str,
+    cache_dir: str = CACHE_DIR,
+    use_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Financial data for all entry points.
+
+    - Fresh cache → read Parquet (fast path)
+    - Stale/missing cache → parse CSV and rebuild the cache
+    - use_cache=False → CSV parse only (same columns, nothing written)
+    (without pyarrow the CSV is parsed every time, nothing is cached)
+    """
+    return load_financial_snapshot(raw_file, cache_dir, use_cache)[0]
+
+
+def iter_financial_chunks(raw_file: str, chunk_rows: int = CHUNK_ROWS):
+    """
+    Streams the raw financial CSV in chunks of chunk_rows rows
+    (needed + derived columns, same parsing as build_financial_cache).
+    For files too large to load at once; nothing is cached.
+    """
+    if not os.path.exists(raw_file):
+        raise FileNotFoundError(f"Financial data file not found: {raw_file}")
+
+    with pd.read_csv(raw_file, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            yield prepare_financial_frame(chunk)
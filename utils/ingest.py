@@ -0,0 +1,126 @@
+# utils/ingest.py
+
+import csv
+import threading
+
+import pandas as pd
+
+from config.columns import FINANCIAL_COLUMNS
+from processors.seller_quantity_analysis import (
+    SCRAPER_CSV_OPTIONS,
+    numeric_quantity,
+    basic_row_keys
+)
+from utils.csv_tail import append_csv_rows, parse_like_csv, row_keys
+from utils.dataset import BASIC_FILE, RAW_FILE, get_dataset, get_quantity_index
+from utils.file_lock import file_lock
+
+# Max rows per ingest call (API payload limit)
+MAX_INGEST_ROWS = 50_000
+
+# Basic CSV is written the way the scraper quotes it
+BASIC_CSV_WRITE_OPTIONS = dict(
+    quoting=csv.QUOTE_ALL,
+    escapechar=SCRAPER_CSV_OPTIONS["escapechar"]
+)
+
+# One writer at a time (dedup check + append must not interleave):
+# threads of this process, then every process via a lock file next to the CSV
+_ingest_lock = threading.Lock()
+
+
+def _clean_columns(rows) -> pd.DataFrame:
+    """DataFrame or list of row dicts → DataFrame with stripped column names"""
+    rows = pd.DataFrame(rows).copy()
+    rows.columns = [str(c).strip() for c in rows.columns]
+    return rows
+
+
+def ingest_financial_rows(rows, raw_file: str = RAW_FILE) -> dict:
+    """
+    Appends new financial rows to the raw CSV and the resident dataset.
+
+    - Rows already known (same content) or repeated in the batch are skipped
+    - The dataset reads back only the appended tail (index, seller
+      aggregates, dedup keys, version) — cost proportional to the new rows
+    """
+    rows = _clean_columns(rows)
+    if not any(c in rows.columns for c in FINANCIAL_COLUMNS):
+        raise ValueError(f"No financial columns in rows (expected some of {FINANCIAL_COLUMNS})")
+
+    with _ingest_lock, file_lock(raw_file):
+        dataset = get_dataset(raw_file)     # caught up with the file (incl. other workers' appends)
+        keys = row_keys(parse_like_csv(rows, on_bad_lines="skip"), dataset.key_columns())
+        new_rows = rows[dataset.row_deduper().new_mask(keys)]
+
+        if not new_rows.empty:
+            append_csv_rows(raw_file, new_rows)
+            dataset.refresh()
+
+    return {
+        "received": len(rows),
+        "duplicates": len(rows) - len(new_rows),
+        "appended": len(new_rows),
+        "dataset_version": dataset.version,
+        "rows": len(dataset),
+        "sellers": len(dataset.seller_stats) if dataset.seller_stats is not None else 0
+    }
+
+
+def ingest_basic_rows(rows, basic_file: str = BASIC_FILE) -> dict:
+    """
+    Appends new basic rows (bid_no, quantity, ...) to the basic CSV and
+    the resident quantity index. Duplicate (bid_no, quantity) pairs are skipped.
+    """
+    rows = _clean_columns(rows)
+    if "bid_no" not in rows.columns or "quantity" not in rows.columns:
+        raise ValueError("Basic rows need bid_no and quantity")
+
+    with _ingest_lock, file_lock(basic_file):
+        quantity_index = get_quantity_index(basic_file)
+        if quantity_index is None:
+            raise FileNotFoundError(f"Basic data file not found: {basic_file}")
+
+        parsed = parse_like_csv(rows, BASIC_CSV_WRITE_OPTIONS, **SCRAPER_CSV_OPTIONS)
+        keys = basic_row_keys(parsed["bid_no"].astype(str), numeric_quantity(parsed["quantity"]))
+        deduper = quantity_index.row_deduper()
+        new_mask = deduper.new_mask(keys)
+        new_rows = rows[new_mask]
+
+        if not new_rows.empty:
+            append_csv_rows(
+                basic_file,
+                new_rows,
+                encoding=SCRAPER_CSV_OPTIONS["encoding"],
+                **BASIC_CSV_WRITE_OPTIONS
+            )
+            quantity_index.refresh()
+            # Rows without a usable quantity are not indexed; remember them too
+            deduper.add(keys[new_mask])
+
+    return {
+        "received": len(rows),
+        "duplicates": len(rows) - len(new_rows),
+        "appended": len(new_rows),
+        "tenders_indexed": len(quantity_index)
+    }
+
+
+def ingest(
+    financial_rows=None,
+    basic_rows=None,
+    raw_file: str = RAW_FILE,
+    basic_file: str = BASIC_FILE
+) -> dict:
+    """
+    Financial and/or basic rows in one call (API + CLI entry point).
+    Rows: DataFrame or list of {column: value} dicts.
+    """
+    result = {}
+
+    if financial_rows is not None and len(financial_rows):
+        result["financial"] = ingest_financial_rows(financial_rows, raw_file)
+    if basic_rows is not None and len(basic_rows):
+        result["basic"] = ingest_basic_rows(basic_rows, basic_file)
+
+    return result
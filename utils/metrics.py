@@ -0,0 +1,224 @@
+# utils/metrics.py
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Latency histogram buckets (seconds) for pipeline stages and predictions
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class StageTimer:
+    """
+    Wall time per pipeline stage of ONE prediction, plus row counts.
+
+    Plain dicts only, so a worker process can return it with the
+    result and the API process records it (see MetricsRegistry.record).
+    """
+
+    def __init__(self):
+        self.seconds = {}   # stage -> seconds
+        self.counts = {}    # e.g. rows_matched, sellers_aggregated
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name: str, value: int):
+        self.counts[name] = int(value)
+
+
+def timed(stages: StageTimer, name: str):
+    """stages.stage(name), or a no-op when the caller does not measure"""
+    return stages.stage(name) if stages is not None else nullcontext()
+
+
+def _format_value(value) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class _Metric:
+    """One metric family: a value per label value (label=None → single series)"""
+
+    kind = None
+
+    def __init__(self, name: str, help_text: str, label: str = None):
+        self.name = name
+        self.help = help_text
+        self.label = label
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def _labels(self, key) -> dict:
+        return {self.label: key} if self.label else {}
+
+    def header(self) -> list:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, key=None, amount: float = 1):
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def lines(self) -> list:
+        with self._lock:
+            series = sorted(self._series.items(), key=lambda item: str(item[0]))
+        return [f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}" for key, value in series]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, key=None):
+        with self._lock:
+            self._series[key] = value
+
+
+class Histogram(_Metric):
+    """Cumulative buckets rendered on scrape; observe() is one bisect"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, label: str = None, buckets=STAGE_BUCKETS):
+        super().__init__(name, help_text, label)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, key=None):
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bisect.bisect_left(self.buckets, value)] += 1
+            series[1] += value
+
+    def lines(self) -> list:
+        with self._lock:
+            series = sorted(
+                ((key, list(counts), total) for key, (counts, total) in self._series.items()),
+                key=lambda item: str(item[0])
+            )
+
+        lines = []
+        for key, counts, total in series:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class _Collected(_Metric):
+    """Value(s) read from a callback at scrape time (no cost per request)"""
+
+    def __init__(self, name: str, help_text: str, kind: str, read, label: str = None):
+        super().__init__(name, help_text, label)
+        self.kind = kind
+        self.read = read
+
+    def lines(self) -> list:
+        try:
+            value = self.read()
+        except Exception:
+            return []
+        if value is None:
+            return []
+
+        series = value.items() if isinstance(value, dict) else [(None, value)]
+        return [
+            f"{self.name}{_format_labels(self._labels(key))} {_format_value(v)}"
+            for key, v in series if v is not None
+        ]
+
+
+class MetricsRegistry:
+    """
+    In-process Prometheus metrics (text exposition format).
+
+    - Pipeline stage latencies, predictions by source/outcome and the
+      rows/sellers of the last computed prediction are recorded per request
+    - Cache and executor counters are read from their stats() on scrape
+    - Rendering only happens when /metrics is scraped
+    """
+
+    def __init__(self, prefix: str = "pricing"):
+        self.prefix = prefix
+        self._metrics = []
+
+        self.stage_seconds = self.histogram(
+            "stage_duration_seconds", "Wall time of one pipeline stage of a computed prediction", "stage"
+        )
+        self.prediction_seconds = self.histogram(
+            "prediction_duration_seconds", "Prediction latency by source (band_table, cache, computed)", "source"
+        )
+        self.predictions = self.counter(
+            "predictions_total", "Predictions by outcome (ok, no_match, busy, error)", "outcome"
+        )
+        self.last_counts = self.gauge(
+            "last_prediction_rows", "Rows of the last computed prediction (rows_matched, sellers_aggregated)", "kind"
+        )
+
+    def _add(self, metric):
+        metric.name = f"{self.prefix}_{metric.name}"
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help_text: str, label: str = None) -> Counter:
+        return self._add(Counter(name, help_text, label))
+
+    def gauge(self, name: str, help_text: str, label: str = None) -> Gauge:
+        return self._add(Gauge(name, help_text, label))
+
+    def histogram(self, name: str, help_text: str, label: str = None, buckets=STAGE_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help_text, label, buckets))
+
+    def collect(self, name: str, help_text: str, kind: str, read, label: str = None):
+        """Registers read() → number or {label value: number}, called on scrape"""
+        return self._add(_Collected(name, help_text, kind, read, label))
+
+    def record(self, stages: StageTimer, source: str = "computed", seconds: float = None):
+        """Records one prediction's stage timings and row counts"""
+        for stage, stage_seconds in stages.seconds.items():
+            self.stage_seconds.observe(stage_seconds, stage)
+        for kind, value in stages.counts.items():
+            self.last_counts.set(value, kind)
+        if seconds is not None:
+            self.prediction_seconds.observe(seconds, source)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            series = metric.lines()
+            if series:
+                lines.extend(metric.header())
+                lines.extend(series)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,143 @@
+# utils/prediction_executor.py
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from utils.dataset import BASIC_FILE, QUANTITY_CONTEXT, RAW_FILE, get_dataset, get_quantity_index
+
+# Configuration (override with environment variables)
+EXECUTOR_MODE = os.environ.get("PRICING_EXECUTOR", "process")      # "process" | "thread"
+POOL_SIZE = int(os.environ.get("PRICING_POOL_SIZE", os.cpu_count() or 1))
+MAX_QUEUE_DEPTH = int(os.environ.get("PRICING_MAX_QUEUE", 64))
+MAX_TASKS_PER_CHILD = int(os.environ.get("PRICING_MAX_TASKS_PER_CHILD", 0)) or None
+
+
+class ExecutorBusyError(Exception):
+    """Raised when the prediction queue is full"""
+
+
+def warm_worker(raw_file, basic_file):
+    """
+    Process initializer: load the resident dataset (and quantity index)
+    once per worker. A missing file is reported by the prediction itself (→ 503).
+    """
+    try:
+        get_dataset(raw_file)
+    except FileNotFoundError:
+        pass
+
+    if QUANTITY_CONTEXT:
+        get_quantity_index(basic_file)
+
+
+class PredictionExecutor:
+    """
+    Runs blocking pandas predictions off the event loop.
+
+    - mode="process": ProcessPoolExecutor, uses all cores
+    - mode="thread": ThreadPoolExecutor (GIL-releasing work only)
+    - max_queue_depth: in-flight + queued predictions before rejecting
+    - max_tasks_per_child: recycle workers after ~N predictions each
+      (processes, or threads in thread mode)
+
+    Recycling replaces the whole pool once workers x N predictions have
+    completed; in-flight predictions finish on the retiring pool.
+    (ProcessPoolExecutor's own max_tasks_per_child deadlocks on Python 3.11.)
+    """
+
+    def __init__(
+        self,
+        mode: str = EXECUTOR_MODE,
+        workers: int = POOL_SIZE,
+        max_queue_depth: int = MAX_QUEUE_DEPTH,
+        max_tasks_per_child: int = MAX_TASKS_PER_CHILD,
+        raw_file: str = RAW_FILE,
+        basic_file: str = BASIC_FILE
+    ):
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unknown executor mode: {mode}")
+
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.max_queue_depth = max(1, max_queue_depth)
+        self.max_tasks_per_child = max_tasks_per_child
+        self.raw_file = raw_file
+        self.basic_file = basic_file
+
+        self._pool = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._recycled = 0
+        self._pool_tasks = 0
+
+    def start(self):
+        if self._pool is not None:
+            return
+
+        if self.mode == "process":
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=warm_worker,
+                initargs=(self.raw_file, self.basic_file)
+            )
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="prediction"
+            )
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, fn, *args):
+        """
+        Dispatches fn(*args) to the pool and awaits the result.
+        Raises ExecutorBusyError when max_queue_depth is reached.
+        """
+        if self._pending >= self.max_queue_depth:
+            self._rejected += 1
+            raise ExecutorBusyError(
+                f"Prediction queue full ({self.max_queue_depth} pending). Retry shortly."
+            )
+
+        self.start()
+        loop = asyncio.get_running_loop()
+
+        self._pending += 1
+        try:
+            result = await loop.run_in_executor(self._pool, fn, *args)
+            self._completed += 1
+            return result
+        finally:
+            self._pending -= 1
+            self._pool_tasks += 1
+            self._maybe_recycle()
+
+    def _maybe_recycle(self):
+        if not self.max_tasks_per_child:
+            return
+        if self._pool_tasks < self.max_tasks_per_child * self.workers:
+            return
+
+        retiring, self._pool = self._pool, None
+        self._pool_tasks = 0
+        self._recycled += 1
+
+        if retiring is not None:
+            retiring.shutdown(wait=False)
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "max_queue_depth": self.max_queue_depth,
+            "max_tasks_per_child": self.max_tasks_per_child,
+            "pending": self._pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "recycled": self._recycled
+        }
@@ -1,5 +1,6 @@
 # utils/price_cleaner.py
 
+import numpy as np
 import pandas as pd
 import re
 
@@ -22,3 +23,38 @@ def clean_price(value):
         return None
 
     return float(match.group())
+
+
+def clean_price_series(values: pd.Series) -> pd.Series:
+    """
+    Column-level clean_price: parses a whole "Total Price" column at once.
+
+    - Same backtick / ₹ / INR / comma handling as clean_price
+    - Each distinct price text is parsed once
+    - Returns float64 (NaN where clean_price returns None),
+      bit-identical to values.apply(clean_price)
+    """
+    codes, uniques = pd.factorize(values)
+
+    text = pd.Series(uniques, dtype=object)
+    if len(text):
+        text = text.map(str)
+
+    # Same replacement order as clean_price
+    # (strip() is skipped: it cannot change the first number found)
+    text = (
+        text.str.replace("`", "", regex=False)
+        .str.replace("₹", "", regex=False)
+        .str.replace("INR", "", regex=False)
+        .str.replace(",", "", regex=False)
+    )
+
+    numbers = text.str.extract(r"(\d+(?:\.\d+)?)", expand=False)
+
+    unique_prices = np.full(len(uniques) + 1, np.nan)  # last slot = missing
+    parsed = numbers.notna().to_numpy()
+
+    # float() per matched string keeps parsing identical to clean_price
+    unique_prices[:-1][parsed] = numbers[parsed].to_numpy(dtype=object).astype(np.float64)
+
+    return pd.Series(unique_prices[codes], index=values.index, dtype="float64")
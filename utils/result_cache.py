@@ -0,0 +1,109 @@
+# utils/result_cache.py
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from filters.competitor_filter import user_token_sets
+
+# Configuration (override with environment variables; size 0 disables)
+RESULT_CACHE_SIZE = int(os.environ.get("PRICING_CACHE_SIZE", 1024))
+RESULT_CACHE_TTL = float(os.environ.get("PRICING_CACHE_TTL", 600))
+
+
+def prediction_cache_key(product: str, quantity: int, fuzzy: bool = False) -> tuple:
+    """
+    Normalized query key: sorted fingerprint token sets + quantity
+    (+ "fuzzy" for fuzzy-mode requests).
+    "Ligation Clips" and "clip ligation" share a key, and so do
+    multi-product inputs listed in a different order.
+    """
+    token_sets = sorted({tuple(sorted(tokens)) for tokens in user_token_sets(product)})
+    if fuzzy:
+        return tuple(token_sets), quantity, "fuzzy"
+    return tuple(token_sets), quantity
+
+
+class ResultCache:
+    """
+    Thread-safe LRU + TTL cache of prediction results.
+
+    - Entries belong to ONE dataset version; a get/put with another
+      version (data reloaded) clears the cache
+    - Values are stored and returned as deep copies
+    """
+
+    def __init__(self, max_entries: int = RESULT_CACHE_SIZE, ttl_seconds: float = RESULT_CACHE_TTL):
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+
+        self._entries = OrderedDict()   # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._version = None
+
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _sync_version(self, version):
+        if version != self._version:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key, version):
+        """Cached value for key, or None (miss / expired / other version)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._sync_version(version)
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, key, version, value):
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._sync_version(version)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self._invalidations,
+                "dataset_version": self._version
+            }
@@ -0,0 +1,323 @@
+# utils/shard_pool.py
+
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from processors.l1_price_band import compute_l1_price_band
+from processors.seller_aggregate import (
+    QUANTILE_MODE,
+    finish_seller_table,
+    merge_seller_partials,
+    merge_seller_prices,
+    seller_partials
+)
+from filters.competitor_filter import user_token_sets
+from processors.seller_quantity_analysis import quantity_context
+from utils.dataset import (
+    BASIC_FILE,
+    COMPACT_DATASET,
+    RAW_FILE,
+    FinancialDataset,
+    get_quantity_index
+)
+from utils.csv_tail import CsvTail, prefix_signature
+from utils.financial_cache import CACHE_DIR, load_financial_snapshot, parse_financial_csv
+from utils.metrics import StageTimer, timed
+
+# Number of shard processes (each holds 1/N of the rows)
+SHARD_COUNT = int(os.environ.get("PRICING_SHARDS", os.cpu_count() or 1))
+
+
+def shard_bounds(rows: int, shards: int) -> np.ndarray:
+    """Row boundaries of contiguous, near-equal shards"""
+    return np.linspace(0, rows, shards + 1).astype(int)
+
+
+# ===========================
+# Shard worker (one process per shard)
+# ===========================
+
+_shard = None
+_basic_file = None
+
+
+def load_snapshot_rows(raw_file: str, offset: int, signature: str, cache_dir: str = CACHE_DIR) -> pd.DataFrame:
+    """
+    Financial rows of the first `offset` bytes of raw_file (the snapshot
+    the coordinator sized the shards from): the columnar cache when it
+    holds exactly that snapshot, else only that prefix of the CSV.
+
+    RAISES: RuntimeError when the file was replaced since the snapshot
+    """
+    df, cached_offset, cached_signature = load_financial_snapshot(raw_file, cache_dir)
+    if (cached_offset, cached_signature) == (offset, signature):
+        return df
+
+    # Rows were appended meanwhile: parse the snapshot's bytes only
+    if prefix_signature(raw_file, offset) != signature:
+        raise RuntimeError(f"{raw_file} was replaced while the shards were loading")
+
+    with open(raw_file, "rb") as f:
+        return parse_financial_csv(io.BytesIO(f.read(offset)))
+
+
+def load_shard(
+    raw_file: str,
+    basic_file: str,
+    start: int,
+    stop: int,
+    snapshot: tuple,
+    last: bool,
+    cache_dir: str = CACHE_DIR
+):
+    """
+    Process initializer: keeps rows [start, stop) of the coordinator's
+    snapshot (rows, offset, signature). The LAST shard also tails the
+    CSV from the snapshot's offset, so appended rows land after every
+    loaded row (row order = single-process order).
+    """
+    global _shard, _basic_file
+
+    rows, offset, signature = snapshot
+    df = load_snapshot_rows(raw_file, offset, signature, cache_dir)
+    if len(df) != rows:
+        raise RuntimeError(f"Shard snapshot has {len(df):,} rows, expected {rows:,}")
+
+    df = df.iloc[start:stop].reset_index(drop=True)
+
+    # A replaced source is handled by the coordinator (restarts every shard)
+    _shard = FinancialDataset(
+        df,
+        raw_file if last else None,
+        compact=COMPACT_DATASET,
+        source_offset=offset if last else None,
+        source_signature=signature if last else None,
+        reload_on_replace=False
+    )
+    _basic_file = basic_file
+
+
+def shard_rows() -> int:
+    return len(_shard)
+
+
+def shard_filter(token_sets):
+    """Matched rows of this shard"""
+    _shard.refresh()
+    return _shard.filter_token_sets(token_sets)
+
+
+def shard_partials(token_sets, user_quantity: int, with_quantity_context: bool, quantile_mode: str):
+    """
+    Matched rows of this shard → per-seller partial state (+ quantity
+    context count). RETURNS: dict, or None when nothing matched
+    """
+    matched = shard_filter(token_sets)
+    if matched.empty:
+        return None
+
+    partial, seller_prices = seller_partials(matched, quantile_mode)
+
+    similar_quantity_count = None
+    quantity_index = get_quantity_index(_basic_file) if with_quantity_context else None
+    if quantity_index is not None:
+        similar_quantity_count = quantity_context(quantity_index, matched, user_quantity)["similar_quantity_count"]
+
+    return {
+        "partial": partial,
+        "seller_prices": seller_prices,
+        "similar_quantity_count": similar_quantity_count,
+        "rows_matched": len(matched)
+    }
+
+
+# ===========================
+# Coordinator
+# ===========================
+
+class ShardPool:
+    """
+    Financial rows partitioned across long-lived worker processes.
+
+    Queries are scattered to every shard; shards return per-seller
+    partial aggregates (not rows) which are merged in shard order, so
+    results are identical to the single-process pipeline.
+
+    Shard bounds come from ONE snapshot taken by the coordinator.
+    Appended rows are tailed by the last shard; when the CSV is
+    replaced, every shard is restarted on a new snapshot.
+    """
+
+    def __init__(
+        self,
+        shards: int = SHARD_COUNT,
+        raw_file: str = RAW_FILE,
+        basic_file: str = BASIC_FILE,
+        cache_dir: str = CACHE_DIR
+    ):
+        self.shards = max(1, shards)
+        self.raw_file = raw_file
+        self.basic_file = basic_file
+        self.cache_dir = cache_dir
+
+        self._pools = []
+        self._queries = 0
+        self._restarts = 0
+        self._source = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> list:
+        """Starts one process per shard and waits until all are loaded. RETURNS: rows per shard"""
+        with self._start_lock:
+            if not self._pools:
+                self._start_pools()
+        return self.scatter(shard_rows)
+
+    def _start_pools(self):
+        df, offset, signature = load_financial_snapshot(self.raw_file, self.cache_dir)
+        snapshot = (len(df), offset, signature)
+        bounds = shard_bounds(len(df), self.shards)
+        del df
+
+        self._source = CsvTail(self.raw_file, offset, signature)
+        self._pools = [
+            ProcessPoolExecutor(
+                max_workers=1,
+                initializer=load_shard,
+                initargs=(
+                    self.raw_file,
+                    self.basic_file,
+                    int(bounds[shard]),
+                    int(bounds[shard + 1]),
+                    snapshot,
+                    shard == self.shards - 1,
+                    self.cache_dir
+                )
+            )
+            for shard in range(self.shards)
+        ]
+
+    def _stop_pools(self):
+        for pool in self._pools:
+            pool.shutdown(wait=True, cancel_futures=True)
+        self._pools = []
+
+    def check_source(self) -> bool:
+        """
+        Restarts every shard on a new snapshot when the CSV was replaced
+        or rewritten (appends are tailed by the last shard).
+        One stat call when nothing changed. RETURNS: True after a restart
+        """
+        if self._source is None or not self._source.changed():
+            return False
+
+        with self._start_lock:
+            if not self._pools or not self._source.changed():
+                return False
+            if self._source.is_append():
+                self._source.mark_seen()
+                return False
+
+            self._stop_pools()
+            self._start_pools()
+            self._restarts += 1
+            print(f"🔄 Shards restarted (source replaced): {self.raw_file}")
+            return True
+
+    def shutdown(self):
+        with self._start_lock:
+            self._stop_pools()
+
+    def scatter(self, fn, *args) -> list:
+        """fn(*args) on every shard; results in shard order"""
+        if not self._pools:
+            raise RuntimeError("Shard pool not started")
+
+        futures = [pool.submit(fn, *args) for pool in self._pools]
+        return [future.result() for future in futures]
+
+    def filter(self, user_input: str) -> pd.DataFrame:
+        """Matched rows from every shard, in row order (renumbered index)"""
+        self.check_source()
+        parts = self.scatter(shard_filter, user_token_sets(user_input))
+        return pd.concat(parts, ignore_index=True)
+
+    def run_pipeline(
+        self,
+        user_input: str,
+        user_quantity: int,
+        with_quantity_context: bool = True,
+        quantile_mode: str = QUANTILE_MODE,
+        token_sets=None,
+        stages: StageTimer = None
+    ) -> dict:
+        """
+        Sharded run_l1_pipeline: scatter → merge partials → finish → band.
+        token_sets (e.g. a fuzzy query) replaces user_input's own.
+        stages records the shard_scan / aggregate / band stage timings.
+
+        RETURNS: run_l1_pipeline's dict + rows_matched
+        RAISES: ValueError when no competitors match
+        """
+        self._queries += 1
+        self.check_source()
+        if token_sets is None:
+            token_sets = user_token_sets(user_input)
+
+        with timed(stages, "shard_scan"):
+            results = [
+                result for result in self.scatter(
+                    shard_partials, token_sets, user_quantity, with_quantity_context, quantile_mode
+                )
+                if result is not None
+            ]
+        if not results:
+            raise ValueError(f"No competitors found for product: {user_input}")
+
+        warnings = []
+        similar_quantity_count = None
+        if with_quantity_context:
+            counts = [result["similar_quantity_count"] for result in results]
+            if any(count is None for count in counts):
+                warnings.append(
+                    f"Quantity analysis failed: Basic data file not found: {self.basic_file}. "
+                    f"Using neutral factor."
+                )
+            else:
+                similar_quantity_count = sum(counts)
+
+        with timed(stages, "aggregate"):
+            partial = reduce(merge_seller_partials, [result["partial"] for result in results])
+            seller_prices = merge_seller_prices(*[result["seller_prices"] for result in results])
+            company_df = finish_seller_table(partial, seller_prices)
+        with timed(stages, "band"):
+            low_price, high_price = compute_l1_price_band(company_df)
+
+        rows_matched = sum(result["rows_matched"] for result in results)
+        if stages is not None:
+            stages.count("rows_matched", rows_matched)
+            stages.count("sellers_aggregated", len(company_df))
+
+        return {
+            "company_df": company_df,
+            "low_price": low_price,
+            "high_price": high_price,
+            "quantity_factor": 1.0,
+            "similar_quantity_count": similar_quantity_count,
+            "warnings": warnings,
+            "rows_matched": rows_matched
+        }
+
+    def stats(self) -> dict:
+        return {
+            "shards": self.shards,
+            "started": bool(self._pools),
+            "queries": self._queries,
+            "restarts": self._restarts
+        }